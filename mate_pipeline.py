@@ -11,6 +11,7 @@
 
 import re
 import csv
+import json
 import os
 import tempfile
 import hashlib
@@ -20,10 +21,17 @@ from pathlib import Path
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from pypdf import PdfReader
 
 # ---- 1) Regex Base ----
 RE_PAG = re.compile(r"\bP[ÁA]GINA\s+(\d{1,4})\b", re.IGNORECASE)
+# títulos dos extras cujas linhas "-" logo abaixo recebem "-" em E:I (os três numa busca só)
+RE_ALVOS = re.compile("|".join(map(re.escape, (
+    "REQUERIMENTOS DE COMISSÃO",
+    "LANÇAMENTOS DE TRAMITAÇÃO",
+    "CADASTRO DE E-MAILS",
+))))
 
 URL_BASE = "https://diariolegislativo.almg.gov.br"
 
@@ -126,22 +134,46 @@ NAO_EXPEDIENTE_POR_ANO = {
     2026: NAO_EXPEDIENTE_2026,
 }
 
-def proximo_dia_util(yyyymmdd: str) -> str:
+@lru_cache(maxsize=None)
+def _proximos_dias_uteis(ano: int) -> dict:
     """
-    Regra da ABA (trabalho):
-    - Se a data do Diário cair em sábado/domingo/feriado/recesso: avança até o próximo dia útil.
-    - Se cair em dia útil: retorna a mesma data.
+    yyyymmdd -> próximo dia útil (yyyymmdd) para todas as datas do ano.
+    Montada uma vez por ano, de 31/12 para trás; usa o calendário de não expediente do próprio ano
+    (também ao avançar para janeiro seguinte).
     """
-    d = datetime.strptime(yyyymmdd, "%Y%m%d").date()
-    nao_expediente = NAO_EXPEDIENTE_POR_ANO.get(d.year, set())
+    nao_expediente = NAO_EXPEDIENTE_POR_ANO.get(ano, set())
 
     def eh_util(x: date) -> bool:
         return (x.weekday() < 5) and (x not in nao_expediente)  # Mon=0..Fri=4
 
+    d = date(ano + 1, 1, 1)
     while not eh_util(d):
         d += timedelta(days=1)
+    prox = d.strftime("%Y%m%d")
+
+    tabela = {}
+    d = date(ano, 12, 31)
+    while d.year == ano:
+        chave = d.strftime("%Y%m%d")
+        if eh_util(d):
+            prox = chave
+        tabela[chave] = prox
+        d -= timedelta(days=1)
+    return tabela
+
 
-    return d.strftime("%Y%m%d")
+def proximo_dia_util(yyyymmdd: str) -> str:
+    """
+    Regra da ABA (trabalho):
+    - Se a data do Diário cair em sábado/domingo/feriado/recesso: avança até o próximo dia útil.
+    - Se cair em dia útil: retorna a mesma data.
+    """
+    if len(yyyymmdd) == 8 and yyyymmdd.isdigit():
+        prox = _proximos_dias_uteis(int(yyyymmdd[:4])).get(yyyymmdd)
+        if prox is not None:
+            return prox
+    d = datetime.strptime(yyyymmdd, "%Y%m%d").date()  # fora do formato exato: valida/normaliza como antes
+    return _proximos_dias_uteis(d.year)[d.strftime("%Y%m%d")]
 
 def normalizar_data(entrada: str) -> str:
     s_raw = "" if entrada is None else str(entrada)
@@ -232,13 +264,29 @@ def _parece_pdf(caminho: str) -> bool:
     except Exception:
         return False
 
-def baixar_pdf_por_url(url: str) -> str | None:
-    import requests
+_HTTP = None  # requests.Session reaproveitada entre downloads (mantém a conexão TLS com o servidor do Diário)
+
+
+def _http():
+    global _HTTP
+    if _HTTP is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        sessao = requests.Session()
+        # 429/5xx passageiros: até 3 novas tentativas com espera crescente; 404 (DL inexistente) volta na hora
+        sessao.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=Retry(
+            total=3, backoff_factor=1, status_forcelist=(429, 500, 502, 503, 504))))
+        _HTTP = sessao
+    return _HTTP
+
 
+def baixar_pdf_por_url(url: str) -> str | None:
     local = os.path.join(CACHE_DIR, "tmp_diario.pdf")
 
     try:
-        r = requests.get(url, timeout=30, allow_redirects=True)
+        r = _http().get(url, timeout=30, allow_redirects=True)
         r.raise_for_status()
 
         with open(local, "wb") as f:
@@ -275,6 +323,13 @@ def yyyymmdd_to_ddmmyyyy(yyyymmdd: str) -> str:
 
 import time, random
 import gspread
+from gspread.urls import SPREADSHEET_BATCH_UPDATE_URL, SPREADSHEET_VALUES_BATCH_UPDATE_URL
+
+# orjson é opcional: se estiver instalado, serializa o batchUpdate final bem mais rápido
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None
 
 def get_gspread_client(auth_mode: str, sa_info: dict | None = None):
  if auth_mode == "colab":
@@ -294,6 +349,1015 @@ def get_gspread_client(auth_mode: str, sa_info: dict | None = None):
 
  raise ValueError("auth_mode inválido")
 
+# ================================================================================================
+# ---- Textos fixos da aba (fórmulas e notas sem interpolação) ----
+# ================================================================================================
+
+# nota do ícone de telefone (rodapé, coluna B): ramais úteis
+NOTA_RAMAIS = "7776 ar-condicionado\n7870 gerência de saúde (- Marcos/Alberto)\n7710 informática\n7468 frequência (Milena)\n7786 polícia legislativa\n7885 plenário (Elton)"
+
+# nota de D8: prioridades de lançamento (manual, cap. 2-6)
+NOTA_PRIORIDADES = (
+    "CAPÍTULO 2-6, pág 19.\n\n"
+    "Prioridades de lançamento (o que devo lançar primeiro?)\n\n"
+    "1) PLs, PLCs, PREs e PECs novos\n"
+    "2) RQNs novos\n"
+    "3) Proposições não recebidas\n"
+    "4) RQNs aprovados\n"
+    "5) Todos os lançamentos que envolvam a implantação de um boletim novo em proposição anteriormente já implantada\n"
+    "6) Lançamentos que consistam não em acrescentar boletins, mas apenas em adicionar uma frase a um boletim já implantado (ex: \"Publicado no DL em...\")"
+)
+
+# manual do MATE (links de página da coluna S)
+URL_MANUAL_MATE = "http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf"
+
+# ---- Tabelas de consulta (aba oculta "_lk") ----
+# o idCom dos links da coluna A saía de escadas de IFS(LEFT(C;n)="...";"id";...) avaliadas em toda linha;
+# agora as tabelas ficam numa aba oculta e cada linha faz um XLOOKUP só
+ABA_LK = "_lk"  # layout só pode crescer (ver LK_COLUNAS_VALORES)
+
+# comissões com reunião (link "COMISSÃO ...") e requerimento (link "RQC: ...") — uma tabela só para os dois casos:
+# (artigo, nome, idCom) -> "COMISSÃO <artigo> <nome>" / "RQC: <nome>"
+COMISSOES_PERMANENTES = [
+    ("DE", "ADMINISTRAÇÃO PÚBLICA", "1"),
+    ("DE", "AGROPECUÁRIA E AGROINDÚSTRIA", "1075"),
+    ("DE", "ASSUNTOS MUNICIPAIS E REGIONALIZAÇÃO", "3"),
+    ("DE", "CONSTITUIÇÃO E JUSTIÇA", "5"),
+    ("DE", "CULTURA", "675"),
+    ("DE", "DEFESA DO CONSUMIDOR E DO CONTRIBUINTE", "489"),
+    ("DE", "DEFESA DOS DIREITOS DA MULHER", "1132"),
+    ("DE", "DEFESA DOS DIREITOS DA PESSOA COM DEFICIÊNCIA", "859"),
+    ("DE", "DESENVOLVIMENTO ECONÔMICO", "1077"),
+    ("DE", "DIREITOS HUMANOS", "8"),
+    ("DE", "EDUCAÇÃO, CIÊNCIA E TECNOLOGIA", "849"),
+    ("DE", "ESPORTE, LAZER E JUVENTUDE", "850"),
+    ("DE", "FISCALIZAÇÃO FINANCEIRA E ORÇAMENTÁRIA", "10"),
+    ("DE", "MEIO AMBIENTE E DESENVOLVIMENTO SUSTENTÁVEL", "799"),
+    ("DE", "MINAS E ENERGIA", "800"),
+    ("DE", "PARTICIPAÇÃO POPULAR", "585"),
+    ("DE", "PREVENÇÃO E COMBATE AO USO DE CRACK E OUTRAS DROGAS", "959"),
+    ("DE", "REDAÇÃO", "13"),
+    ("DE", "SAÚDE", "14"),
+    ("DE", "SEGURANÇA PÚBLICA", "508"),
+    ("DO", "TRABALHO, DA PREVIDÊNCIA E DA ASSISTÊNCIA SOCIAL", "1076"),
+    ("DE", "TRANSPORTE, COMUNICAÇÃO E OBRAS PÚBLICAS", "12"),
+]
+COMISSOES_EXTRAORDINARIAS = [
+    ("", "EXTRAORDINÁRIA DAS ENERGIAS RENOVÁVEIS E DOS RECURSOS HÍDRICOS", "1211"),
+    ("", "EXTRAORDINÁRIA DE ACOMPANHAMENTO DO ACORDO DE MARIANA", "1232"),
+    ("", "EXTRAORDINÁRIA DE DEFESA DA HABITAÇÃO E DA REFORMA URBANA", "1260"),
+    ("", "EXTRAORDINÁRIA DE PREVENÇÃO E ENFRENTAMENTO AO CÂNCER", "1258"),
+    ("", "EXTRAORDINÁRIA DE PROTEÇÃO AOS ANIMAIS", "1230"),
+    ("", "EXTRAORDINÁRIA DAS PRIVATIZAÇÕES", "1212"),
+    ("", "EXTRAORDINÁRIA DE TURISMO E GASTRONOMIA", "1261"),
+    ("", "EXTRAORDINÁRIA PRÓ-FERROVIAS MINEIRAS", "1217"),
+]
+
+
+def _nome_comissao(artigo: str, nome: str) -> str:
+    return f"COMISSÃO {artigo} {nome}" if artigo else f"COMISSÃO {nome}"
+
+
+# reunião de comissão: prefixo do texto de C -> idCom (vale o primeiro que casar)
+ID_COMISSAO = (
+    [(_nome_comissao(a, n), i) for a, n, i in COMISSOES_PERMANENTES]
+    + [("COMISSÃO DE ÉTICA", "578")]
+    + [(_nome_comissao(a, n), i) for a, n, i in COMISSOES_EXTRAORDINARIAS]
+    + [
+        ("GRANDE COMISSÃO", "10"),
+        ("COMISSÃO DE PROPOSTA DE EMENDA À CONSTITUIÇÃO 42 2024", "1279"),
+        ("COMISSÃO DE PROPOSTA DE EMENDA À CONSTITUIÇÃO 24 2023", "1280"),
+        ("COMISSÃO DE PROPOSTA DE EMENDA À CONSTITUIÇÃO 58 2025", "1281"),
+        ("COMISSÃO DE MEMBROS DAS COMISSÕES PERMANENTES", "10"),
+    ]
+    # daqui para baixo os prefixos só valem depois das reuniões conjuntas "PCD + SPU" / "CTU + DEC" (ver LK_ID_COMISSAO)
+    + [
+        ("REUNIÃO CONJUNTA", "1"),
+        ("CIPE", "811"),
+        ("COMISSÃO DE VETO 18 2025", "1265"),
+        ("COMISSÃO DE VETO 19 2025", "1264"),
+        ("COMISSÃO DE VETO 20 2025", "1267"),
+        ("COMISSÃO DE VETO 21 2025", "1262"),
+        ("COMISSÃO DE VETO 22 2025", "1266"),
+        ("COMISSÃO DE VETO 23 2025", "1263"),
+        ("COMISSÃO DE VETO 24 2025", "1270"),
+    ]
+)
+ID_COMISSAO_ANTES_SUFIXOS = next(i for i, (k, _) in enumerate(ID_COMISSAO) if k == "REUNIÃO CONJUNTA")
+
+# requerimento de comissão ("RQC: ...") -> idCom
+ID_RQC = (
+    [(f"RQC: {n}", i) for _, n, i in COMISSOES_PERMANENTES + COMISSOES_EXTRAORDINARIAS]
+    + [
+        ("RQC: PROPOSTA DE EMENDA À CONSTITUIÇÃO", "1234"),
+        ("RQC: MEMBROS DAS COMISSÕES PERMANENTES", "10"),
+        ("RQC: CIPE RIO DOCE", "811"),
+    ]
+)
+
+# audiência pública: sigla da comissão (C, posições 20 a 22) -> idCom
+ID_AUDIENCIA = [
+    ("APU", "1"),
+    ("AAG", "1075"),
+    ("AMR", "3"),
+    ("CJU", "5"),
+    ("CTU", "675"),
+    ("DCC", "489"),
+    ("DDM", "1132"),
+    ("DPD", "859"),
+    ("DEC", "1077"),
+    ("DHU", "8"),
+    ("ECT", "849"),
+    ("ELJ", "850"),
+    ("FFO", "10"),
+    ("MAD", "799"),
+    ("MEN", "800"),
+    ("PPO", "585"),
+    ("PCD", "959"),
+    ("RED", "13"),
+    ("SAU", "14"),
+    ("SPU", "508"),
+    ("TPA", "1076"),
+    ("TCO", "12"),
+]
+
+# começos de texto que levam ao link de reunião de comissão (fora os sufixos PERMANENTES/CONJUNTA)
+PREFIXOS_COMISSAO = ["COMISSÃO D", "COMISSÃO E", "GRANDE", "REUNIÃO", "CIPE"]
+
+# títulos de seção (coluna C) que não têm link na coluna P
+SECOES_SEM_LINK_P = [
+    "DIÁRIO DO EXECUTIVO", "DIÁRIO DO EXECUTIVO - EDIÇÃO EXTRA",
+    "DIÁRIO DO LEGISLATIVO", "DIÁRIO DO LEGISLATIVO - EDIÇÃO EXTRA",
+    "REUNIÕES DE PLENÁRIO", "REUNIÕES DE COMISSÕES", "REQUERIMENTOS DE COMISSÕES",
+    "LANÇAMENTOS DE TRAMITAÇÃO", "CADASTRO DE E-MAILS", "OFÍCIOS DA SECRETARIA-GERAL DA MESA",
+    "LANÇAMENTOS DE PRECLUSÃO DE PRAZO", "IMPLANTAÇÃO DE TEXTOS",
+]
+
+# sufixos dos requerimentos de comissão na coluna Q: (sufixo de C, código p/ "REQUERIMENTOS DE COMISSÕES: ...",
+# código p/ "RQC..."); a ordem vale (primeiro sufixo que casa), por isso "RECEBIDOS E APROVADOS" vem antes de "APROVADOS"
+SUFIXOS_RQC = [
+    ("RECEBIDOS E APROVADOS", "RQC3", "RQC13"),
+    ("APROVADOS", "RQC2", "RQC12"),
+    ("NÃO RECEBIDOS", "RQC130", "RQC130"),
+    ("RECEBIDOS", "RQC1", "RQC11"),
+    ("PREJUDICADOS", "RQC6", "RQC6"),
+    ("REJEITADOS", "RQC17", "RQC17"),
+    ("RELATÓRIO", "RQC18", "RQC18"),
+    ("RELATORIA", "RQC19", "RQC19"),
+    ("REITERADOS", "RQC23", "RQC23"),
+    ("RETIRADOS", "RQC26", "RQC26"),
+    ("EMENDADOS", "RQC25", "RQC28 // RQC29"),
+    ("ADIADOS", "RQC15", "RQC16"),
+]
+
+# requerimentos de comissão nas colunas R e S (texto "REQUERIMENTOS DE COMISSÃO: ..." ou "RQC..."):
+# sufixo -> (código R, página do manual em S); sem sufixo conhecido, S vai para a pág. 285
+SUFIXOS_RQC_R = [
+    ("RECEBIDOS", "5.2.1", 286),
+    ("VOTAÇÃO ADIADA", "5.2.2", 285),
+    ("APROVADOS", "5.2.3", 285),
+    ("EMENDADOS", "5.2.3.1", 291),
+    ("ADIADOS", "5.2.2", 301),
+    ("RETIRADOS", "5.2.4", 285),
+    ("PREJUDICADOS", "5.2.5", 283),
+    ("ARQUIVADOS", "5.2.6", 285),
+    ("REUNIÃO CONJUNTA", "5.2.7", 285),
+    ("RATIFICADOS", "5.2.8", 285),
+    ("ASSEMBLEIA FISCALIZA MAIS", "5.2.9", 285),
+    ("RELATÓRIO", "5.3", 294),
+    ("REITERADOS", "5.5", 296),
+    ("REJEITADOS", "5.6", 285),
+]
+
+# "APRESENTAÇÃO DE PROPOSIÇÕES: REQUERIMENTOS ...": sufixo -> (código Q, código R, página do manual em S);
+# sem sufixo conhecido vale a primeira linha (comissões temáticas)
+SUFIXOS_REQUERIMENTOS_APRESENTADOS = [
+    ("COMISSÕES TEMÁTICAS", "RQN27", "4.2.7-A", 197),
+    ("COM COMUNICAÇÃO", "RQN26", "4.2.7-B", 201),
+    ("SEM COMUNICAÇÃO", "RQN85", "4.2.7-C", 203),
+    ("ANEXADOS", "RQN40/RQN47", "4.2.7-D", 204),
+    ("CIDADANIA HONORÁRIA", "RQN88", "4.2.7-E", 206),
+    ("INDICAÇÃO TCE", "RQN??", "4.2.7-F", 207),
+    ("ASSEMBLEIA FISCALIZA MAIS", "RQN??", "4.2.7-G", 210),
+    ("FRENTE PARLAMENTAR", "RQN??", "4.2.7-H", 211),
+    ("INCLUSÃO EM ORDEM DO DIA", "RQN??", "4.2.7-I.1", 215),
+    ("RETIRADA DE TRAMITAÇÃO", "RQN80", "4.2.7-I.2", 215),
+    ("DESARQUIVAMENTO", "RQN26/RQN85", "4.2.7-I.3", 216),
+    ("DESANEXAÇÃO", "RQN??", "4.2.7-I.4", 218),
+    ("COMISSÃO SEGUINTE", "RQN??", "4.2.7-I.5", 220),
+    ("MAIS UMA COMISSÃO", "RQN??", "4.2.7-I.6", 221),
+    ("RECURSO", "RQN??", "4.2.7-I.7", 222),
+    ("PEDIDO DE INFORMAÇÕES", "RQN??", "4.2.7-I", 213),
+    ("PEDIDO DE PROVIDÊNCIAS", "RQN??", "4.2.7-I", 213),
+    ("PERDA DE PRAZO", "RQN??", "4.2.7-I", 213),
+    ("REUNIÃO ESPECIAL", "RQN80", "4.2.7-I", 213),
+    ("MESA DA ASSEMBLEIA, VOTADO EM PLENÁRIO", "RQN14", "4.2.7-J", 223),
+    ("MESA DA ASSEMBLEIA, ENCAMINHADOS PARA PROVIDÊNCIA INTERNA", "RQN92", "4.2.7-J", 223),
+    ("DESPACHO A DEPUTADO", "RQN??", "4.2.7-K.2.1", 226),
+    ("DESPACHO A SERVIDOR", "RQN??", "4.2.7-K.2.2", 227),
+    ("SETOR DA CASA", "RQO16", "4.2.7-K.2.3", 229),
+]
+
+# lançamentos de ofício, remessa e preclusão (texto exato de C) -> (código Q, código R, página do manual em S);
+# antes eram dezenas de ramos txt="..." no fim de cada IFS, testados um a um
+# (códigos como "8.10" e "11.1.1" só continuam texto porque a aba _lk é gravada como RAW)
+LANCAMENTOS_TEXTO_EXATO = [
+    ("PROPOSIÇÃO DE LEI ENCAMINHADA PARA SANÇÃO", "PL63", "8.8", 332),
+    ("REMESSA - PEDIDO DE INFORMAÇÃO", "RQN20", "8.6", 330),
+    ("REMESSA - REQUERIMENTO APROVADO", "RQN17", "8.5", 329),
+    ("OFÍCIO - PEDIDO DE INFORMAÇÃO", "RQN20", "8.6", 330),
+    ("OFÍCIO - REQUERIMENTO APROVADO", "RQN17", "8.5", 329),
+    ("OFÍCIO - VOTO DE CONGRATULAÇÕES", "RQN48", "8.3", 328),
+    ("OFÍCIO - MANIFESTAÇÃO DE APLAUSO", "RQN50", "8.1", 326),
+    ("OFÍCIO - MANIFESTAÇÃO DE APOIO", "RQN50", "8.1", 326),
+    ("OFÍCIO - MANIFESTAÇÃO DE REPÚDIO", "RQN50", "8.1", 326),
+    ("OFÍCIO - MANIFESTAÇÃO DE PROTESTO", "RQN50", "8.1", 326),
+    ("OFÍCIO - MANIFESTAÇÃO DE PESAR", "RQN49", "8.2", 327),
+    ("OFÍCIO COMUNICANDO MANUTENÇÃO TOTAL DO VETO", "PL93", "8.9", 333),
+    ("OFÍCIO COMUNICANDO REJEIÇÃO TOTAL DO VETO", "PL92", "8.10", 334),
+    ("OFÍCIO COMUNICANDO REJEIÇÃO PARCIAL DO VETO", "PL598", "8.11", 334),
+    ("OFÍCIO COMUNICANDO APROVAÇÃO DA INDICAÇÃO", "IND10", "8.11", 335),
+    ("OFÍCIO ENCAMINHADO AOS DESTINATÁRIOS POR E-MAIL", "RQN31", "8.12", 335),
+    ("PRECLUSÃO DE PRAZO: PROJETOS DE LEI", "PL66", "11.1.1", 403),
+    ("PRECLUSÃO DE PRAZO: REQUERIMENTOS, APROVADOS", "RQN16", "11.1.2-A", 404),
+    ("PRECLUSÃO DE PRAZO: REQUERIMENTOS, REJEITADOS", "RQN28", "11.1.2-B", 404),
+    ("PRECLUSÃO DE PRAZO: REQUERIMENTOS, RECURSO", "RQN87", "11.1.2-C", 404),
+    ("PRECLUSÃO DE PRAZO: INCONSTITUCIONALIDADE", "PL125", "11.2", 405),
+]
+
+# colunas da aba _lk, na ordem A, B, C, ...
+# ATENÇÃO: as abas já geradas apontam para esta aba por letra de coluna e nº de linhas fixos, e cada execução
+# a regrava. A tabela só pode crescer: colunas novas entram no FIM da lista e linhas novas no fim de cada coluna.
+# Inserir/reordenar colunas ou remover linhas quebra em silêncio as fórmulas A/P/Q/R/S das abas antigas —
+# nesse caso, mude ABA_LK para um nome novo ("_lk_v2", ...) e deixe a aba antiga como está.
+LK_COLUNAS_VALORES = [
+    [k for k, _ in ID_COMISSAO], [v for _, v in ID_COMISSAO],     # A:B
+    [k for k, _ in ID_RQC], [v for _, v in ID_RQC],               # C:D
+    [k for k, _ in ID_AUDIENCIA], [v for _, v in ID_AUDIENCIA],   # E:F
+    PREFIXOS_COMISSAO,                                            # G
+    SECOES_SEM_LINK_P,                                            # H
+    [s for s, _, _ in SUFIXOS_RQC],                               # I
+    [c for _, c, _ in SUFIXOS_RQC], [c for _, _, c in SUFIXOS_RQC],  # J:K
+    [s for s, *_ in SUFIXOS_REQUERIMENTOS_APRESENTADOS],          # L
+    [q for _, q, _, _ in SUFIXOS_REQUERIMENTOS_APRESENTADOS],     # M
+    [r for _, _, r, _ in SUFIXOS_REQUERIMENTOS_APRESENTADOS],     # N
+    [pg for *_, pg in SUFIXOS_REQUERIMENTOS_APRESENTADOS],        # O
+    [s for s, _, _ in SUFIXOS_RQC_R], [c for _, c, _ in SUFIXOS_RQC_R],  # P:Q
+    [t for t, *_ in LANCAMENTOS_TEXTO_EXATO],                     # R
+    [q for _, q, _, _ in LANCAMENTOS_TEXTO_EXATO],                # S
+    [r for _, _, r, _ in LANCAMENTOS_TEXTO_EXATO],                # T
+    [pg for *_, pg in LANCAMENTOS_TEXTO_EXATO],                   # U
+    [pg for *_, pg in SUFIXOS_RQC_R],                             # V (páginas de S para os sufixos de P)
+]
+LK_LINHAS = max(len(c) for c in LK_COLUNAS_VALORES)
+LK_COLUNAS = len(LK_COLUNAS_VALORES)
+LK_VALORES = [[c[i] if i < len(c) else "" for c in LK_COLUNAS_VALORES] for i in range(LK_LINHAS)]
+
+
+def _lk_faixa(col0: int) -> str:
+    letra = chr(ord("A") + col0)
+    return f"'{ABA_LK}'!${letra}$1:${letra}${len(LK_COLUNAS_VALORES[col0])}"
+
+
+def _lk_casa_prefixo(col0: int) -> str:
+    # vetor TRUE/FALSE: quais chaves da coluna col0 são prefixo de C (uma comparação vetorizada só)
+    chaves = _lk_faixa(col0)
+    return f"ARRAYFORMULA(LEFT(txt;LEN({chaves}))={chaves})"
+
+
+def _lk_casa_sufixo(col0: int) -> str:
+    # idem, para chaves que são sufixo de C
+    chaves = _lk_faixa(col0)
+    return f"ARRAYFORMULA(RIGHT(txt;LEN({chaves}))={chaves})"
+
+
+# as reuniões conjuntas "... PCD + SPU" / "... CTU + DEC" ficam no meio da tabela, como na antiga escada de IFS:
+# perdem para os prefixos até "COMISSÃO DE MEMBROS ..." e ganham de "REUNIÃO CONJUNTA", "CIPE" e das comissões de veto
+LK_ID_COMISSAO = (
+    f"LET(pos;MATCH(TRUE;{_lk_casa_prefixo(0)};0);IFS("
+    f"IFERROR(pos<={ID_COMISSAO_ANTES_SUFIXOS};FALSE);INDEX({_lk_faixa(1)};pos);"
+    'RIGHT(txt;9)="PCD + SPU";959;RIGHT(txt;9)="CTU + DEC";675;'
+    f"TRUE;INDEX({_lk_faixa(1)};pos)))"
+)
+LK_ID_RQC = f"XLOOKUP(TRUE;{_lk_casa_prefixo(2)};{_lk_faixa(3)})"
+LK_ID_AUDIENCIA = f"XLOOKUP(MID(txt;20;3);{_lk_faixa(4)};{_lk_faixa(5)})"
+LK_EH_COMISSAO = f"ISNUMBER(MATCH(TRUE;{_lk_casa_prefixo(6)};0))"
+LK_SEM_LINK_P = f"COUNTIF({_lk_faixa(7)};c)>0"
+# sem sufixo conhecido, RQC3/RQC13 (o antigo ramo final da escada de IFS)
+LK_COD_REQ_COMISSOES = f'XLOOKUP(TRUE;{_lk_casa_sufixo(8)};{_lk_faixa(9)};"RQC3")'
+LK_COD_RQC = f'XLOOKUP(TRUE;{_lk_casa_sufixo(8)};{_lk_faixa(10)};"RQC13")'
+LK_COD_REQ_COMISSAO_R = f'XLOOKUP(TRUE;{_lk_casa_sufixo(15)};{_lk_faixa(16)};"5.2.3")'
+LK_COD_RQC_R = f'XLOOKUP(TRUE;{_lk_casa_sufixo(15)};{_lk_faixa(16)};"5.2")'
+LK_PAG_RQC_S = f"XLOOKUP(TRUE;{_lk_casa_sufixo(15)};{_lk_faixa(21)};285)"
+_REQ_APRESENTADOS = _lk_casa_sufixo(11)
+LK_REQ_APRESENTADOS_Q = f'XLOOKUP(TRUE;{_REQ_APRESENTADOS};{_lk_faixa(12)};"RQN27")'
+LK_REQ_APRESENTADOS_R = f'XLOOKUP(TRUE;{_REQ_APRESENTADOS};{_lk_faixa(13)};"4.2.7-A")'
+LK_PAG_REQ_APRESENTADOS_S = f"XLOOKUP(TRUE;{_REQ_APRESENTADOS};{_lk_faixa(14)};197)"
+# sem texto conhecido fica #N/A, como no fim da antiga escada de IFS
+LK_LANCAMENTOS_Q = f"XLOOKUP(txt;{_lk_faixa(17)};{_lk_faixa(18)})"
+LK_LANCAMENTOS_R = f"XLOOKUP(txt;{_lk_faixa(17)};{_lk_faixa(19)})"
+LK_PAG_LANCAMENTOS_S = f"XLOOKUP(txt;{_lk_faixa(17)};{_lk_faixa(20)})"
+
+# coluna S: os ramos devolvem só o número da página do manual e o link é montado uma vez, no fim
+# (texto como "" e "-" passa direto)
+LINK_PAG_MANUAL_S = f'IF(ISNUMBER(pg);HYPERLINK("{URL_MANUAL_MATE}#page="&pg;"PÁG "&pg);pg)'
+
+# Z1:Z5 (coluna oculta): partes da data de A5/B6, calculadas uma vez por aba em vez de em toda linha da coluna A
+FORMULAS_DATA_AUX = [
+    '=DAY($A$5)',    # Z1: dia de A5 (A5 é DATE(), não texto), sem zero à esquerda
+    '=MONTH($A$5)',  # Z2: mês de A5, sem zero à esquerda
+    '=RIGHT($B$6;4)',  # Z3: ano (yyyy)
+    '=MID($B$6;4;2)',  # Z4: mês (mm)
+    '=LEFT($B$6;2)',   # Z5: dia (dd)
+]
+
+# AA6:AA (coluna oculta): tipo de link da linha, classificado uma vez só e lido pela coluna A
+# 4 = reunião de Plenário, 1 = reunião de comissão, 2 = RQC, 3 = audiência pública, 0 = demais
+FORMULA_CLASSE_LINHA = '''=LET(txt;C6;IFS(
+    OR(LEFT(txt;9)="ORDINÁRIA";LEFT(txt;14)="EXTRAORDINÁRIA";LEFT(txt;8)="ESPECIAL";LEFT(txt;14)="SOLENE");4;
+    OR(''' + LK_EH_COMISSAO + ''';RIGHT(txt;11)="PERMANENTES";RIGHT(txt;8)="CONJUNTA");1;
+    LEFT(txt;5)="RQC: ";2;
+    LEFT(txt;19)="AUDIÊNCIA PÚBLICA: ";3;
+    TRUE;0))'''
+
+# AB6:AB (coluna oculta): idTipo do link de comissão/RQC/audiência, calculado uma vez por linha a partir do
+# tipo em AA (SWITCH) — a coluna A só concatena $AB6
+# (na audiência o texto começa com "AUDIÊNCIA PÚBLICA: " e as siglas de ID_AUDIENCIA são todas de comissões
+# permanentes, idTipo 1: só os sufixos podem mudar o tipo)
+FORMULA_ID_TIPO = '''=LET(txt;C6;SWITCH($AA6;
+    1;IFS(
+        OR(RIGHT(txt;11)="GASTRONOMIA";RIGHT(txt;6)="URBANA");"2";
+        OR(MID(txt;10;14)="EXTRAORDINÁRIA";MID(txt;13;5)="ÉTICA";RIGHT(txt;8)="ESPECIAL");"5";
+        OR(RIGHT(txt;14)="EXTRAORDINÁRIA";MID(txt;13;8)="PROPOSTA";RIGHT(txt;7)="ANIMAIS";RIGHT(txt;6)="CÂNCER";RIGHT(txt;7)="MARIANA");"2";
+        OR(LEFT(txt;6)="GRANDE";LEFT(txt;7)="REUNIÃO";RIGHT(txt;11)="PERMANENTES";RIGHT(txt;8)="CONJUNTA");"3";
+        RIGHT(txt;14)="REFORMA URBANA";"1";
+        RIGHT(txt;8)="REGIONAL";"6";
+        LEFT(txt;4)="CIPE";"7";
+        TRUE;"1");
+    2;IFS(
+        OR(RIGHT(txt;11)="GASTRONOMIA";RIGHT(txt;6)="URBANA");"2";
+        OR(RIGHT(txt;14)="EXTRAORDINÁRIA";RIGHT(txt;25)="EXTRAORDINÁRIA, APROVADOS";RIGHT(txt;26)="EXTRAORDINÁRIA - APROVADOS";RIGHT(txt;25)="EXTRAORDINÁRIA, RECEBIDOS";RIGHT(txt;26)="EXTRAORDINÁRIA - RECEBIDOS";RIGHT(txt;37)="EXTRAORDINÁRIA, RECEBIDOS E APROVADOS";RIGHT(txt;38)="EXTRAORDINÁRIA - RECEBIDOS E APROVADOS";MID(txt;13;8)="PROPOSTA";RIGHT(txt;7)="ANIMAIS";RIGHT(txt;6)="CÂNCER";RIGHT(txt;7)="MARIANA");"2";
+        OR(LEFT(txt;6)="GRANDE";LEFT(txt;7)="REUNIÃO";RIGHT(txt;11)="PERMANENTES";RIGHT(txt;8)="CONJUNTA";RIGHT(txt;19)="CONJUNTA, APROVADOS";RIGHT(txt;19)="CONJUNTA, RECEBIDOS");"3";
+        OR(MID(txt;10;14)="EXTRAORDINÁRIA";RIGHT(txt;8)="ESPECIAL");"5";
+        LEFT(txt;4)="CIPE";"6";
+        TRUE;"1");
+    3;IFS(
+        OR(RIGHT(txt;11)="GASTRONOMIA";RIGHT(txt;6)="URBANA");"2";
+        OR(RIGHT(txt;14)="EXTRAORDINÁRIA";RIGHT(txt;25)="EXTRAORDINÁRIA, APROVADOS";RIGHT(txt;25)="EXTRAORDINÁRIA, RECEBIDOS";RIGHT(txt;7)="ANIMAIS";RIGHT(txt;6)="CÂNCER";RIGHT(txt;7)="MARIANA");"2";
+        OR(RIGHT(txt;11)="PERMANENTES";RIGHT(txt;8)="CONJUNTA";RIGHT(txt;19)="CONJUNTA, APROVADOS";RIGHT(txt;19)="CONJUNTA, RECEBIDOS");"3";
+        RIGHT(txt;8)="ESPECIAL";"5";
+        TRUE;"1");
+    ""))'''
+
+# AC6:AC (coluna oculta): idCom da comissão/RQC/audiência (consulta na aba _lk), uma vez por linha;
+# a audiência extrai o código (MID de 3 letras) uma vez só e faz um único XLOOKUP
+FORMULA_ID_COMISSAO = '''=LET(txt;C6;SWITCH($AA6;
+    1;''' + LK_ID_COMISSAO + ''';
+    2;''' + LK_ID_RQC + ''';
+    3;''' + LK_ID_AUDIENCIA + ''';
+    ""))'''
+
+# AD6:AD (coluna oculta): triagem comum às colunas Q, R e S, feita uma vez por linha
+# 1 = título de seção/linha vazia (Q/R/S ficam ""), 2 = linha sem lançamento (Q/R/S ficam "-"),
+# 0 = segue para a classificação própria de cada coluna
+FORMULA_TRIAGEM_QRS = '''=LET(txt;C6;IFS(
+    OR(txt="";LEFT(txt;6)="DIÁRIO";LEFT(txt;8)="REUNIÕES";txt="REQUERIMENTOS DE COMISSÕES";txt="LANÇAMENTOS DE TRAMITAÇÃO";
+    txt="CADASTRO DE E-MAILS";txt="OFÍCIOS DA SECRETARIA-GERAL DA MESA";txt="LANÇAMENTOS DE PRECLUSÃO DE PRAZO";txt="IMPLANTAÇÃO DE TEXTOS");1;
+    OR(txt="ALINE";txt="ANDRÉ";txt="DIOGO";txt="KÁTIA";txt="LEO";txt="WELDER";txt="TOTAL";ISNUMBER(txt);txt="?";
+    K6="-";K6="cancelada";K6="sem quórum";K6="não publicado");2;
+    OR(txt="-";txt="VOTAÇÕES NOMINAIS";RIGHT(txt;18)="EMENDAS PUBLICADAS";LEFT(txt;17)="VOTAÇÕES NOMINAIS");2;
+    TRUE;0))'''
+
+# recortes de C testados em vários ramos de Q/R/S: calculados uma vez por célula (nomes do LET) em vez de
+# repetidos em cada ramo; os ramos das três colunas usam os nomes daqui
+RECORTES_QRS = (
+    ("fim_14", "RIGHT(txt;14)"),
+    ("fim_15", "RIGHT(txt;15)"),
+    ("fim_19", "RIGHT(txt;19)"),
+    ("ini_25", "LEFT(txt;25)"),
+)
+LET_RECORTES_QRS = "".join(f"{nome};{expr};" for nome, expr in RECORTES_QRS)
+_NOMES_RECORTES = {expr: nome for nome, expr in RECORTES_QRS}
+
+
+def _ini(prefixo: str) -> str:
+    # prefixo de C com o LEN calculado aqui (nada de contar caracteres à mão); usa o recorte do LET se houver
+    expr = f"LEFT(txt;{len(prefixo)})"
+    return f'{_NOMES_RECORTES.get(expr, expr)}="{prefixo}"'
+
+
+def _ou_prefixos(*prefixos: str) -> str:
+    testes = [_ini(p) for p in prefixos]
+    return testes[0] if len(testes) == 1 else f"OR({';'.join(testes)})"
+
+
+# aberturas dos blocos que Q, R e S têm em comum: a condição é montada uma vez aqui e cada coluna só traz
+# os próprios códigos
+TRAMITACAO = "TRAMITAÇÃO DE PROPOSIÇÕES: "
+APRESENTACAO = "APRESENTAÇÃO DE PROPOSIÇÕES: "
+COND_MENSAGEM_GOVERNADOR = _ou_prefixos(
+    "MENSAGEM DO GOVERNADOR QUE ENCAMINHA",
+    "MENSAGENS DO GOVERNADOR QUE ENCAMINHAM",
+    TRAMITACAO + "MENSAGEM DO GOVERNADOR QUE ENCAMINHA",
+    TRAMITACAO + "MENSAGENS DO GOVERNADOR QUE ENCAMINHAM",
+    "MENSAGEM DO GOVERNADOR QUE COMUNICA",
+    TRAMITACAO + "MENSAGEM DO GOVERNADOR QUE COMUNICA",
+    "MENSAGEM DO GOVERNADOR QUE SOLICITA",
+)
+COND_OFICIO_GOVERNADOR = _ou_prefixos("OFÍCIO DO GOVERNADOR", TRAMITACAO + "OFÍCIO DO GOVERNADOR", "OFÍCIO DO VICE-GOVERNADOR")
+COND_OFICIOS = _ou_prefixos("OFÍCIOS - ", "CORRESPONDÊNCIA: OFÍCIOS - ")
+COND_OFICIO_TRIBUNAL_CONTAS = _ou_prefixos("OFÍCIO DO TRIBUNAL DE CONTAS QUE ENCAMINHA", TRAMITACAO + "OFÍCIO DO TRIBUNAL DE CONTAS QUE ENCAMINHA")
+COND_OFICIO_TRIBUNAL_JUSTICA = _ou_prefixos("OFÍCIO DO TRIBUNAL DE JUSTIÇA", TRAMITACAO + "OFÍCIO DO TRIBUNAL DE JUSTIÇA")
+COND_OFICIO_DEFENSORIA = _ou_prefixos("OFÍCIO DA DEFENSORIA PÚBLICA", TRAMITACAO + "OFÍCIO DA DEFENSORIA PÚBLICA")
+COND_OFICIO_MINISTERIO_PUBLICO = _ou_prefixos("OFÍCIO DO MINISTÉRIO PÚBLICO", TRAMITACAO + "OFÍCIO DO MINISTÉRIO PÚBLICO")
+COND_OFICIO_PROCURADORIA = _ou_prefixos("OFÍCIO DA PROCURADORIA-GERAL DE JUSTIÇA")
+COND_APRESENTACAO_REQUERIMENTOS = _ou_prefixos(APRESENTACAO + "REQUERIMENTOS", TRAMITACAO + APRESENTACAO + "REQUERIMENTOS")
+COND_APRESENTACAO_PEC = _ou_prefixos(APRESENTACAO + "PROPOSTA DE EMENDA À CONSTITUIÇÃO", TRAMITACAO + "PROPOSTA DE EMENDA À CONSTITUIÇÃO")
+COND_APRESENTACAO_PL = _ou_prefixos(APRESENTACAO + "PROJETOS DE LEI", TRAMITACAO + "PROJETOS DE LEI")
+COND_APRESENTACAO_PRE = _ou_prefixos(APRESENTACAO + "PROJETOS DE RESOLUÇÃO", TRAMITACAO + "PROJETOS DE RESOLUÇÃO")
+COND_COMISSAO = _ou_prefixos("COMISSÃO", "CIPE")
+
+# guardas dos blocos de ofícios e de apresentação/tramitação: um LEFT curto descarta de uma vez as linhas que
+# não abrem com esses prefixos, sem passar pelos OR(LEFT...) de cada sub-bloco; o que casa a guarda mas nenhum
+# sub-bloco cai na mesma consulta final de textos exatos (_lk) a que chegaria antes
+COND_GRUPO_OFICIO = _ou_prefixos("OFÍCIO", "CORRESPONDÊNCIA: OFÍCIOS - ", TRAMITACAO + "OFÍCIO")
+COND_GRUPO_APRESENTACAO = _ou_prefixos(APRESENTACAO, TRAMITACAO)
+
+# ícones dos links da coluna A (cada um aparecia uma dúzia de vezes no texto da fórmula)
+IMG_BANDEIRA = 'IMAGE("https://seeklogo.com/images/B/bandeira-minas-gerais-logo-AD7B6F3604-seeklogo.com.png";4;15;15)'
+IMG_FAVICON = 'IMAGE("https://www.almg.gov.br/favicon.ico";4;15;15)'
+
+# prefixos de URL repetidos na coluna A (definidos uma vez; entram no texto da fórmula dentro das aspas)
+URL_WEBMAIL_MBOX = "https://webmail.almg.gov.br/imp/dynamic.php?page=mailbox#mbox:"
+URL_COMISSAO_REUNIAO = "https://www.almg.gov.br/atividade-parlamentar/comissoes/reuniao/?idTipo="
+URL_DIARIO_PDFS = "https://www.almg.gov.br/export/sites/default/consulte/arquivo_diario_legislativo/pdfs/"
+
+# A6:A — link para a página do Diário (ou da reunião/comissão) conforme o texto de C na mesma linha;
+# escrita com repeatCell a partir de A6, então C6/B6/U6 andam junto com a linha (sem INDIRECT volátil);
+# o texto de C é lido uma vez só (LET txt) e todas as comparações/LEFT/RIGHT/MID partem dele
+FORMULA_COLUNA_A = '''=LET(txt;C6;IFS(
+
+    OR(
+    txt="-";
+    txt="?")
+    ;"-";
+
+    OR(U6<>"TOTAL");
+    IFS(
+    OR(txt="";txt="IMPLANTAÇÃO DE TEXTOS";U6="IMPLANTAÇÃO");"";
+
+    OR(txt="DIÁRIO DO EXECUTIVO";txt="LEIS";txt="LEI, COM PROPOSIÇÃO ANEXADA";LEFT(txt;4)="VETO");
+        HYPERLINK(
+        "https://www.jornalminasgerais.mg.gov.br/edicao-do-dia?dados=" &
+        ENCODEURL("{""dataPublicacaoSelecionada"":""" & TEXT($B$6;"yyyy-mm-dd") & "T03:00:00.000Z""}");
+        ''' + IMG_FAVICON + '''
+        );
+
+    txt="DIÁRIO DO EXECUTIVO - EDIÇÃO EXTRA";
+        HYPERLINK(
+        "https://www.jornalminasgerais.mg.gov.br/edicao-do-dia?dados=" &
+        ENCODEURL("{""dataPublicacaoSelecionada"":""" & TEXT($B$6;"yyyy-mm-dd") & "T03:00:00.000Z""}");
+        ''' + IMG_FAVICON + '''
+        );
+
+    txt="DIÁRIO DO LEGISLATIVO";HYPERLINK("https://diariolegislativo.almg.gov.br/"&RIGHT(B6;4)&"/L"&RIGHT(B6;4)&MID(B6;4;2)&LEFT(B6;2)&".pdf";''' + IMG_FAVICON + ''');
+    txt="DIÁRIO DO LEGISLATIVO - EDIÇÃO EXTRA";HYPERLINK("https://diariolegislativo.almg.gov.br/"&RIGHT(B6;4)&"/L"&RIGHT(B6;4)&MID(B6;4;2)&LEFT(B6;2)&"E.pdf";''' + IMG_FAVICON + ''');
+
+    txt="REUNIÕES DE PLENÁRIO";HYPERLINK("https://www.almg.gov.br/atividade-parlamentar/plenario/agenda/?pesquisou=true&q=&tipo=&dataInicio="&TO_TEXT(B6)&"&dataFim="&TO_TEXT(B6);''' + IMG_FAVICON + ''');
+
+    txt="REUNIÕES DE COMISSÕES";HYPERLINK("https://www.almg.gov.br/atividade-parlamentar/comissoes/agenda/?pesquisou=true&q=&tpComissao=&idComissao=&dataInicio="&TO_TEXT(B6)&"&dataFim="&TO_TEXT(B6)&"&pesquisa=todas&ordem=1&tp=30";''' + IMG_FAVICON + ''');
+
+    txt="REQUERIMENTOS DE COMISSÕES";HYPERLINK("https://www.almg.gov.br/atividade-parlamentar/comissoes/agenda/?pesquisou=true&q=&tpComissao=&idComissao=&dataInicio="&TO_TEXT($V$2)&"&dataFim="&TO_TEXT($V$2)&"&pesquisa=todas&ordem=1&tp=30";''' + IMG_FAVICON + ''');
+    txt="OFÍCIOS DA SECRETARIA-GERAL DA MESA";HYPERLINK("https://stl.almg.gov.br/";''' + IMG_FAVICON + ''');
+    txt="LANÇAMENTOS DE PRECLUSÃO DE PRAZO";HYPERLINK("https://webmail.almg.gov.br/";''' + IMG_FAVICON + ''');
+    txt="LANÇAMENTOS DE TRAMITAÇÃO";HYPERLINK("https://www.almg.gov.br/";''' + IMG_FAVICON + ''');
+    txt="CADASTRO DE E-MAILS";HYPERLINK("https://webmail.almg.gov.br/";''' + IMG_FAVICON + ''');
+
+    LEFT(txt;27)="RECEBIMENTO DE PROPOSIÇÃO: ";HYPERLINK("https://stl.almg.gov.br/html5/?versao=3.1.2#rest-oficios-"&MID($B$6;8;4)&"-"&$Z$3&"-SGM";''' + IMG_BANDEIRA + ''');
+    txt="DESIGNAÇÃO DE RELATOR";HYPERLINK("''' + URL_WEBMAIL_MBOX + '''SU5CT1guREVTSUdOQcOHw4NPIERFIFJFTEFUT1I";''' + IMG_BANDEIRA + ''');
+    txt="CUMPRIMENTO DE DILIGÊNCIA";HYPERLINK("''' + URL_WEBMAIL_MBOX + '''SU5CT1guQ1VNUFJJTUVOVE8gREUgRElMSUfDik5DSUE";''' + IMG_BANDEIRA + ''');
+    txt="REUNIÃO ORIGINADA DE REQUERIMENTO";HYPERLINK("''' + URL_WEBMAIL_MBOX + '''SU5CT1guUkVVTknDg08gT1JJR0lOQURBIERFIFJRQw";''' + IMG_BANDEIRA + ''');
+    LEFT(txt;32)="REUNIÃO COM DEBATE DE PROPOSIÇÃO";HYPERLINK("''' + URL_WEBMAIL_MBOX + '''SU5CT1guUkVVTknDg08gQ09NIERFQkFURSBERSBQUk9QT1NJw4fDg08";''' + IMG_BANDEIRA + ''');
+    txt="SECRETARIA-GERAL DA MESA";HYPERLINK("''' + URL_WEBMAIL_MBOX + '''SU5CT1guU0VDUkVUQVJJQS1HRVJBTCBEQSBNRVNB";''' + IMG_BANDEIRA + ''');
+
+    $AA6=4;
+    IF(
+    E6="cancelada";
+    HYPERLINK("https://www.almg.gov.br/atividade_parlamentar/plenario/interna.html?tipo=pauta&dDet="&LEFT($X$4;2)&"|"&MID($X$4;4;2)&"|"&RIGHT($X$4;4)&"&hDet="&TO_TEXT(B6);
+    ''' + IMG_BANDEIRA + ''');
+    HYPERLINK("https://www.almg.gov.br/atividade_parlamentar/plenario/interna.html?tipo=res&dia="&LEFT($X$4;2)&"&mes="&MID($X$4;4;2)&"&ano="&RIGHT($X$4;4)&"&hr="&TO_TEXT(B6);
+    ''' + IMG_BANDEIRA + '''));
+
+    $AA6=1;HYPERLINK("https://www.almg.gov.br/atividade-parlamentar/comissoes/"
+    &IF(RIGHT(txt;6)="VISITA";"visita";"reuniao")&"/?idTipo="
+    &$AB6
+    &"&idCom="
+    &$AC6&"&dia="&$Z$1&"&mes="&$Z$2&"&ano="&$Z$3&"&hr="&TO_TEXT(B6)&"&tpCom="&IF(LEFT(txt;45)="COMISSÃO DE MEMBROS DAS COMISSÕES PERMANENTES";"3";"2")&"&aba=js_tabResultado";
+    ''' + IMG_BANDEIRA + ''');
+
+
+
+    $AA6=2;HYPERLINK("''' + URL_COMISSAO_REUNIAO + '''"
+    &$AB6
+    &"&idCom="
+    &$AC6&"&dia="&$Z$1&"&mes="&$Z$2&"&ano="&$Z$3&"&hr="&TO_TEXT(B6)&"&tpCom="&IF(LEFT(txt;45)="RQC: MEMBROS DAS COMISSÕES PERMANENTES";"3";"2")&"&aba=js_tabResultado";
+    ''' + IMG_BANDEIRA + ''');
+
+
+
+    $AA6=3;HYPERLINK("''' + URL_COMISSAO_REUNIAO + '''"
+    &$AB6
+    &"&idCom="
+    &$AC6&"&dia="&MID(txt;25;2)
+    &"&mes="&MID(txt;28;2)
+    &"&ano="&MID(txt;31;4)
+    &"&hr="&TO_TEXT(B6)&"&tpCom=2&aba=js_tabResultado";
+    ''' + IMG_BANDEIRA + ''');
+
+
+
+    OR(txt<>"REUNIÕES DE PLENÁRIO");
+    HYPERLINK("''' + URL_DIARIO_PDFS + '''"&$Z$3&"/"&$Z$4&"/L"&$Z$3&$Z$4&$Z$5&".pdf#page="&LEFT(B6;3);
+
+    ''' + IMG_BANDEIRA + ''')
+    )))'''
+
+# P6:P — IFS plano (sem IFS aninhados); E/C lidos uma vez (LET)
+FORMULA_COLUNA_P = '''=LET(e;E6;c;C6;IFS(
+    OR(e="-";e="cancelada";e="sem quórum");"-";
+    e="DIOGO";NA();
+    OR(T6="-";H6="-");"-";
+    T6="??";IMAGE("https://cdn.iconscout.com/icon/premium/png-512-thumb/broken-link-18-610397.png";4;20;20);
+    OR(c="";''' + LK_SEM_LINK_P + ''');" ";
+    $A$683=FALSE;HYPERLINK("https://integracao.almg.gov.br/mate-brs/index.html?first=false&search=odp&pagina=1&tp=200&aba=js_tabpesquisaAvancada&txtPalavras="&T6;IMAGE("https://www.almg.gov.br/favicon.ico";4;17;17));
+    $A$683=TRUE;HYPERLINK(X6;IMAGE("https://www.almg.gov.br/favicon.ico";4;17;17))))'''
+
+# Q6:Q — C e recortes repetidos lidos uma vez (LET); sufixos dos requerimentos de comissão consultados na aba _lk
+FORMULA_COLUNA_Q = '''=LET(txt;C6;''' + LET_RECORTES_QRS + '''IFS(
+    $AD6=1;"";
+    $AD6=2;"-";
+    OR(txt="ERRATAS";txt="MANIFESTAÇÕES");"-";
+    LEFT(txt;6)<>"DIÁRIO";
+    IFS(
+
+    OR(txt="EMENDA À CONSTITUIÇÃO PROMULGADA";txt="EMENDAS À CONSTITUIÇÃO PROMULGADAS");"PL??";
+    OR(txt="PROPOSTA DE AÇÃO LEGISLATIVA";txt="PROPOSTAS DE AÇÃO LEGISLATIVA");"PLE1";
+    RIGHT(txt;48)="PROPOSTAS DE AÇÃO LEGISLATIVA REFERENTES AO PPAG";"PLE1";
+    RIGHT(txt;24)="VOTAÇÃO DE REQUERIMENTOS";"RQN??/PL??";
+    txt="VETO TOTAL A PROPOSIÇÃO DE LEI";"PL80";
+    txt="VETO PARCIAL A PROPOSIÇÃO DE LEI";"PL82";
+    txt="VETO PARCIAL A PROPOSIÇÃO DE LEI COMPLEMENTAR";"PLC14";
+    OR(txt="RESOLUÇÃO";txt="RESOLUÇÕES");"PRE131";
+    txt="PROPOSIÇÕES DE LEI";"PL63";
+    txt="DECISÃO DA MESA";"PL??";
+    txt="DECISÕES DA PRESIDÊNCIA";"PL??";
+    OR(txt="DESIGNAÇÃO DE COMISSÕES";txt="TRAMITAÇÃO DE PROPOSIÇÕES: DESIGNAÇÃO DE COMISSÕES");"PL??";
+    txt="OFÍCIOS DE PREFEITURA QUE ENCAMINHAM DECRETOS DE CALAMIDADE PÚBLICA";"PL??";
+    txt="PROPOSIÇÃO: REQUERIMENTOS - INDICAÇÃO TCE";"PL??";
+    txt="SOLENE";"-";
+    txt="ESPECIAL";"PL??";
+    txt="ORDINÁRIA";"PL??";
+    txt="EXTRAORDINÁRIA";"PL??";
+    txt="EXTRAORDINÁRIA: PARECERES DE REDAÇÃO FINAL APROVADOS";"PL62";
+    txt="ERRATA";"PL??";
+    RIGHT(txt;23)="LEITURA DE COMUNICAÇÕES";"-";
+    OR(RIGHT(txt;11)="PROMULGADAS");"PL112";
+    OR(LEFT(txt;27)="LEI, COM PROPOSIÇÃO ANEXADA");"PL81//PL5";
+    OR(LEFT(txt;3)="LEI");"PL81";
+    OR(LEFT(txt;16)="LEI COMPLEMENTAR");"PL81";
+    OR(txt="EMENDAS OU SUBSTITUTIVOS PUBLICADOS";txt="EMENDAS NÃO RECEBIDAS PUBLICADAS");"PL??";
+    LEFT(txt;8)="COMISSÃO";"RQN??";
+    LEFT(txt;4)="CIPE";"RQN??";
+    LEFT(txt;16)="REUNIÃO CONJUNTA";"RQN??";
+    OR(LEFT(txt;19)="RELATÓRIO DE VISITA";LEFT(txt;46)="TRAMITAÇÃO DE PROPOSIÇÕES: RELATÓRIO DE VISITA");"RQC18";
+    RIGHT(txt;33)="RELATÓRIO DE EVENTO INSTITUCIONAL";"REL1";
+    RIGHT(txt;24)="REQUERIMENTOS ORDINÁRIOS";"RQO1";
+    RIGHT(txt;23)="REQUERIMENTOS APROVADOS";"RQN66";
+    RIGHT(txt;26)="COMUNICAÇÃO DA PRESIDÊNCIA";"RQN26";
+    OR(LEFT(txt;22)="DECISÃO DA PRESIDÊNCIA";LEFT(txt;49)="TRAMITAÇÃO DE PROPOSIÇÕES: DECISÃO DA PRESIDÊNCIA");"PL??";
+    RIGHT(txt;22)="PALAVRAS DO PRESIDENTE";"PL??";
+    ini_25="DESPACHO DE REQUERIMENTOS";"RQN83";
+    txt="TRAMITAÇÃO DE PROPOSIÇÕES: PARECERES";"PL178";
+    txt="PARECERES SOBRE VETO";"PL??";
+    txt="PARECERES SOBRE SUBSTITUTIVO";"PL??";
+    LEFT(txt;17)="AUDIÊNCIA PÚBLICA";"-";
+    LEFT(txt;23)="AUDIÊNCIA DE CONVIDADOS";"-";
+
+    ''' + COND_MENSAGEM_GOVERNADOR + ''';IFS(
+    OR(fim_14="PROJETO DE LEI";RIGHT(txt;27)="PROJETO DE LEI COMPLEMENTAR";fim_15="PROJETOS DE LEI";RIGHT(txt;36)="PROJETO DE LEI - CRÉDITO SUPLEMENTAR";);"PL??";
+    RIGHT(txt;42)="EMENDA OU SUBSTITUTIVO COM DESPACHO À MESA";"MSG5 // PL156";
+    RIGHT(txt;41)="EMENDA OU SUBSTITUTIVO COM DESPACHO À FFO";"MSG7 // PL624";
+    RIGHT(txt;12)="VETO PARCIAL";"PL??";
+    RIGHT(txt;10)="VETO TOTAL";"PL??";
+    RIGHT(txt;29)="REGIME ESPECIAL DE TRIBUTAÇÃO";"MSG21";
+    RIGHT(txt;9)="INDICAÇÃO";"PL??";
+    RIGHT(txt;28)="PEDIDO DE REGIME DE URGÊNCIA";"PL??";
+    RIGHT(txt;18)="CONVÊNIO DO CONFAZ";"MSG11";
+    RIGHT(txt;16)="CONVÊNIO DO ICMS";"MSG11";
+    RIGHT(txt;44)="PRESTAÇÃO DE CONTAS DA ADMINISTRAÇÃO PÚBLICA";"PL??";
+    RIGHT(txt;36)="RELATÓRIO SOBRE A SITUAÇÃO DO ESTADO";"MSG22";
+    RIGHT(txt;29)="DESARQUIVAMENTO DE PROPOSIÇÃO";"MSG8 // RQN80";
+    fim_19="RETIRADA DE PROJETO";"MSG12 // RQN80";
+    RIGHT(txt;16)="AUSÊNCIA DO PAÍS";"OFI10"
+    );
+
+    LEFT(txt;28)="REQUERIMENTOS DE COMISSÕES: ";''' + LK_COD_REQ_COMISSOES + ''';
+
+    LEFT(txt;3)="RQC";''' + LK_COD_RQC + ''';
+
+    ''' + COND_GRUPO_OFICIO + ''';IFS(
+    ''' + COND_OFICIO_GOVERNADOR + ''';IFS(
+    RIGHT(txt;28)="COMUNICANDO AUSÊNCIA DO PAÍS";"OFI10";
+    RIGHT(txt;35)="COMUNICANDO QUE ENCAMINHOU MENSAGEM";"OFI??");
+    ''' + COND_OFICIOS + ''';IFS(
+    fim_15="PROJETOS DE LEI";"PL330";
+    RIGHT(txt;13)="REQUERIMENTOS";"RQN30";
+    RIGHT(txt;5)="VETOS";"PL330";
+    RIGHT(txt;20)="PRORROGAÇÃO DE PRAZO";"RQN67";
+    RIGHT(txt;33)="PROPOSTA DE EMENDA À CONSTITUIÇÃO";"PL330");
+
+    ''' + COND_OFICIO_TRIBUNAL_CONTAS + ''';IFS(
+    fim_14="PROJETO DE LEI";"PL??";
+    TRUE;SWITCH(RIGHT(txt;23);
+    "RELATÓRIO DE ATIVIDADES";"PL??";
+    "BALANÇO GERAL DO ESTADO";"PL??";
+    IFS(fim_19="PRESTAÇÃO DE CONTAS";"PL??")));
+
+    ''' + COND_OFICIO_TRIBUNAL_JUSTICA + ''';IFS(
+    OR(fim_14="PROJETO DE LEI";RIGHT(txt;27)="PROJETO DE LEI COMPLEMENTAR");"OFI4");
+
+    ''' + COND_OFICIO_DEFENSORIA + ''';IFS(
+    fim_14="PROJETO DE LEI";"OFI4");
+
+    ''' + COND_OFICIO_MINISTERIO_PUBLICO + ''';IFS(
+    fim_14="PROJETO DE LEI";"OFI??");
+
+    ''' + COND_OFICIO_PROCURADORIA + ''';IFS(
+    fim_14="PROJETO DE LEI";"OFI4");
+    TRUE;''' + LK_LANCAMENTOS_Q + ''');
+
+    ''' + COND_GRUPO_APRESENTACAO + ''';IFS(
+    ''' + COND_APRESENTACAO_REQUERIMENTOS + ''';''' + LK_REQ_APRESENTADOS_Q + ''';
+
+    ''' + COND_APRESENTACAO_PEC + ''';"PEC5";
+
+    ''' + COND_APRESENTACAO_PL + ''';IFS(
+    fim_19="COMISSÕES TEMÁTICAS";"PL3";
+    RIGHT(txt;18)="MESA DA ASSEMBLEIA";"PL282";
+    RIGHT(txt;8)="ANEXADOS";"PL145/PL204");
+
+    ''' + COND_APRESENTACAO_PRE + ''';IFS(
+    RIGHT(txt;29)="REGIME ESPECIAL DE TRIBUTAÇÃO";"PRE140";
+    fim_19="APROVAÇÃO DE CONTAS";"PRE137";
+    RIGHT(txt;24)="RATIFICAÇÃO DE CONVÊNIOS";"PRE9";
+    RIGHT(txt;37)="ESTRUTURA DA SECRETARIA DA ASSEMBLEIA";"PRE134";
+    fim_19="COMISSÕES TEMÁTICAS";"PL3";
+    RIGHT(txt;8)="ANEXADOS";"PL145/PL204";
+    fim_19="CIDADANIA HONORÁRIA";"PRE11";
+    RIGHT(txt;18)="CALAMIDADE PÚBLICA";"PRE12";
+    RIGHT(txt;21)="LICENÇA AO GOVERNADOR";"PRE13"
+    );
+    TRUE;''' + LK_LANCAMENTOS_Q + ''');
+
+    ini_25="PROPOSIÇÕES NÃO RECEBIDAS";IF(RIGHT(txt;13)="REQUERIMENTOS";"RQN130";"PL130");
+
+    ini_25="RECEBIMENTO DE PROPOSIÇÃO";"PL367";
+    LEFT(txt;23)="DESIGNAÇÃO DE RELATORIA";"PL264";
+    ini_25="CUMPRIMENTO DE DILIGÊNCIA";"PL373";
+    LEFT(txt;32)="REUNIÃO COM DEBATE DE PROPOSIÇÃO";"RQC7";
+    LEFT(txt;33)="REUNIÃO ORIGINADA DE REQUERIMENTO";"RQC5";
+    txt="PAUTA COMPLETA DE REUNIÃO COM DEBATE DE PROPOSIÇÃO";"RQC7";
+    txt="RESULTADO COMPLETO DE REUNIÃO COM DEBATE DE PROPOSIÇÃO";"RQC8";
+    txt="INÍCIO DE APRECIAÇÃO NA PRÓXIMA COMISSÃO";"RQC??";
+    txt="CONGRATULAÇÕES ENTREGUES EM REUNIÃO";"RQN18";
+    txt="ENTREGA DE DIPLOMA";"RQN18";
+    LEFT(txt;16)="CONSULTA PÚBLICA";"PL532";
+
+    TRUE;''' + LK_LANCAMENTOS_Q + '''
+
+    )))'''
+
+# R6:R — C e recortes repetidos lidos uma vez (LET); escadas de sufixos (requerimentos) consultadas na aba _lk
+FORMULA_COLUNA_R = '''=LET(txt;C6;''' + LET_RECORTES_QRS + '''IFS(
+    $AD6=1;"";
+    $AD6=2;"-";
+    LEFT(txt;6)<>"DIÁRIO";
+    IFS(
+
+    OR(txt="EMENDA À CONSTITUIÇÃO PROMULGADA";txt="EMENDAS À CONSTITUIÇÃO PROMULGADAS");"3.3.1-D";
+    OR(txt="PROPOSTA DE AÇÃO LEGISLATIVA";txt="PROPOSTAS DE AÇÃO LEGISLATIVA");"4.2.6";
+    RIGHT(txt;48)="PROPOSTAS DE AÇÃO LEGISLATIVA REFERENTES AO PPAG";"4.2.6-B";
+    RIGHT(txt;24)="VOTAÇÃO DE REQUERIMENTOS";"4.11";
+    txt="MANIFESTAÇÕES";"4.14";
+    RIGHT(txt;23)="REQUERIMENTOS APROVADOS";"4.15";
+    OR(txt="ERRATAS";txt="ERRATA");"4.16";
+    txt="DECISÕES DA PRESIDÊNCIA";"4.4";
+    OR(LEFT(txt;22)="DECISÃO DA PRESIDÊNCIA";LEFT(txt;49)="TRAMITAÇÃO DE PROPOSIÇÕES: DECISÃO DA PRESIDÊNCIA");"4.4";
+    txt="TRAMITAÇÃO DE PROPOSIÇÕES: PARECERES";"6";
+    txt="PARECERES SOBRE VETO";"12.7";
+    txt="PARECERES SOBRE SUBSTITUTIVO";"-";
+    OR(LEFT(txt;3)="LEI");"7.1";
+    txt="ORDINÁRIA";"10.8";
+
+    txt="VETO TOTAL A PROPOSIÇÃO DE LEI";"7.2";
+    LEFT(txt;32)="VETO PARCIAL A PROPOSIÇÃO DE LEI";"7.2";
+    OR(txt="RESOLUÇÃO";txt="RESOLUÇÕES");"3.3.1-A";
+    txt="PROPOSIÇÕES DE LEI";"3.3.2";
+    txt="DECISÃO DA MESA";"???";
+    OR(txt="DESIGNAÇÃO DE COMISSÕES";txt="TRAMITAÇÃO DE PROPOSIÇÕES: DESIGNAÇÃO DE COMISSÕES");"4.7";
+    txt="OFÍCIOS DE PREFEITURA QUE ENCAMINHAM DECRETOS DE CALAMIDADE PÚBLICA";"???";
+    txt="PROPOSIÇÃO: REQUERIMENTOS - INDICAÇÃO TCE";"???";
+    txt="SOLENE";"-";
+    txt="ESPECIAL";"??";
+    txt="EXTRAORDINÁRIA";"???";
+    txt="EXTRAORDINÁRIA: PARECERES DE REDAÇÃO FINAL APROVADOS";"PL62";
+    RIGHT(txt;23)="LEITURA DE COMUNICAÇÕES";"-";
+    OR(txt="EMENDAS OU SUBSTITUTIVOS PUBLICADOS";txt="EMENDAS NÃO RECEBIDAS PUBLICADAS");"???";
+    LEFT(txt;16)="REUNIÃO CONJUNTA";"RQN??";
+    OR(LEFT(txt;19)="RELATÓRIO DE VISITA";LEFT(txt;46)="TRAMITAÇÃO DE PROPOSIÇÕES: RELATÓRIO DE VISITA");"5.3";
+    RIGHT(txt;33)="RELATÓRIO DE EVENTO INSTITUCIONAL";"4.2.9";
+    RIGHT(txt;24)="REQUERIMENTOS ORDINÁRIOS";"RQO1";
+    RIGHT(txt;22)="PALAVRAS DO PRESIDENTE";"4.5";
+    RIGHT(txt;26)="COMUNICAÇÃO DA PRESIDÊNCIA";"4.9";
+    ini_25="DESPACHO DE REQUERIMENTOS";"4.10";
+    LEFT(txt;17)="AUDIÊNCIA PÚBLICA";"???";
+    LEFT(txt;23)="AUDIÊNCIA DE CONVIDADOS";"???";
+
+    ''' + COND_MENSAGEM_GOVERNADOR + ''';IFS(
+    OR(fim_14="PROJETO DE LEI";RIGHT(txt;27)="PROJETO DE LEI COMPLEMENTAR";fim_15="PROJETOS DE LEI";RIGHT(txt;36)="PROJETO DE LEI - CRÉDITO SUPLEMENTAR");"4.2.1-A";
+    RIGHT(txt;42)="EMENDA OU SUBSTITUTIVO COM DESPACHO À MESA";"4.2.1-B";
+    RIGHT(txt;41)="EMENDA OU SUBSTITUTIVO COM DESPACHO À FFO";"4.2.1-B";
+    RIGHT(txt;12)="VETO PARCIAL";"4.2.1-C";
+    RIGHT(txt;10)="VETO TOTAL";"4.2.1-C";
+    RIGHT(txt;29)="REGIME ESPECIAL DE TRIBUTAÇÃO";"4.2.1-D";
+    RIGHT(txt;9)="INDICAÇÃO";"4.2.1-F";
+    RIGHT(txt;28)="PEDIDO DE REGIME DE URGÊNCIA";"4.2.1-G";
+    RIGHT(txt;18)="CONVÊNIO DO CONFAZ";"4.2.1-I";
+    RIGHT(txt;16)="CONVÊNIO DO ICMS";"4.2.1-I";
+    RIGHT(txt;44)="PRESTAÇÃO DE CONTAS DA ADMINISTRAÇÃO PÚBLICA";"4.2.1-L";
+    RIGHT(txt;36)="RELATÓRIO SOBRE A SITUAÇÃO DO ESTADO";"4.2.2-L.2";
+    RIGHT(txt;29)="DESARQUIVAMENTO DE PROPOSIÇÃO";"4.2.1-T";
+    fim_19="RETIRADA DE PROJETO";"4.2.1-M";
+    RIGHT(txt;16)="AUSÊNCIA DO PAÍS";"4.2.2-C.2"
+    );
+
+    ''' + COND_COMISSAO + ''';SWITCH(MID(txt;13;12);
+    "CONSTITUIÇÃO";"10.2";
+    "FISCALIZAÇÃO";"10.3";
+    "PARTICIPAÇÃO";"10.4";
+    IFS(
+    MID(txt;13;7)="REDAÇÃO";"10.5";
+    MID(txt;11;8)="ESPECIAL";"10.6";
+    TRUE;"10"));
+
+    LEFT(txt;27)="REQUERIMENTOS DE COMISSÃO: ";''' + LK_COD_REQ_COMISSAO_R + ''';
+
+    LEFT(txt;3)="RQC";''' + LK_COD_RQC_R + ''';
+
+    ''' + COND_GRUPO_OFICIO + ''';IFS(
+    ''' + COND_OFICIO_GOVERNADOR + ''';IFS(
+    RIGHT(txt;28)="COMUNICANDO AUSÊNCIA DO PAÍS";"4.2.2-C.2";
+    RIGHT(txt;35)="COMUNICANDO QUE ENCAMINHOU MENSAGEM";"4.2.2-C");
+    ''' + COND_OFICIOS + ''';IFS(
+    fim_15="PROJETOS DE LEI";"4.1.2";
+    RIGHT(txt;13)="REQUERIMENTOS";"4.1.1";
+    RIGHT(txt;5)="VETOS";"4.1.2";
+    RIGHT(txt;20)="PRORROGAÇÃO DE PRAZO";"4.1.4";
+    RIGHT(txt;33)="PROPOSTA DE EMENDA À CONSTITUIÇÃO";"4.1.2");
+
+    ''' + COND_OFICIO_TRIBUNAL_CONTAS + ''';IFS(
+    fim_14="PROJETO DE LEI";"4.2.2-A.1";
+    TRUE;SWITCH(RIGHT(txt;23);
+    "RELATÓRIO DE ATIVIDADES";"4.2.2-A.3";
+    "BALANÇO GERAL DO ESTADO";"4.2.2-A.4";
+    IFS(fim_19="PRESTAÇÃO DE CONTAS";"4.2.2-A.5")));
+
+    ''' + COND_OFICIO_TRIBUNAL_JUSTICA + ''';IFS(
+    OR(fim_14="PROJETO DE LEI";RIGHT(txt;27)="PROJETO DE LEI COMPLEMENTAR");"4.2.2-B.1");
+
+    ''' + COND_OFICIO_DEFENSORIA + ''';IFS(
+    fim_14="PROJETO DE LEI";"4.2.2-F.1");
+
+    ''' + COND_OFICIO_MINISTERIO_PUBLICO + ''';IFS(
+    fim_14="PROJETO DE LEI";"4.2.2-D.1");
+
+    ''' + COND_OFICIO_PROCURADORIA + ''';IFS(
+    fim_14="PROJETO DE LEI";"4.2.2-D.1");
+    TRUE;''' + LK_LANCAMENTOS_R + ''');
+
+    ''' + COND_GRUPO_APRESENTACAO + ''';IFS(
+    ''' + COND_APRESENTACAO_REQUERIMENTOS + ''';''' + LK_REQ_APRESENTADOS_R + ''';
+
+    ''' + COND_APRESENTACAO_PEC + ''';"4.2.3";
+
+    ''' + COND_APRESENTACAO_PL + ''';IFS(
+    fim_19="COMISSÕES TEMÁTICAS";"4.2.4-A";
+    RIGHT(txt;8)="ANEXADOS";"4.2.4-B";
+    RIGHT(txt;18)="MESA DA ASSEMBLEIA";"4.2.4-D");
+
+    ''' + COND_APRESENTACAO_PRE + ''';IFS(
+    RIGHT(txt;29)="REGIME ESPECIAL DE TRIBUTAÇÃO";"4.2.5-A";
+    fim_19="APROVAÇÃO DE CONTAS";"4.2.5-B";
+    RIGHT(txt;24)="RATIFICAÇÃO DE CONVÊNIOS";"4.2.5-C";
+    RIGHT(txt;37)="ESTRUTURA DA SECRETARIA DA ASSEMBLEIA";"4.2.5-D";
+    fim_19="COMISSÕES TEMÁTICAS";"4.2.5-E";
+    RIGHT(txt;8)="ANEXADOS";"4.2.5-F";
+    fim_19="CIDADANIA HONORÁRIA";"4.2.5-G";
+    RIGHT(txt;18)="CALAMIDADE PÚBLICA";"4.2.5-H";
+    RIGHT(txt;21)="LICENÇA AO GOVERNADOR";"4.2.5-I"
+    );
+    TRUE;''' + LK_LANCAMENTOS_R + ''');
+
+    ini_25="PROPOSIÇÕES NÃO RECEBIDAS";"4.3";
+
+    txt="CONGRATULAÇÕES ENTREGUES EM REUNIÃO";"8.4";
+    txt="ENTREGA DE DIPLOMA";"8.4";
+    ini_25="RECEBIMENTO DE PROPOSIÇÃO";"9.1";
+    LEFT(txt;23)="DESIGNAÇÃO DE RELATORIA";"9.2";
+    ini_25="CUMPRIMENTO DE DILIGÊNCIA";"9.3";
+    LEFT(txt;32)="REUNIÃO COM DEBATE DE PROPOSIÇÃO";"9.8";
+    LEFT(txt;33)="REUNIÃO ORIGINADA DE REQUERIMENTO";"9.7";
+    txt="PAUTA COMPLETA DE REUNIÃO COM DEBATE DE PROPOSIÇÃO";"9.8.1";
+    txt="RESULTADO COMPLETO DE REUNIÃO COM DEBATE DE PROPOSIÇÃO";"9.8.2";
+    LEFT(txt;16)="CONSULTA PÚBLICA";"9.9";
+
+    TRUE;''' + LK_LANCAMENTOS_R + '''
+
+    )))'''
+
+# S6:S — C e recortes repetidos lidos uma vez (LET); cada ramo dá só a página do manual (várias consultadas na
+# aba _lk) e um único HYPERLINK é montado no fim
+FORMULA_COLUNA_S = '''=LET(txt;C6;''' + LET_RECORTES_QRS + '''pg;IFS(
+    $AD6=1;"";
+    $AD6=2;"-";
+    LEFT(txt;6)<>"DIÁRIO";IFS(
+
+    txt="IMPLANTAÇÃO DE TEXTOS";27;
+    OR(txt="EMENDA À CONSTITUIÇÃO PROMULGADA";txt="EMENDAS À CONSTITUIÇÃO PROMULGADAS");47;
+    OR(txt="PROPOSTA DE AÇÃO LEGISLATIVA";txt="PROPOSTAS DE AÇÃO LEGISLATIVA");194;
+    RIGHT(txt;48)="PROPOSTAS DE AÇÃO LEGISLATIVA REFERENTES AO PPAG";195;
+    txt="ESPECIAL";371;
+    txt="ORDINÁRIA";386;
+    txt="EXTRAORDINÁRIA";386;
+    txt="SOLENE";386;
+    OR(txt="RESOLUÇÃO";txt="RESOLUÇÕES");43;
+    txt="PROPOSIÇÕES DE LEI";48;
+    txt="DECISÃO DA MESA";"PÁG ??";
+    txt="DECISÕES DA PRESIDÊNCIA";"PÁG ??";
+    txt="MANIFESTAÇÕES";276;
+    RIGHT(txt;24)="VOTAÇÃO DE REQUERIMENTOS";265;
+    txt="OFÍCIOS DE PREFEITURA QUE ENCAMINHAM DECRETOS DE CALAMIDADE PÚBLICA";"PÁG ??";
+    LEFT(txt;16)="REUNIÃO CONJUNTA";"PÁG ??";
+    txt="VETO TOTAL A PROPOSIÇÃO DE LEI";303;
+    LEFT(txt;32)="VETO PARCIAL A PROPOSIÇÃO DE LEI";303;
+    OR(txt="DESIGNAÇÃO DE COMISSÕES";txt="TRAMITAÇÃO DE PROPOSIÇÕES: DESIGNAÇÃO DE COMISSÕES");251;
+    txt="PROPOSIÇÃO: REQUERIMENTOS - INDICAÇÃO TCE";197;
+    txt="TRAMITAÇÃO DE PROPOSIÇÕES: PARECERES";301;
+    txt="PARECERES SOBRE VETO";434;
+    txt="PARECERES SOBRE SUBSTITUTIVO";"PÁG ??";
+    OR(txt="ERRATAS";txt="ERRATA");279;
+    RIGHT(txt;23)="LEITURA DE COMUNICAÇÕES";255;
+    OR(LEFT(txt;3)="LEI");315;
+    OR(txt="EMENDAS OU SUBSTITUTIVOS PUBLICADOS";txt="EMENDAS NÃO RECEBIDAS PUBLICADAS");"PÁG ??";
+    OR(LEFT(txt;19)="RELATÓRIO DE VISITA";LEFT(txt;46)="TRAMITAÇÃO DE PROPOSIÇÕES: RELATÓRIO DE VISITA");290;
+    RIGHT(txt;33)="RELATÓRIO DE EVENTO INSTITUCIONAL";223;
+    RIGHT(txt;23)="REQUERIMENTOS APROVADOS";277;
+    RIGHT(txt;26)="COMUNICAÇÃO DA PRESIDÊNCIA";246;
+    OR(LEFT(txt;22)="DECISÃO DA PRESIDÊNCIA";LEFT(txt;49)="TRAMITAÇÃO DE PROPOSIÇÕES: DECISÃO DA PRESIDÊNCIA");243;
+    RIGHT(txt;22)="PALAVRAS DO PRESIDENTE";242;
+    ini_25="DESPACHO DE REQUERIMENTOS";262;
+    LEFT(txt;17)="AUDIÊNCIA PÚBLICA";"PÁG ??";
+    LEFT(txt;23)="AUDIÊNCIA DE CONVIDADOS";"PÁG ??";
+
+    ''' + COND_MENSAGEM_GOVERNADOR + ''';IFS(
+    OR(fim_14="PROJETO DE LEI";RIGHT(txt;27)="PROJETO DE LEI COMPLEMENTAR";fim_15="PROJETOS DE LEI";RIGHT(txt;36)="PROJETO DE LEI - CRÉDITO SUPLEMENTAR");58;
+    RIGHT(txt;42)="EMENDA OU SUBSTITUTIVO COM DESPACHO À MESA";65;
+    RIGHT(txt;41)="EMENDA OU SUBSTITUTIVO COM DESPACHO À FFO";65;
+    RIGHT(txt;12)="VETO PARCIAL";73;
+    RIGHT(txt;10)="VETO TOTAL";73;
+    RIGHT(txt;29)="REGIME ESPECIAL DE TRIBUTAÇÃO";78;
+    RIGHT(txt;9)="INDICAÇÃO";81;
+    RIGHT(txt;28)="PEDIDO DE REGIME DE URGÊNCIA";84;
+    RIGHT(txt;18)="CONVÊNIO DO CONFAZ";89;
+    RIGHT(txt;16)="CONVÊNIO DO ICMS";90;
+    RIGHT(txt;44)="PRESTAÇÃO DE CONTAS DA ADMINISTRAÇÃO PÚBLICA";93;
+    RIGHT(txt;36)="RELATÓRIO SOBRE A SITUAÇÃO DO ESTADO";97;
+    RIGHT(txt;29)="DESARQUIVAMENTO DE PROPOSIÇÃO";110;
+    fim_19="RETIRADA DE PROJETO";110;
+    RIGHT(txt;16)="AUSÊNCIA DO PAÍS";140
+    );
+
+    OR(LEFT(txt;27)="REQUERIMENTOS DE COMISSÃO: ";LEFT(txt;3)="RQC");''' + LK_PAG_RQC_S + ''';
+
+    ''' + COND_GRUPO_OFICIO + ''';IFS(
+    ''' + COND_OFICIO_GOVERNADOR + ''';
+    IFS(
+    RIGHT(txt;28)="COMUNICANDO AUSÊNCIA DO PAÍS";139;
+    RIGHT(txt;35)="COMUNICANDO QUE ENCAMINHOU MENSAGEM";138);
+    ''' + COND_OFICIOS + ''';IFS(
+    fim_15="PROJETOS DE LEI";51;
+    RIGHT(txt;13)="REQUERIMENTOS";50;
+    RIGHT(txt;5)="VETOS";51;
+    RIGHT(txt;20)="PRORROGAÇÃO DE PRAZO";53;
+    RIGHT(txt;33)="PROPOSTA DE EMENDA À CONSTITUIÇÃO";51);
+
+    ''' + COND_OFICIO_TRIBUNAL_CONTAS + ''';IFS(
+    fim_14="PROJETO DE LEI";113;
+    TRUE;SWITCH(RIGHT(txt;23);
+    "RELATÓRIO DE ATIVIDADES";117;
+    "BALANÇO GERAL DO ESTADO";118;
+    IFS(fim_19="PRESTAÇÃO DE CONTAS";120)));
+
+    ''' + COND_OFICIO_TRIBUNAL_JUSTICA + ''';IFS(
+    OR(fim_14="PROJETO DE LEI";RIGHT(txt;27)="PROJETO DE LEI COMPLEMENTAR");123);
+
+    ''' + COND_OFICIO_DEFENSORIA + ''';IFS(
+    fim_14="PROJETO DE LEI";148);
+
+    ''' + COND_OFICIO_MINISTERIO_PUBLICO + ''';IFS(
+    fim_14="PROJETO DE LEI";144);
+
+    ''' + COND_OFICIO_PROCURADORIA + ''';IFS(
+    fim_14="PROJETO DE LEI";144);
+    TRUE;''' + LK_PAG_LANCAMENTOS_S + ''');
+
+    ''' + COND_GRUPO_APRESENTACAO + ''';IFS(
+    ''' + COND_APRESENTACAO_REQUERIMENTOS + ''';''' + LK_PAG_REQ_APRESENTADOS_S + ''';
+
+    ''' + COND_APRESENTACAO_PEC + ''';167;
+
+    ''' + COND_APRESENTACAO_PL + ''';IFS(
+    fim_19="COMISSÕES TEMÁTICAS";168;
+    RIGHT(txt;8)="ANEXADOS";169;
+    RIGHT(txt;18)="MESA DA ASSEMBLEIA";163);
+
+    ''' + COND_APRESENTACAO_PRE + ''';IFS(
+    RIGHT(txt;29)="REGIME ESPECIAL DE TRIBUTAÇÃO";170;
+    fim_19="APROVAÇÃO DE CONTAS";172;
+    RIGHT(txt;24)="RATIFICAÇÃO DE CONVÊNIOS";173;
+    RIGHT(txt;37)="ESTRUTURA DA SECRETARIA DA ASSEMBLEIA";175;
+    fim_19="COMISSÕES TEMÁTICAS";176;
+    RIGHT(txt;8)="ANEXADOS";178;
+    fim_19="CIDADANIA HONORÁRIA";180;
+    RIGHT(txt;18)="CALAMIDADE PÚBLICA";181;
+    RIGHT(txt;21)="LICENÇA AO GOVERNADOR";182
+    );
+    TRUE;''' + LK_PAG_LANCAMENTOS_S + ''');
+
+    ini_25="PROPOSIÇÕES NÃO RECEBIDAS";238;
+
+    ini_25="RECEBIMENTO DE PROPOSIÇÃO";339;
+    LEFT(txt;23)="DESIGNAÇÃO DE RELATORIA";343;
+    ini_25="CUMPRIMENTO DE DILIGÊNCIA";346;
+    LEFT(txt;33)="REUNIÃO ORIGINADA DE REQUERIMENTO";350;
+    LEFT(txt;32)="REUNIÃO COM DEBATE DE PROPOSIÇÃO";351;
+    txt="PAUTA COMPLETA DE REUNIÃO COM DEBATE DE PROPOSIÇÃO";352;
+    txt="RESULTADO COMPLETO DE REUNIÃO COM DEBATE DE PROPOSIÇÃO";353;
+    txt="CONGRATULAÇÕES ENTREGUES EM REUNIÃO";328;
+    txt="ENTREGA DE DIPLOMA";328;
+    LEFT(txt;16)="CONSULTA PÚBLICA";356;
+
+    ''' + COND_COMISSAO + ''';SWITCH(MID(txt;13;12);
+    "CONSTITUIÇÃO";366;
+    "FISCALIZAÇÃO";371;
+    "PARTICIPAÇÃO";376;
+    IFS(
+    MID(txt;13;7)="REDAÇÃO";378;
+    MID(txt;11;8)="ESPECIAL";380;
+    TRUE;356));
+
+    TRUE;''' + LK_PAG_LANCAMENTOS_S + '''
+
+    ));
+    ''' + LINK_PAG_MANUAL_S + ''')'''
+
+# Q2:Y4 — datas do Diário/de hoje/do extra e seus formatos de texto (célula, valor), iguais em toda aba
+BLOCO_DATAS = (
+    ("Q2", "=B6"),
+    ("Q3", "=TODAY()"),
+    ("Q4", '=QUERY(C6:G8;"SELECT E WHERE C MATCHES \'.*DIÁRIO DO LEGISLATIVO.*\'";0)'),
+    ("S2", '=TEXT(Q2;"\'dd\' \'mm\' \'yyyy\'")'),
+    ("S3", '=TEXT(Q3;"\'d\' \'MM\' yyyy")'),
+    ("S4", '=TEXT(Q4;"\'dd\' \'mm\' \'yyyy\'")'),
+    ("T2", '=TEXT(Q2;"\'d\' \'m\' \'yyyy\'")'),
+    ("T3", '=TEXT(Q3;"\'d\' \'m\' \'yyyy\'")'),
+    ("T4", '=TEXT(Q4;"\'d\' \'m\' \'yyyy\'")'),
+    ("U2", '=TEXT(Q2;"yyyymmdd")'),
+    ("U3", '=TEXT(Q3;"yyyymmdd")'),
+    ("U4", '=TEXT(Q4;"yyyymmdd")'),
+    ("V2", '=TEXT(Q2;"yyyy-mm-dd")'),
+    ("V3", '=TEXT(Q3;"yyyy-mm-dd")'),
+    ("V4", '=TEXT(Q4;"yyyy-mm-dd")'),
+    ("W2", '=TEXT(Q2;"dd mm yyyy")'),
+    ("W3", '=IFERROR(QUERY(C6:G13;"SELECT E WHERE C MATCHES \'.*DIÁRIO DO LEGISLATIVO - EDIÇÃO EXTRA.*\'";0);"SEM EXTRA")'),
+    ("W4", '=IFERROR(TEXT(INDEX(B:B;MATCH("REQUERIMENTOS DE COMISSÕES"; C:C; 0));"dd mm yyyy");"")'),
+    ("X3", '=IFERROR(TEXT(INDEX(B:B;MATCH("REQUERIMENTOS DE COMISSÕES"; C:C; 0));"d m yyyy");"")'),
+    ("X4", '=IFERROR(TEXT(INDEX(B:B;MATCH("REQUERIMENTOS DE COMISSÕES"; C:C; 0));"dd/MM/yyyy");"")'),
+    ("Y2", "REUNIÃO"),
+    ("Y3", "EXTRA"),
+    ("Y4", "RQC"),
+)
+
 SHEET_ID = None
 
 def main(entrada_override=None, spreadsheet_url_or_id=None, auth_mode="colab", sa_info=None):
@@ -367,14 +1431,12 @@ def main(entrada_override=None, spreadsheet_url_or_id=None, auth_mode="colab", s
         diario = yyyymmdd_to_ddmmyyyy(yyyymmdd)      # data de Diário (PLANILHA)
 
         # --- DIÁRIO - 2 dias úteis ---
-        import datetime as dt
-
-        dl_date = dt.datetime.strptime(yyyymmdd, "%Y%m%d").date()
+        dl_date = datetime.strptime(yyyymmdd, "%Y%m%d").date()
 
         d = dl_date
         count = 0
         while count < 2:
-            d = d - dt.timedelta(days=1)
+            d = d - timedelta(days=1)
             # regra simples: segunda–sexta
             if d.weekday() < 5:
                 count += 1
@@ -425,19 +1487,21 @@ def main(entrada_override=None, spreadsheet_url_or_id=None, auth_mode="colab", s
 
 
     def primeira_pagina_num(linhas: list[str], fallback: int) -> int:
-        for ln in linhas[:220]:
-            m = RE_PAG.search(ln)
-            if m:
-                return int(m.group(1))
-        return fallback
+        # uma busca só sobre as 220 linhas juntas; o separador \x00 não é espaço (\s) nem letra, então nenhum
+        # "PÁGINA" casa com um número da linha seguinte e o primeiro achado é o mesmo da busca linha a linha
+        m = RE_PAG.search("\x00".join(linhas[:220]))
+        return int(m.group(1)) if m else fallback
 
 
-    @lru_cache(maxsize=20000)
+    # bytes ASCII fora de 0-9/A-Z (saem todos num bytes.translate só)
+    FORA_DA_CHAVE = bytes(c for c in range(128) if not (48 <= c <= 57 or 65 <= c <= 90))
+
+    @lru_cache(maxsize=65536)
     def compact_key(s: str) -> str:
-        u = s.upper()
-        u = unicodedata.normalize("NFD", u)
-        u = "".join(ch for ch in u if unicodedata.category(ch) != "Mn")
-        return re.sub(r"[^0-9A-Z]", "", u)
+        # NFD separa os acentos; o encode ASCII descarta os acentos (e o que mais não for ASCII, que nunca
+        # sobraria em 0-9/A-Z) e o translate tira o resto: tudo em C, sem laço Python por caractere
+        u = unicodedata.normalize("NFD", s.upper()).encode("ascii", "ignore")
+        return u.translate(None, FORA_DA_CHAVE).decode("ascii")
 
 
     # ---- TOP detection (robusta) ----
@@ -460,64 +1524,59 @@ def main(entrada_override=None, spreadsheet_url_or_id=None, auth_mode="colab", s
         return bool(re.search(r"[A-Za-zÀ-ÿ0-9]", s))
 
 
-    def is_top_event(line_idx: int, linhas: list[str]) -> bool:
-        for prev in linhas[:line_idx]:
-            if _linha_relevante(prev):
-                return False
-        return True
+    def primeira_linha_relevante(linhas: list[str]) -> int:
+        # índice da 1ª linha relevante da página (len(linhas) se não houver); calculado uma vez por página
+        return next((j for j, ln in enumerate(linhas) if _linha_relevante(ln)), len(linhas))
+
+
+    def is_top_event(line_idx: int, primeira_relevante: int) -> bool:
+        # topo = nenhuma linha relevante antes desta
+        return line_idx <= primeira_relevante
 
 
     # ---- helper: matching por janela (1–3 linhas) ----
-    def win_keys(linhas: list[str], i: int, w: int) -> str:
-        parts = []
-        for k in range(w):
-            j = i + k
-            if j < len(linhas):
-                parts.append(compact_key(linhas[j]))
-        return "".join(parts)
+    # chaves = [compact_key(ln) for ln in linhas], calculadas uma vez por página: a janela só concatena
+    def win_keys(chaves: list[str], i: int, w: int) -> str:
+        return "".join(chaves[i:i + w])
 
 
-    def win_any_in(linhas: list[str], i: int, keys: set[str]) -> bool:
-        k1 = win_keys(linhas, i, 1)
-        k2 = win_keys(linhas, i, 2)
-        k3 = win_keys(linhas, i, 3)
+    def win_any_in(chaves: list[str], i: int, keys: set[str]) -> bool:
+        k1 = chaves[i]
+        k2 = win_keys(chaves, i, 2)
+        k3 = win_keys(chaves, i, 3)
         return (k1 in keys) or (k2 in keys) or (k3 in keys)
 
 
-    def _checkbox_req(sheet_id: int, col_idx_0based: int, row_1based: int, default_checked: bool = False):
+    # regra de checkbox compartilhada por todos os requests (_juntar_validacoes agrupa pela identidade da regra)
+    REGRA_CHECKBOX = {"condition": {"type": "BOOLEAN"}, "strict": True, "showCustomUi": True}
+
+    def _checkbox_req(sheet_id: int, col_idx_0based: int, row_1based: int, default_checked: bool = False,
+                      row_fim_1based: int | None = None):
         """
         Cria checkbox (data validation BOOLEAN) e define o valor padrão (TRUE/FALSE).
+        Com row_fim_1based, cobre as linhas row_1based..row_fim_1based com os mesmos 2 requests.
         Retorna uma lista de requests para batch_update.
         """
         val = {"boolValue": True} if default_checked else {"boolValue": False}
+        rng = {
+            "sheetId": sheet_id,
+            "startRowIndex": row_1based - 1,
+            "endRowIndex": row_fim_1based or row_1based,
+            "startColumnIndex": col_idx_0based,
+            "endColumnIndex": col_idx_0based + 1,
+        }
 
         dv = {
             "setDataValidation": {
-                "range": {
-                    "sheetId": sheet_id,
-                    "startRowIndex": row_1based - 1,
-                    "endRowIndex": row_1based,
-                    "startColumnIndex": col_idx_0based,
-                    "endColumnIndex": col_idx_0based + 1,
-                },
-                "rule": {
-                    "condition": {"type": "BOOLEAN"},
-                    "strict": True,
-                    "showCustomUi": True,
-                },
+                "range": rng,
+                "rule": REGRA_CHECKBOX,
             }
         }
 
         setv = {
-            "updateCells": {
-                "range": {
-                    "sheetId": sheet_id,
-                    "startRowIndex": row_1based - 1,
-                    "endRowIndex": row_1based,
-                    "startColumnIndex": col_idx_0based,
-                    "endColumnIndex": col_idx_0based + 1,
-                },
-                "rows": [{"values": [{"userEnteredValue": val}]}],
+            "repeatCell": {
+                "range": dict(rng),
+                "cell": {"userEnteredValue": val},
                 "fields": "userEnteredValue",
             }
         }
@@ -610,6 +1669,8 @@ def main(entrada_override=None, spreadsheet_url_or_id=None, auth_mode="colab", s
         C_SUSPENSAO_REUNIAO, 
         C_REABERTURA_REUNIAO, 
         C_REGISTRO_PRESENCA,}
+    # tupla para um único startswith (em C) por linha; mais longos primeiro: "ATAS" vence "ATA"
+    CUT_KEYS_PREFIXOS = tuple(sorted(CUT_KEYS, key=len, reverse=True))
 
     # CUTS DE CONTEXTO
     C_TRAMITACAO = "TRAMITACAODEPROPOSICOES"
@@ -625,6 +1686,7 @@ def main(entrada_override=None, spreadsheet_url_or_id=None, auth_mode="colab", s
     C_PEC = "PROPOSTADEEMENDAACONSTITUICAO"
     C_PROJETO_DE_LEI = "PROJETODELEI"
     C_PROJETOS_DE_LEI = "PROJETOSDELEI"
+    PL_KEYS = (C_PROJETO_DE_LEI, C_PROJETOS_DE_LEI)
     C_REQUERIMENTOS = "REQUERIMENTOS"
     C_PARECER_PARA = "PARECERPARA"
     C_PARECER_SOBRE_VETO = "PARECERSOBREOVETO"
@@ -704,18 +1766,20 @@ def main(entrada_override=None, spreadsheet_url_or_id=None, auth_mode="colab", s
         texto = page.extract_text(extraction_mode="layout") or page.extract_text() or ""
         linhas = [limpa_linha(x) for x in texto.splitlines() if limpa_linha(x)]
         pag_num = primeira_pagina_num(linhas, i + 1)
+        primeira_relevante = primeira_linha_relevante(linhas)
+        chaves = [compact_key(ln) for ln in linhas]
 
         for li, ln in enumerate(linhas):
             ln_up = ln.upper().strip()
-            c = compact_key(ln)
-            top_flag = is_top_event(li, linhas)
+            c = chaves[li]
+            top_flag = is_top_event(li, primeira_relevante)
             if C_PARTE_ORDEM_DIA in c:
                 top_flag = True
 
             # janela compactada (p/ títulos quebrados)
-            k1 = win_keys(linhas, li, 1)
-            k2 = win_keys(linhas, li, 2)
-            k3 = win_keys(linhas, li, 3)
+            k1 = c
+            k2 = win_keys(chaves, li, 2)
+            k3 = win_keys(chaves, li, 3)
 
             w1 = " ".join(linhas[li:li+1]).strip()
             w2 = " ".join(linhas[li:li+2]).strip()
@@ -736,9 +1800,8 @@ def main(entrada_override=None, spreadsheet_url_or_id=None, auth_mode="colab", s
             cut_real = None
 
             for kk in (c, k1, k2, k3):
-                achado = next((x for x in CUT_KEYS if kk == x or kk.startswith(x)), None)
-                if achado:
-                    cut_real = achado
+                if kk.startswith(CUT_KEYS_PREFIXOS):
+                    cut_real = next(x for x in CUT_KEYS_PREFIXOS if kk.startswith(x))
                     break
 
             if cut_real:
@@ -808,9 +1871,9 @@ def main(entrada_override=None, spreadsheet_url_or_id=None, auth_mode="colab", s
             # ---------------------------
             if apresentacao_ativa or in_tramitacao:
                 has_pl = (
-                    (is_all_caps_text(w1) and (k1.startswith(C_PROJETO_DE_LEI) or k1.startswith(C_PROJETOS_DE_LEI))) or
-                    (is_all_caps_text(w2) and (k2.startswith(C_PROJETO_DE_LEI) or k2.startswith(C_PROJETOS_DE_LEI))) or
-                    (is_all_caps_text(w3) and (k3.startswith(C_PROJETO_DE_LEI) or k3.startswith(C_PROJETOS_DE_LEI)))
+                    (is_all_caps_text(w1) and k1.startswith(PL_KEYS)) or
+                    (is_all_caps_text(w2) and k2.startswith(PL_KEYS)) or
+                    (is_all_caps_text(w3) and k3.startswith(PL_KEYS))
                 )
 
                 has_pec = (
@@ -1358,18 +2421,54 @@ def main(entrada_override=None, spreadsheet_url_or_id=None, auth_mode="colab", s
         }
 
 
+    # quota (429) e falhas passageiras do servidor: repetem; qualquer outro erro sobe na hora
+    STATUS_REPETIVEIS = {429, 500, 502, 503, 504}
+
     def _with_backoff(fn, *args, **kwargs):
         for attempt in range(8):
             try:
                 return fn(*args, **kwargs)
-            except Exception as e:
-                msg = str(e)
-                if ("429" in msg) or ("Quota exceeded" in msg) or ("Rate Limit" in msg) or ("503" in msg):
-                    sleep_s = min(60, (2**attempt) + random.random())
-                    print(f"[backoff] tentativa {attempt+1}/8 – esperando {sleep_s:.1f}s por quota...")
-                    time.sleep(sleep_s)
-                    continue
-                raise
+            except gspread.exceptions.APIError as e:
+                status = getattr(getattr(e, "response", None), "status_code", None)
+                if status not in STATUS_REPETIVEIS or attempt == 7:
+                    raise
+                sleep_s = min(60, (2**attempt) + random.random())
+                print(f"[backoff] tentativa {attempt+1}/8 – HTTP {status}, esperando {sleep_s:.1f}s...")
+                time.sleep(sleep_s)
+
+    def _json_bytes(obj) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(obj)
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    LIMITE_BATCH_BYTES = 2_000_000  # por chamada; bem abaixo do teto de payload da API
+    JSON_HEADERS = {"Content-Type": "application/json; charset=UTF-8"}
+
+    def _batch_update_compacto(sh, reqs: list):
+        # mesmo endpoint do sh.batch_update, mas cada request é serializado UMA vez e sem espaços;
+        # se o total passar de LIMITE_BATCH_BYTES, vai em lotes sequenciais (a ordem dos requests é mantida).
+        # o backoff é por lote: repetir um lote já aplicado duplicaria addConditionalFormatRule
+        url = SPREADSHEET_BATCH_UPDATE_URL % sh.id
+
+        def _envia(partes):
+            payload = b'{"requests":[' + b",".join(partes) + b"]}"
+            return _with_backoff(sh.client.request, "post", url, data=payload, headers=JSON_HEADERS)
+
+        lote, tam = [], 0
+        for parte in (_json_bytes(r) for r in reqs):
+            if lote and tam + len(parte) > LIMITE_BATCH_BYTES:
+                _envia(lote)
+                lote, tam = [], 0
+            lote.append(parte)
+            tam += len(parte) + 1
+        if lote:
+            _envia(lote)
+
+    def _values_batch_update_compacto(sh, body: dict):
+        # values:batchUpdate com o corpo já em bytes (orjson quando instalado), sem passar pelo json do requests;
+        # regravar valores é idempotente, então o backoff pode repetir a chamada inteira
+        url = SPREADSHEET_VALUES_BATCH_UPDATE_URL % sh.id
+        return _with_backoff(sh.client.request, "post", url, data=_json_bytes(body), headers=JSON_HEADERS)
 
 
     # ====================================================================================================================================================================================================
@@ -1544,8 +2643,6 @@ def main(entrada_override=None, spreadsheet_url_or_id=None, auth_mode="colab", s
     # ====================================================================================================================================================================================================
     # ============================================================================================ FUNCTIONS =============================================================================================
     # ====================================================================================================================================================================================================
-    from datetime import datetime, timedelta
-
     def aba_key_from_diario_key(diario_key: str) -> str:
         d = datetime.strptime(diario_key, "%Y%m%d").date()
         if d.weekday() == 5:  # sábado -> segunda
@@ -1565,7 +2662,18 @@ def main(entrada_override=None, spreadsheet_url_or_id=None, auth_mode="colab", s
         sh = gc.open_by_url(spreadsheet_url_or_id) if spreadsheet_url_or_id.startswith("http") else gc.open_by_key(spreadsheet_url_or_id)
 
         # cria sempre uma nova aba; se o nome já existir, adiciona sufixo (1), (2), ...
-        existing_titles = {w.title for w in sh.worksheets()}
+        abas = sh.worksheets()
+        existing_titles = {w.title for w in abas}
+
+        # aba oculta das tabelas de consulta (XLOOKUP da coluna A): criada só na primeira vez;
+        # o conteúdo é regravado a cada execução junto com os demais valores
+        ws_lk = next((w for w in abas if w.title == ABA_LK), None)
+        if ws_lk is None:
+            _with_backoff(sh.batch_update, {"requests": [{"addSheet": {"properties": {
+                "title": ABA_LK, "hidden": True,
+                "gridProperties": {"rowCount": LK_LINHAS, "columnCount": LK_COLUNAS}}}}]})
+        elif ws_lk.row_count < LK_LINHAS or ws_lk.col_count < LK_COLUNAS:
+            _with_backoff(ws_lk.resize, rows=max(ws_lk.row_count, LK_LINHAS), cols=max(ws_lk.col_count, LK_COLUNAS))
 
         base_tab_name = tab_name
         final_tab_name = base_tab_name
@@ -1575,36 +2683,7 @@ def main(entrada_override=None, spreadsheet_url_or_id=None, auth_mode="colab", s
             final_tab_name = f"{base_tab_name} ({i})"
             i += 1
 
-        ws = sh.add_worksheet(
-            title=final_tab_name,
-            rows=max(20, 20 + len(itens)),
-            cols=25
-        )
-        _with_backoff(ws.update_index, 1)
-
-        tab_name = final_tab_name
-        sheet_id = ws.id
-
-        print("DEBUG ABA BASE:", base_tab_name)
-        print("DEBUG ABA FINAL:", final_tab_name)
-        print("DEBUG SHEET ID:", sheet_id)
-
-        try:
-            import streamlit as st
-            st.write("DEBUG ABA BASE:", base_tab_name)
-            st.write("DEBUG ABA FINAL:", final_tab_name)
-            st.write("DEBUG SHEET ID:", sheet_id)
-        except Exception:
-            pass
-
-        # --- GUARDA-CHUVA: garante grid mínimo antes de qualquer merge/unmerge ---
-        MIN_ROWS = 1
-        MIN_COLS = 25
-
-        if ws.row_count < MIN_ROWS or ws.col_count < MIN_COLS:
-            _with_backoff(ws.resize, rows=max(ws.row_count, MIN_ROWS), cols=max(ws.col_count, MIN_COLS))
-
-        # resize da planilha (linhas e colunas) — agora considera EXTRAS também
+        # tamanho da planilha (linhas e colunas) — considera EXTRAS também
         extras = [
             ['=TEXT(A5;"dd/mm/yyyy")', '=HYPERLINK("https://www.almg.gov.br/atividade-parlamentar/plenario/agenda/"; "REUNIÕES DE PLENÁRIO")'],
             ["", ""],
@@ -1617,44 +2696,52 @@ def main(entrada_override=None, spreadsheet_url_or_id=None, auth_mode="colab", s
             ['=TEXT(A5;"dd/mm/yyyy")', '=HYPERLINK("https://webmail.almg.gov.br/"; "CADASTRO DE E-MAILS")'],
             ["-", "DROPDOWN_4"],   # <- linha do dropdown 4 (coluna C)
             ['=TEXT(A5;"dd/mm/yyyy")', '=HYPERLINK("https://consulta-brs.almg.gov.br/brs/"; "IMPLANTAÇÃO DE TEXTOS")'],
-            ["", '=SUM(INDIRECT("B"&ROW());INDIRECT("E"&ROW());INDIRECT("F"&ROW());INDIRECT("G"&ROW()))'],   # <- linha da implantação de textos
         ]
 
-        # o que realmente vai aparecer na planilha (troca DROPDOWN_x por "-")
-        extras_out = [[b, ("-" if str(c).startswith("DROPDOWN_") else c)] for b, c in extras]
-
         itens_len = len(itens) if itens else 0
         start_extra_row = 9 + itens_len + (1 if itens_len == 0 else 0)
 
+        # linha da implantação de textos: a soma aponta direto para a própria linha (sem INDIRECT volátil)
+        r_impl = start_extra_row + len(extras)
+        extras.append(["", f"=SUM(B{r_impl};E{r_impl};F{r_impl};G{r_impl})"])
+
+        # o que realmente vai aparecer na planilha (troca DROPDOWN_x por "-")
+        extras_out = [[b, ("-" if str(c).startswith("DROPDOWN_") else c)] for b, c in extras]
+
         footer_rows = 9  # RODAPÉ: quantidade de linhas reservadas
         rows_needed = 9 + itens_len + len(extras) + footer_rows - 1
-        cols_needed = 25
+        cols_needed = 30  # A..Y + Z:AD (auxiliares ocultas: datas, classe/idTipo/idCom/triagem das linhas)
 
         MIN_ROWS = 1
         MIN_COLS = 25
 
-        rows_target = max(ws.row_count, rows_needed + 1, MIN_ROWS)
-        cols_target = max(ws.col_count, cols_needed, MIN_COLS)
+        # a aba já nasce com o grid final (antes: add_worksheet 20+itens x 25 e depois um resize à parte)
+        rows_target = max(20 + itens_len, rows_needed + 1, MIN_ROWS)
+        cols_target = max(cols_needed, MIN_COLS)
+
+        ws = sh.add_worksheet(
+            title=final_tab_name,
+            rows=rows_target,
+            cols=cols_target
+        )
+        _with_backoff(ws.update_index, 1)
+
+        tab_name = final_tab_name
+        sheet_id = ws.id
 
-        _with_backoff(ws.resize, rows=rows_target, cols=cols_target)
+        print("DEBUG ABA BASE:", base_tab_name)
+        print("DEBUG ABA FINAL:", final_tab_name)
+        print("DEBUG SHEET ID:", sheet_id)
 
-        VIS_LAST_ROW_1BASED = rows_target - 1  # última linha "visível" (a última é técnica 1px)
+        try:
+            import streamlit as st
+            st.write("DEBUG ABA BASE:", base_tab_name)
+            st.write("DEBUG ABA FINAL:", final_tab_name)
+            st.write("DEBUG SHEET ID:", sheet_id)
+        except Exception:
+            pass
 
-        # linha técnica (1px) — NÃO usa reqs aqui (reqs ainda não existe neste ponto)
-        _with_backoff(sh.batch_update, {
-            "requests": [{
-                "updateDimensionProperties": {
-                    "range": {
-                        "sheetId": sheet_id,
-                        "dimension": "ROWS",
-                        "startIndex": rows_target - 1,
-                        "endIndex": rows_target
-                    },
-                    "properties": {"pixelSize": 1},
-                    "fields": "pixelSize"
-                }
-            }]
-        })
+        VIS_LAST_ROW_1BASED = rows_target - 1  # última linha "visível" (a última é técnica 1px)
 
         # ====================================================================================================================================================================================================
         # ============================================================================================ REQUESTS ==============================================================================================
@@ -1707,7 +2794,7 @@ def main(entrada_override=None, spreadsheet_url_or_id=None, auth_mode="colab", s
                     "sheetId": sheet_id,
                     "dimension": "COLUMNS",
                     "startIndex": 19,   # T
-                    "endIndex": 25      # Y (exclusivo)
+                    "endIndex": 30      # AD (exclusivo) — inclui Z:AD (auxiliares ocultas)
                 },
                 "properties": {
                     "hiddenByUser": True
@@ -2078,24 +3165,37 @@ def main(entrada_override=None, spreadsheet_url_or_id=None, auth_mode="colab", s
             "PREJUDICADOS",
         ]
 
-        def _dv_req(col0: int, row1: int, values_list: list[str], strict: bool = False):
+        # regras ONE_OF_LIST montadas uma vez por (lista, strict) e reaproveitadas por referência
+        # (ninguém altera essas regras depois de montadas; o json.dumps não liga para aliasing)
+        _DD_RULES = {}
+
+        def _dd_rule(values_list: list[str], strict: bool = False) -> dict:
+            key = (tuple(values_list), strict)
+            rule = _DD_RULES.get(key)
+            if rule is None:
+                rule = _DD_RULES[key] = {
+                    "condition": {
+                        "type": "ONE_OF_LIST",
+                        "values": [{"userEnteredValue": v} for v in values_list],
+                    },
+                    "strict": strict,
+                    "showCustomUi": True,
+                }
+            return rule
+
+        def _dv_req(col0: int, row1: int, values_list: list[str], strict: bool = False,
+                    col0_fim: int | None = None, row1_fim: int | None = None):
+            # col0_fim/row1_fim (inclusivos): a mesma lista num bloco de células, num request só
             return {
                 "setDataValidation": {
                     "range": {
                         "sheetId": sheet_id,
                         "startRowIndex": row1 - 1,
-                        "endRowIndex": row1,
+                        "endRowIndex": row1_fim or row1,
                         "startColumnIndex": col0,
-                        "endColumnIndex": col0 + 1,
-                    },
-                    "rule": {
-                        "condition": {
-                            "type": "ONE_OF_LIST",
-                            "values": [{"userEnteredValue": v} for v in values_list],
-                        },
-                        "strict": strict,
-                        "showCustomUi": True,
+                        "endColumnIndex": (col0 if col0_fim is None else col0_fim) + 1,
                     },
+                    "rule": _dd_rule(values_list, strict),
                 }
             }
 
@@ -2161,25 +3261,6 @@ def main(entrada_override=None, spreadsheet_url_or_id=None, auth_mode="colab", s
                 }
             }
 
-        def _set_value_req(col0: int, row1: int, value: str):
-            return {
-                "updateCells": {
-                    "range": {
-                        "sheetId": sheet_id,
-                        "startRowIndex": row1 - 1,
-                        "endRowIndex": row1,
-                        "startColumnIndex": col0,
-                        "endColumnIndex": col0 + 1,
-                    },
-                    "rows": [{
-                        "values": [{
-                            "userEnteredValue": {"stringValue": value}
-                        }]
-                    }],
-                    "fields": "userEnteredValue",
-                }
-            }
-
         # ---------------------------
         # DROPDOWN 1 (BLOCO PRINCIPAL)
         # ---------------------------
@@ -2210,22 +3291,17 @@ def main(entrada_override=None, spreadsheet_url_or_id=None, auth_mode="colab", s
         end_items_row   = start_extra_row - 1
 
         if end_items_row >= start_items_row:
-            for row1 in range(start_items_row, end_items_row + 1):
-
-                # coluna F (dropdown + ?)
-                reqs.append(_dv_req(5, row1, LISTA_DROPDOWN_5, strict=False))
-                reqs.append(_set_value_req(5, row1, "?"))
-                
-                # coluna G (dropdown + ?)
-                reqs.append(_dv_req(6, row1, LISTA_DROPDOWN_5, strict=False))
-                reqs.append(_set_value_req(6, row1, "?"))
-                
-                # coluna H (SÓ ? — SEM dropdown)
-                reqs.append(_set_value_req(7, row1, "?"))  # 7 = H
-                
-                # coluna I (checkbox) — só itens
-                for req in _checkbox_req(sheet_id, 8, row1, default_checked=False):  # 8 = I
-                    reqs.append(req)
+            # F:H = "?" em todas as linhas de itens: um repeatCell só, em vez de um updateCells por célula
+            reqs.append({"repeatCell": {
+                "range": {"sheetId": sheet_id, "startRowIndex": start_items_row - 1, "endRowIndex": end_items_row, "startColumnIndex": 5, "endColumnIndex": 8},
+                "cell": {"userEnteredValue": {"stringValue": "?"}},
+                "fields": "userEnteredValue"}})
+
+            # colunas F e G (dropdown) em todas as linhas de itens num request; H fica só com "?" — SEM dropdown
+            reqs.append(_dv_req(5, start_items_row, LISTA_DROPDOWN_5, strict=False, col0_fim=6, row1_fim=end_items_row))
+
+            # coluna I (checkbox) — só itens: validação + valor FALSE, 2 requests para o bloco todo
+            reqs.extend(_checkbox_req(sheet_id, 8, start_items_row, default_checked=False, row_fim_1based=end_items_row))  # 8 = I
 
         # ---------------------------
         # DROPDOWNS NOS EXTRAS
@@ -2271,8 +3347,7 @@ def main(entrada_override=None, spreadsheet_url_or_id=None, auth_mode="colab", s
                 "IMPLANTAÇÃO DE TEXTOS",
             )
             if c and any(t in c.upper() for t in CHECKBOX_TITLES):
-                for req in _checkbox_req(sheet_id, 7, r, default_checked=False):  # 7 = H
-                    reqs.append(req)
+                reqs.extend(_checkbox_req(sheet_id, 7, r, default_checked=False))  # 7 = H
 
         # styles
         for a1, mini in STYLES:
@@ -2280,8 +3355,7 @@ def main(entrada_override=None, spreadsheet_url_or_id=None, auth_mode="colab", s
 
         # CHECKBOX FIXO NA BARRA DO TÍTULO (H6 e H8)
         for rr in (6, 8):
-            for req in _checkbox_req(sheet_id, 7, rr, default_checked=False):  # 7 = H
-                reqs.append(req)
+            reqs.extend(_checkbox_req(sheet_id, 7, rr, default_checked=False))  # 7 = H
 
         # OVERRIDE: checkbox H6/H8 com o mesmo tamanho dos outros (fonte 6)
         for r in (6, 8):
@@ -2353,599 +3427,303 @@ def main(entrada_override=None, spreadsheet_url_or_id=None, auth_mode="colab", s
         footer_rows = 9
         footer_end  = footer_start + footer_rows - 1
 
-        r  = footer_start
-        r1 = footer_start + 1
-        r2 = footer_start + 2
-        r3 = footer_start + 3
-        r4 = footer_start + 4
-        r5 = footer_start + 5
-        r6 = footer_start + 6
-        r7 = footer_start + 7
-        r8 = footer_start + 8
-
-        # -------------------------------------------------------------------------------------------------------------------------------------------------
-        # -------------------------------------------------------------------- VALUES ---------------------------------------------------------------------
-        # -------------------------------------------------------------------------------------------------------------------------------------------------
-        reqs.append({"updateCells": {
-                "range": {"sheetId": sheet_id, "startRowIndex": r - 1,  "endRowIndex": r,  "startColumnIndex": 1,  "endColumnIndex": 2},  # B
-                "rows": [{"values": [{"userEnteredValue": {"formulaValue": '=HYPERLINK("http://meet.google.com/api-pefj-mvq";"GDI-GGA")'}}]}],
-                "fields": "userEnteredValue"}})
-
-        reqs.append({"updateCells": {
-                "range": {"sheetId": sheet_id, "startRowIndex": r1 - 1, "endRowIndex": r1, "startColumnIndex": 0,  "endColumnIndex": 1},  # A
-                "rows": [{"values": [{"userEnteredValue": {"formulaValue": '=HYPERLINK("https://mediaserver.almg.gov.br/acervo/511/376/2511376.pdf";IMAGE("https://cdn-icons-png.flaticon.com/512/3079/3079014.png";4;19;19))'}}]}],
-                "fields": "userEnteredValue"}})
-
-        reqs.append({"updateCells": {
-                "range": {"sheetId": sheet_id, "startRowIndex": r1 - 1, "endRowIndex": r1, "startColumnIndex": 1,  "endColumnIndex": 2},  # B
-                "rows": [{"values": [{"userEnteredValue": {"formulaValue": '=HYPERLINK("https://intra.almg.gov.br/export/sites/default/atendimento/docs/lista-telefonica.pdf";IMAGE("https://cdn-icons-png.flaticon.com/512/4783/4783130.png";4;33;33))'}}]}],
-                "fields": "userEnteredValue"}})
-
-        reqs.append({"updateCells": {
-                "range": {"sheetId": sheet_id, "startRowIndex": r1 - 1, "endRowIndex": r1, "startColumnIndex": 2,  "endColumnIndex": 3},  # C
-                "rows": [{"values": [{"userEnteredValue": {"formulaValue": '=HYPERLINK("https://sites.google.com/view/gga-gdi-almg/";IMAGE("https://yt3.ggpht.com/ytc/AKedOLS-fgkzGxYUBgBejVblA1CLhE69pbiZyoH7spcNRQ=s900-c-k-c0x00ffffff-no-rj";4;112;125))'}}]}],
-                "fields": "userEnteredValue"}})
-
-        reqs.append({"updateCells": {
-                "range": {"sheetId": sheet_id, "startRowIndex": r1 - 1, "endRowIndex": r1, "startColumnIndex": 4,  "endColumnIndex": 5},  # E
-                "rows": [{"values": [{"userEnteredValue": {"formulaValue": '=SUM(FILTER(INDIRECT("F"&ROW()+1&":F");INDIRECT("E"&ROW()+1&":E")<>""))'}}]}],
-                "fields": "userEnteredValue"}})
-
-        reqs.append({"updateCells": {
-                "range": {"sheetId": sheet_id, "startRowIndex": r1 - 1, "endRowIndex": r1, "startColumnIndex": 5,  "endColumnIndex": 6},  # F
-                "rows": [{"values": [{"userEnteredValue": {"stringValue": "TOTAL"}}]}],
-                "fields": "userEnteredValue"}})
-
-        reqs.append({"repeatCell": {
-                "range": {"sheetId": sheet_id, "startRowIndex": r2 - 1, "endRowIndex": r6, "startColumnIndex": 5, "endColumnIndex": 6},  # F (hyperlink)
-                "cell": {"userEnteredValue": {"formulaValue": '=SUMIFS(INDEX(H:H;ROW()):INDEX(H:H;ROW()+6);INDEX(G:G;ROW()):INDEX(G:G;ROW()+6);INDEX(E:E;ROW()))+SUMIFS(INDEX(K:K;ROW()):INDEX(K:K;ROW()+6);INDEX(I:I;ROW()):INDEX(I:I;ROW()+6);INDEX(E:E;ROW()))'}},
-                "fields": "userEnteredValue"}})
-
-        reqs.append({"updateCells": {
-                "range": {"sheetId": sheet_id, "startRowIndex": r1 - 1, "endRowIndex": r1, "startColumnIndex": 6,  "endColumnIndex": 7},  # G
-                "rows": [{"values": [{"userEnteredValue": {"stringValue": "IMPLANTAÇÃO"}}]}],
-                "fields": "userEnteredValue"}})
-
-        reqs.append({"updateCells": {
-                "range": {"sheetId": sheet_id, "startRowIndex": r1 - 1, "endRowIndex": r1, "startColumnIndex": 7,  "endColumnIndex": 8},  # H (ícone)
-                "rows": [{"values": [{"userEnteredValue": {"formulaValue": '=IMAGE("https://encrypted-tbn0.gstatic.com/images?q=tbn:ANd9GcRYV-RpYwK3orapycj_CXJGevAVSORX9_E2jUYZLgID8L3bLwfSRXMX7ksvRTsEEoRBeNE&usqp=CAU";4;17;17)'}}]}],
-                "fields": "userEnteredValue"}})
-        reqs.append({"repeatCell": {
-                "range": {"sheetId": sheet_id, "startRowIndex": r2 - 1, "endRowIndex": r6, "startColumnIndex": 7, "endColumnIndex": 8},  # L (hyperlink)
-                "cell": {"userEnteredValue": {"formulaValue": '=SUMIFS($E$1:INDEX($E:$E;ROW()-1);$F$1:INDEX($F:$F;ROW()-1);INDEX($G:$G;ROW()))'}},
-                "fields": "userEnteredValue"}})
-        reqs.append({"updateCells": {
-                "range": {"sheetId": sheet_id, "startRowIndex": r1 - 1, "endRowIndex": r1, "startColumnIndex": 8,  "endColumnIndex": 9},  # I
-                "rows": [{"values": [{"userEnteredValue": {"stringValue": "CONFERÊNCIA"}}]}],
-                "fields": "userEnteredValue"}})
-
-        reqs.append({"updateCells": {
-                "range": {"sheetId": sheet_id, "startRowIndex": r1 - 1, "endRowIndex": r1, "startColumnIndex": 10, "endColumnIndex": 11},  # K (ícone)
-                "rows": [{"values": [{"userEnteredValue": {"formulaValue": '=IMAGE("https://w7.pngwing.com/pngs/894/494/png-transparent-black-male-symbol-art-avatar-education-professor-user-profile-faculty-boss-face-heroes-service-thumbnail.png";4;17;17)'}}]}],
-
-                "fields": "userEnteredValue"}})
-        reqs.append({"repeatCell": {
-                "range": {"sheetId": sheet_id, "startRowIndex": r2 - 1, "endRowIndex": r6, "startColumnIndex": 10, "endColumnIndex": 11},  # K (hyperlink)
-                "cell": {"userEnteredValue": {"formulaValue": '=SUMIFS($H$6:INDEX($H:$H;ROW()-1);$G$6:INDEX($G:$G;ROW()-1);INDEX($I:$I;ROW()))'}},
-                "fields": "userEnteredValue"}})
-
-        reqs.append({"updateCells": {
-                "range": {"sheetId": sheet_id, "startRowIndex": r1 - 1, "endRowIndex": r1, "startColumnIndex": 11, "endColumnIndex": 12},  # L (ícone)
-                "rows": [{"values": [{"userEnteredValue": {"formulaValue": '=IMAGE("https://encrypted-tbn0.gstatic.com/images?q=tbn:ANd9GcRyxXB7iHrkoP3waMJDQVtKeDlVpA7sno_XMNVpY20s5rmcQyJh")'}}]}],
-                "fields": "userEnteredValue"}})
-
-        reqs.append({"repeatCell": {
-                "range": {"sheetId": sheet_id, "startRowIndex": r2 - 1, "endRowIndex": r8, "startColumnIndex": 11, "endColumnIndex": 12},  # L (hyperlink)
-                "cell": {"userEnteredValue": {"formulaValue": '=HYPERLINK("https://www.almg.gov.br/atividade_parlamentar/tramitacao_projetos/interna.html?a="&INDIRECT("O"&ROW())&"&n="&INDIRECT("N"&ROW())&"&t="&INDIRECT("M"&ROW())&"&aba=js_tabTramitacao";IMAGE("https://seeklogo.com/images/B/bandeira-minas-gerais-logo-AD7B6F3604-seeklogo.com.png";4;14;14))'}},
-                "fields": "userEnteredValue"}})
-
-        reqs.append({"updateCells": {
-                "range": {"sheetId": sheet_id, "startRowIndex": r1 - 1, "endRowIndex": r1, "startColumnIndex": 12, "endColumnIndex": 13},  # M
-                "rows": [{"values": [{"userEnteredValue": {"stringValue": "PROPOSIÇÕES RELEVANTES"}}]}],
-                "fields": "userEnteredValue"}})
-
-        reqs.append({"updateCells": {
-                "range": {"sheetId": sheet_id, "startRowIndex": r1 - 1, "endRowIndex": r1, "startColumnIndex": 15, "endColumnIndex": 16},  # P
-                "rows": [{"values": [{"userEnteredValue": {"formulaValue": '=HYPERLINK("https://dspace.almg.gov.br/server/api/core/bitstreams/7cd591b0-1a2c-41cc-9341-78919e827df1/content";IMAGE("https://www.almg.gov.br/servicos/biblioteca/livraria-do-legislativo/capas/capa-regimento-interno.png";4;130;140))'}}]}],
-                "fields": "userEnteredValue"}})
-
-        reqs.append({"updateCells": {
-                "range": {"sheetId": sheet_id, "startRowIndex": r1 - 1, "endRowIndex": r1, "startColumnIndex": 17, "endColumnIndex": 18},  # R
-                "rows": [{"values": [{"userEnteredValue": {"formulaValue": '=HYPERLINK("https://www.cbhdoce.org.br/wp-content/uploads/2016/01/ConstituicaoEstadual.pdf";IMAGE("https://encrypted-tbn0.gstatic.com/images?q=tbn:ANd9GcT5c5T7Fvx5UqHvPvb1EWmn6zxEyl9XZua3dQ&s";4;130;140))'}}]}],
-                "fields": "userEnteredValue"}})
-
-        reqs.append({"updateCells": {
-                "range": {"sheetId": sheet_id, "startRowIndex": r1 - 1, "endRowIndex": r1, "startColumnIndex": 19, "endColumnIndex": 20},  # T
-                "rows": [{"values": [{"userEnteredValue": {"formulaValue": '=HYPERLINK("https://www.planalto.gov.br/ccivil_03/constituicao/ConstituicaoCompilado.htm";IMAGE("https://www2.camara.leg.br/atividade-legislativa/legislacao/Constituicoes_Brasileiras/constituicao-cidada/regulamentacao/imagens/copy_of_1.jpg/@@images/8beeb113-f656-495f-9c90-c81fb62a2ebb.jpeg";4;130;125))'}}]}],
-                "fields": "userEnteredValue"}})
-
-        reqs.append({"updateCells": {
-                "range": {"sheetId": sheet_id, "startRowIndex": r1 - 1, "endRowIndex": r1, "startColumnIndex": 21, "endColumnIndex": 22},  # V
-                "rows": [{"values": [{"userEnteredValue": {"formulaValue": '=HYPERLINK("https://dspace.almg.gov.br/server/api/core/bitstreams/7cd591b0-1a2c-41cc-9341-78919e827df1/content";IMAGE("https://www.aracruz.es.leg.br/imagens/PORTLETREGIMENTOINTERNO.png/image_preview";4;130;125))'}}]}],
-                "fields": "userEnteredValue"}})
-
-        reqs.append({"updateCells": {
-                "range": {"sheetId": sheet_id, "startRowIndex": r1 - 1, "endRowIndex": r1, "startColumnIndex": 23, "endColumnIndex": 24},  # X
-                "rows": [{"values": [{"userEnteredValue": {"formulaValue": '=HYPERLINK("https://www.cbhdoce.org.br/wp-content/uploads/2016/01/ConstituicaoEstadual.pdf";IMAGE("https://upload.wikimedia.org/wikipedia/commons/d/d2/Bras%C3%A3o_de_Minas_Gerais.svg"))'}}]}],
-                "fields": "userEnteredValue"}})
-
-        reqs.append({"updateCells": {
-                "range": {"sheetId": sheet_id, "startRowIndex": r3 - 1, "endRowIndex": r3, "startColumnIndex": 0,  "endColumnIndex": 1},  # A
-                "rows": [{"values": [{"userEnteredValue": {"formulaValue": '=HYPERLINK("https://intra.almg.gov.br/acontece/noticias/";IMAGE("https://intra.almg.gov.br/.content/imagens/logo-intra.svg";4;20;75))'}}]}],
-                "fields": "userEnteredValue"}})
-
-        reqs.append({"updateCells": {
-                "range": {"sheetId": sheet_id, "startRowIndex": r6 - 1, "endRowIndex": r6, "startColumnIndex": 0,  "endColumnIndex": 1},  # A
-                "rows": [{"values": [{"userEnteredValue": {"formulaValue": '=HYPERLINK("https://calendar.google.com/calendar/u/0?cid=a3RyajJsZmRwdGpxYTdrczBqNXVhbXBldmdAZ3JvdXAuY2FsZW5kYXIuZ29vZ2xlLmNvbQ";IMAGE("https://cdn-icons-png.flaticon.com/512/217/217837.png";4;18;18))'}}]}],
-                "fields": "userEnteredValue"}})
-
-        reqs.append({"updateCells": {
-                "range": {"sheetId": sheet_id, "startRowIndex": r6 - 1, "endRowIndex": r6, "startColumnIndex": 1,  "endColumnIndex": 2},  # B
-                "rows": [{"values": [{"userEnteredValue": {"formulaValue": '=HYPERLINK("https://ead.almg.gov.br/moodle/";IMAGE("https://ead.almg.gov.br/moodle/pluginfile.php/2/course/section/288/servidor_ALMG.png?time=1657626782411"))'}}]}],
-                "fields": "userEnteredValue"}})
-
-        # ------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
-        # ----------------------------------------------------------------------------------------------- MERGES -----------------------------------------------------------------------------------------------
-        # ------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
-        reqs.append({"mergeCells": {"range": {"sheetId": sheet_id, "startRowIndex": r1 - 1, "endRowIndex": r2, "startColumnIndex": 0, "endColumnIndex": 1}, "mergeType": "MERGE_ALL"}})  # CALENDAR A
-        reqs.append({"mergeCells": {"range": {"sheetId": sheet_id, "startRowIndex": r1 - 1, "endRowIndex": r2, "startColumnIndex": 1, "endColumnIndex": 2}, "mergeType": "MERGE_ALL"}})  # PHONE B
-        reqs.append({"mergeCells": {"range": {"sheetId": sheet_id, "startRowIndex": r3 - 1, "endRowIndex": r5, "startColumnIndex": 0, "endColumnIndex": 2}, "mergeType": "MERGE_ALL"}})  # INTRA A:B
-        reqs.append({"mergeCells": {"range": {"sheetId": sheet_id, "startRowIndex": r6 - 1, "endRowIndex": r8, "startColumnIndex": 0, "endColumnIndex": 1}, "mergeType": "MERGE_ALL"}})  # AGENDA A
-        reqs.append({"mergeCells": {"range": {"sheetId": sheet_id, "startRowIndex": r6 - 1, "endRowIndex": r8, "startColumnIndex": 1, "endColumnIndex": 2}, "mergeType": "MERGE_ALL"}})  # GGA B
-        reqs.append({"mergeCells": {"range": {"sheetId": sheet_id, "startRowIndex": r1 - 1, "endRowIndex": r8, "startColumnIndex": 2, "endColumnIndex": 4}, "mergeType": "MERGE_ALL"}})  # ALMG C:D
-        reqs.append({"mergeCells": {"range": {"sheetId": sheet_id, "startRowIndex": r1 - 1, "endRowIndex": r1, "startColumnIndex": 8,  "endColumnIndex": 10}, "mergeType": "MERGE_ALL"}})  # CONFERÊNCIA (título)
-        reqs.append({"mergeCells": {"range": {"sheetId": sheet_id, "startRowIndex": r1 - 1, "endRowIndex": r1, "startColumnIndex": 12, "endColumnIndex": 15}, "mergeType": "MERGE_ALL"}})  # PROPOSIÇÕES (título)
-        reqs.append({"mergeCells": {"range": {"sheetId": sheet_id, "startRowIndex": r1 - 1, "endRowIndex": r8, "startColumnIndex": 15, "endColumnIndex": 17}, "mergeType": "MERGE_ALL"}})  # REGIMENTO
-        reqs.append({"mergeCells": {"range": {"sheetId": sheet_id, "startRowIndex": r1 - 1, "endRowIndex": r8, "startColumnIndex": 17, "endColumnIndex": 19}, "mergeType": "MERGE_ALL"}})  # CONST. ESTADUAL
-        reqs.append({"mergeCells": {"range": {"sheetId": sheet_id, "startRowIndex": r1 - 1, "endRowIndex": r8, "startColumnIndex": 19, "endColumnIndex": 21}, "mergeType": "MERGE_ALL"}})  # CONST. FEDERAL
-        reqs.append({"mergeCells": {"range": {"sheetId": sheet_id, "startRowIndex": r1 - 1, "endRowIndex": r8, "startColumnIndex": 21, "endColumnIndex": 23}, "mergeType": "MERGE_ALL"}})  # REGIMENTO (img)
-        reqs.append({"mergeCells": {"range": {"sheetId": sheet_id, "startRowIndex": r1 - 1, "endRowIndex": r8, "startColumnIndex": 23, "endColumnIndex": 25}, "mergeType": "MERGE_ALL"}})  # CONST. ESTADUAL (img)
-        reqs.append({"mergeCells": {"range": {"sheetId": sheet_id, "startRowIndex": r2 - 1, "endRowIndex": r2, "startColumnIndex": 8, "endColumnIndex": 10}, "mergeType": "MERGE_ALL"}})  # ALINE
-        reqs.append({"mergeCells": {"range": {"sheetId": sheet_id, "startRowIndex": r3 - 1, "endRowIndex": r3, "startColumnIndex": 8, "endColumnIndex": 10}, "mergeType": "MERGE_ALL"}})  # ANDRÉ
-        reqs.append({"mergeCells": {"range": {"sheetId": sheet_id, "startRowIndex": r4 - 1, "endRowIndex": r4, "startColumnIndex": 8, "endColumnIndex": 10}, "mergeType": "MERGE_ALL"}})  # DIOGO
-        reqs.append({"mergeCells": {"range": {"sheetId": sheet_id, "startRowIndex": r5 - 1, "endRowIndex": r5, "startColumnIndex": 8, "endColumnIndex": 10}, "mergeType": "MERGE_ALL"}})  # KÁTIA
-        reqs.append({"mergeCells": {"range": {"sheetId": sheet_id, "startRowIndex": r6 - 1, "endRowIndex": r6, "startColumnIndex": 8, "endColumnIndex": 10}, "mergeType": "MERGE_ALL"}})  # LEO
-        reqs.append({"mergeCells": {"range": {"sheetId": sheet_id, "startRowIndex": r7 - 1, "endRowIndex": r7, "startColumnIndex": 8, "endColumnIndex": 10}, "mergeType": "MERGE_ALL"}})  # VINÍCIUS
-        reqs.append({"mergeCells": {"range": {"sheetId": sheet_id, "startRowIndex": r8 - 1, "endRowIndex": r8, "startColumnIndex": 8, "endColumnIndex": 10}, "mergeType": "MERGE_ALL"}})  # WELDER
-
-        for r in range(6, extra_end + 1):   # COLUNAS J:O
-            reqs.append(req_merge(sheet_id, f"J{r}:O{r}"))
-
-        # ------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
-        # ----------------------------------------------------------------------------------------------- STYLES -----------------------------------------------------------------------------------------------
-        # ------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
-        reqs.append({"repeatCell": {"range": {"sheetId": sheet_id, "startRowIndex": extra_end, "endRowIndex": extra_end, "startColumnIndex": 2, "endColumnIndex": 3},
-            "cell": {"userEnteredFormat": {"horizontalAlignment": "LEFT", "verticalAlignment": "MIDDLE"}},
-            "fields": "userEnteredFormat(horizontalAlignment,verticalAlignment)"}})
-        reqs.append({"repeatCell": {"range": {"sheetId": sheet_id, "startRowIndex": r - 1, "endRowIndex": r8, "startColumnIndex": 2, "endColumnIndex": 3},
-            "cell": {"userEnteredFormat": {"horizontalAlignment": "CENTER", "verticalAlignment": "MIDDLE", "backgroundColor": {"red": 0.953, "green": 0.953, "blue": 0.953}}},
-            "fields": "userEnteredFormat(horizontalAlignment,verticalAlignment,backgroundColor)"}})
-        reqs.append({"repeatCell": {"range": {"sheetId": sheet_id, "startRowIndex": r1 - 1, "endRowIndex": r5 - 1, "startColumnIndex": 0, "endColumnIndex": 2},
-            "cell": {"userEnteredFormat": {"backgroundColor": {"red": 0.9764706, "green": 0.7960784, "blue": 0.6117647}}},
-            "fields": "userEnteredFormat(backgroundColor)"}})
-        reqs.append({"repeatCell": {"range": {"sheetId": sheet_id, "startRowIndex": r3 - 1, "endRowIndex": r6 - 1, "startColumnIndex": 0, "endColumnIndex": 2},
-            "cell": {"userEnteredFormat": {"backgroundColor": {"red": 0.988, "green": 0.820, "blue": 0.800}}},
-            "fields": "userEnteredFormat(backgroundColor)"}})
-        reqs.append({"repeatCell": {"range": {"sheetId": sheet_id, "startRowIndex": r1 - 1, "endRowIndex": r1, "startColumnIndex": 4, "endColumnIndex": 6},
-            "cell": {"userEnteredFormat": {
-                "backgroundColor": {"red": 0.6, "green": 0.0, "blue": 0.0},
-                "horizontalAlignment": "CENTER",
-                "verticalAlignment": "MIDDLE",
-                "textFormat": {"fontFamily": "Vidaloka", "fontSize": 8, "bold": True, "foregroundColor": {"red": 0.85, "green": 0.67, "blue": 0.10}}}},
-            "fields": "userEnteredFormat(backgroundColor,horizontalAlignment,verticalAlignment,textFormat)"}})
-        reqs.append({"repeatCell": {"range": {"sheetId": sheet_id, "startRowIndex": r1 - 1, "endRowIndex": r1, "startColumnIndex": 6, "endColumnIndex": 11},
-            "cell": {"userEnteredFormat": {
-                "backgroundColor": {"red": 0.0, "green": 0.0, "blue": 0.0},
-                "horizontalAlignment": "CENTER",
-                "verticalAlignment": "MIDDLE",
-                "textFormat": {"fontFamily": "Vidaloka", "fontSize": 7, "bold": True, "foregroundColor": {"red": 1.0, "green": 1.0, "blue": 1.0}}}},
-            "fields": "userEnteredFormat(backgroundColor,horizontalAlignment,verticalAlignment,textFormat)"}})
-        reqs.append({"repeatCell": {"range": {"sheetId": sheet_id, "startRowIndex": r1 - 1, "endRowIndex": r1, "startColumnIndex": 11, "endColumnIndex": 15},
-            "cell": {"userEnteredFormat": {
-                "backgroundColor": {"red": 0.9019608, "green": 0.5686275, "blue": 0.21960788},
-                "horizontalAlignment": "CENTER",
-                "verticalAlignment": "MIDDLE",
-                "textFormat": {"fontFamily": "Vidaloka", "fontSize": 7, "bold": True, "foregroundColor": {"red": 0.0, "green": 0.0, "blue": 0.0}}}},
-            "fields": "userEnteredFormat(backgroundColor,horizontalAlignment,verticalAlignment,textFormat)"}})
-        reqs.append({"repeatCell": {"range": {"sheetId": sheet_id, "startRowIndex": r1, "endRowIndex": r8, "startColumnIndex": 11, "endColumnIndex": 15},
-            "cell": {"userEnteredFormat": {
-                "backgroundColor": {"red": 1.0, "green": 0.949, "blue": 0.8},
-                "horizontalAlignment": "CENTER",
-                "verticalAlignment": "MIDDLE",
-                "textFormat": {"fontFamily": "Special Elite", "fontSize": 8, "bold": True, "foregroundColor": {"red": 0.6, "green": 0.0, "blue": 0.0}}}},
-            "fields": "userEnteredFormat(backgroundColor,horizontalAlignment,verticalAlignment,textFormat)"}})
-        reqs.append({"repeatCell": {"range": {"sheetId": sheet_id, "startRowIndex": r2 - 1, "endRowIndex": r8, "startColumnIndex": 4, "endColumnIndex": 5},
-            "cell": {"userEnteredFormat": {"backgroundColor": {"red": 0.741, "green": 0.741, "blue": 0.741}, "horizontalAlignment": "RIGHT", "verticalAlignment": "MIDDLE",
-                    "textFormat": {"fontFamily": "Boogaloo", "fontSize": 8, "bold": False}}},
-            "fields": "userEnteredFormat(backgroundColor,horizontalAlignment,verticalAlignment,textFormat)"}})
-        reqs.append({"repeatCell": {"range": {"sheetId": sheet_id, "startRowIndex": r2 - 1, "endRowIndex": r8, "startColumnIndex": 5, "endColumnIndex": 6},
-            "cell": {"userEnteredFormat": {"backgroundColor": {"red": 0.741, "green": 0.741, "blue": 0.741}, "horizontalAlignment": "CENTER", "verticalAlignment": "MIDDLE",
-                    "textFormat": {"fontFamily": "Boogaloo", "fontSize": 8, "bold": False}}},
-            "fields": "userEnteredFormat(backgroundColor,horizontalAlignment,verticalAlignment,textFormat)"}})
-        reqs.append({"repeatCell": {"range": {"sheetId": sheet_id, "startRowIndex": r2 - 1, "endRowIndex": r8, "startColumnIndex": 6, "endColumnIndex": 7},
-            "cell": {"userEnteredFormat": {"backgroundColor": {"red": 0.741, "green": 0.741, "blue": 0.741}, "horizontalAlignment": "RIGHT", "verticalAlignment": "MIDDLE",
-                    "textFormat": {"fontFamily": "Boogaloo", "fontSize": 8, "bold": False}}},
-            "fields": "userEnteredFormat(backgroundColor,horizontalAlignment,verticalAlignment,textFormat)"}})
-        reqs.append({"repeatCell": {"range": {"sheetId": sheet_id, "startRowIndex": r2 - 1, "endRowIndex": r8, "startColumnIndex": 7, "endColumnIndex": 8},
-            "cell": {"userEnteredFormat": {"backgroundColor": {"red": 0.741, "green": 0.741, "blue": 0.741}, "horizontalAlignment": "CENTER", "verticalAlignment": "MIDDLE",
-                    "textFormat": {"fontFamily": "Boogaloo", "fontSize": 8, "bold": False}}},
-            "fields": "userEnteredFormat(backgroundColor,horizontalAlignment,verticalAlignment,textFormat)"}})
-        reqs.append({"repeatCell": {"range": {"sheetId": sheet_id, "startRowIndex": r2 - 1, "endRowIndex": r8, "startColumnIndex": 8, "endColumnIndex": 9},
-            "cell": {"userEnteredFormat": {"backgroundColor": {"red": 0.741, "green": 0.741, "blue": 0.741}, "horizontalAlignment": "RIGHT", "verticalAlignment": "MIDDLE",
-                    "textFormat": {"fontFamily": "Boogaloo", "fontSize": 8, "bold": False}}},
-            "fields": "userEnteredFormat(backgroundColor,horizontalAlignment,verticalAlignment,textFormat)"}})
-        reqs.append({"repeatCell": {"range": {"sheetId": sheet_id, "startRowIndex": r2 - 1, "endRowIndex": r8, "startColumnIndex": 10, "endColumnIndex": 11},
-            "cell": {"userEnteredFormat": {"backgroundColor": {"red": 0.741, "green": 0.741, "blue": 0.741}, "horizontalAlignment": "CENTER", "verticalAlignment": "MIDDLE",
-                    "textFormat": {"fontFamily": "Boogaloo", "fontSize": 8, "bold": False}}},
-            "fields": "userEnteredFormat(backgroundColor,horizontalAlignment,verticalAlignment,textFormat)"}})
-
-        # ------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
-        # ----------------------------------------------------------------------------------------------- VALUES -----------------------------------------------------------------------------------------------
-        # ------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
-        reqs.extend([
-        {"updateCells": {"range": {"sheetId": sheet_id,
-                "startRowIndex": r1,
-                "endRowIndex": r2,
-                "startColumnIndex": 4,
-                "endColumnIndex": 5},"rows": [{"values": [{"userEnteredValue": {"stringValue": "ALINE"}}]}],"fields": "userEnteredValue"}},
-        {"setDataValidation": {"range": {"sheetId": sheet_id,
-                "startRowIndex": r1,
-                "endRowIndex": r2,
-                "startColumnIndex": 4,
-                "endColumnIndex": 5},
-            "rule": {"condition": {"type": "ONE_OF_LIST","values": [{"userEnteredValue": v} for v in LISTA_DROPDOWN_5]},"showCustomUi": True,"strict": False}}}])
-        reqs.extend([
-        {"updateCells": {"range": {"sheetId": sheet_id,
-                "startRowIndex": r2,
-                "endRowIndex": r3,
-                "startColumnIndex": 4,
-                "endColumnIndex": 5},"rows": [{"values": [{"userEnteredValue": {"stringValue": "ANDRÉ"}}]}],"fields": "userEnteredValue"}},
-        {"setDataValidation": {"range": {"sheetId": sheet_id,
-                "startRowIndex": r2,
-                "endRowIndex": r3,
-                "startColumnIndex": 4,
-                "endColumnIndex": 5},
-            "rule": {"condition": {"type": "ONE_OF_LIST","values": [{"userEnteredValue": v} for v in LISTA_DROPDOWN_5]},"showCustomUi": True,"strict": False}}}])
-        reqs.extend([
-        {"updateCells": {"range": {"sheetId": sheet_id,
-                "startRowIndex": r3,
-                "endRowIndex": r4,
-                "startColumnIndex": 4,
-                "endColumnIndex": 5},"rows": [{"values": [{"userEnteredValue": {"stringValue": "DIOGO"}}]}],"fields": "userEnteredValue"}},
-        {"setDataValidation": {"range": {"sheetId": sheet_id,
-                "startRowIndex": r3,
-                "endRowIndex": r4,
-                "startColumnIndex": 4,
-                "endColumnIndex": 5},
-            "rule": {"condition": {"type": "ONE_OF_LIST","values": [{"userEnteredValue": v} for v in LISTA_DROPDOWN_5]},"showCustomUi": True,"strict": False}}}])
-        reqs.extend([
-        {"updateCells": {"range": {"sheetId": sheet_id,
-                "startRowIndex": r4,
-                "endRowIndex": r5,
-                "startColumnIndex": 4,
-                "endColumnIndex": 5},"rows": [{"values": [{"userEnteredValue": {"stringValue": "KÁTIA"}}]}],"fields": "userEnteredValue"}},
-        {"setDataValidation": {"range": {"sheetId": sheet_id,
-                "startRowIndex": r4,
-                "endRowIndex": r5,
-                "startColumnIndex": 4,
-                "endColumnIndex": 5},
-            "rule": {"condition": {"type": "ONE_OF_LIST","values": [{"userEnteredValue": v} for v in LISTA_DROPDOWN_5]},"showCustomUi": True,"strict": False}}}])
-        reqs.extend([
-        {"updateCells": {"range": {"sheetId": sheet_id,
-                "startRowIndex": r5,
-                "endRowIndex": r6,
-                "startColumnIndex": 4,
-                "endColumnIndex": 5},"rows": [{"values": [{"userEnteredValue": {"stringValue": "LEO"}}]}],"fields": "userEnteredValue"}},
-        {"setDataValidation": {"range": {"sheetId": sheet_id,
-                "startRowIndex": r5,
-                "endRowIndex": r6,
-                "startColumnIndex": 4,
-                "endColumnIndex": 5},
-            "rule": {"condition": {"type": "ONE_OF_LIST","values": [{"userEnteredValue": v} for v in LISTA_DROPDOWN_5]},"showCustomUi": True,"strict": False}}}])
-
-        reqs.extend([
-        {"updateCells": {"range": {"sheetId": sheet_id,
-                "startRowIndex": r1,
-                "endRowIndex": r2,
-                "startColumnIndex": 6,
-                "endColumnIndex": 7},"rows": [{"values": [{"userEnteredValue": {"stringValue": "ALINE"}}]}],"fields": "userEnteredValue"}},
-        {"setDataValidation": {"range": {"sheetId": sheet_id,
-                "startRowIndex": r1,
-                "endRowIndex": r2,
-                "startColumnIndex": 6,
-                "endColumnIndex": 7},
-            "rule": {"condition": {"type": "ONE_OF_LIST","values": [{"userEnteredValue": v} for v in LISTA_DROPDOWN_5]},"showCustomUi": True,"strict": False}}}])
-        reqs.extend([
-        {"updateCells": {"range": {"sheetId": sheet_id,
-                "startRowIndex": r2,
-                "endRowIndex": r3,
-                "startColumnIndex": 6,
-                "endColumnIndex": 7},"rows": [{"values": [{"userEnteredValue": {"stringValue": "ANDRÉ"}}]}],"fields": "userEnteredValue"}},
-        {"setDataValidation": {"range": {"sheetId": sheet_id,
-                "startRowIndex": r2,
-                "endRowIndex": r3,
-                "startColumnIndex": 6,
-                "endColumnIndex": 7},
-            "rule": {"condition": {"type": "ONE_OF_LIST","values": [{"userEnteredValue": v} for v in LISTA_DROPDOWN_5]},"showCustomUi": True,"strict": False}}}])
-        reqs.extend([
-        {"updateCells": {"range": {"sheetId": sheet_id,
-                "startRowIndex": r3,
-                "endRowIndex": r4,
-                "startColumnIndex": 6,
-                "endColumnIndex": 7},"rows": [{"values": [{"userEnteredValue": {"stringValue": "DIOGO"}}]}],"fields": "userEnteredValue"}},
-        {"setDataValidation": {"range": {"sheetId": sheet_id,
-                "startRowIndex": r3,
-                "endRowIndex": r4,
-                "startColumnIndex": 6,
-                "endColumnIndex": 7},
-            "rule": {"condition": {"type": "ONE_OF_LIST","values": [{"userEnteredValue": v} for v in LISTA_DROPDOWN_5]},"showCustomUi": True,"strict": False}}}])
-        reqs.extend([
-        {"updateCells": {"range": {"sheetId": sheet_id,
-                "startRowIndex": r4,
-                "endRowIndex": r5,
-                "startColumnIndex": 6,
-                "endColumnIndex": 7},"rows": [{"values": [{"userEnteredValue": {"stringValue": "KÁTIA"}}]}],"fields": "userEnteredValue"}},
-        {"setDataValidation": {"range": {"sheetId": sheet_id,
-                "startRowIndex": r4,
-                "endRowIndex": r5,
-                "startColumnIndex": 6,
-                "endColumnIndex": 7},
-            "rule": {"condition": {"type": "ONE_OF_LIST","values": [{"userEnteredValue": v} for v in LISTA_DROPDOWN_5]},"showCustomUi": True,"strict": False}}}])
-        reqs.extend([
-        {"updateCells": {"range": {"sheetId": sheet_id,
-                "startRowIndex": r5,
-                "endRowIndex": r6,
-                "startColumnIndex": 6,
-                "endColumnIndex": 7},"rows": [{"values": [{"userEnteredValue": {"stringValue": "LEO"}}]}],"fields": "userEnteredValue"}},
-        {"setDataValidation": {"range": {"sheetId": sheet_id,
-                "startRowIndex": r5,
-                "endRowIndex": r6,
-                "startColumnIndex": 6,
-                "endColumnIndex": 7},
-            "rule": {"condition": {"type": "ONE_OF_LIST","values": [{"userEnteredValue": v} for v in LISTA_DROPDOWN_5]},"showCustomUi": True,"strict": False}}}])
-
-        reqs.extend([
-        {"updateCells": {"range": {"sheetId": sheet_id,
-                "startRowIndex": r1,
-                "endRowIndex": r2,
-                "startColumnIndex": 6,
-                "endColumnIndex": 7},"rows": [{"values": [{"userEnteredValue": {"stringValue": "ALINE"}}]}],"fields": "userEnteredValue"}},
-        {"setDataValidation": {"range": {"sheetId": sheet_id,
-                "startRowIndex": r1,
-                "endRowIndex": r2,
-                "startColumnIndex": 6,
-                "endColumnIndex": 7},
-            "rule": {"condition": {"type": "ONE_OF_LIST","values": [{"userEnteredValue": v} for v in LISTA_DROPDOWN_5]},"showCustomUi": True,"strict": False}}}])
-        reqs.extend([
-        {"updateCells": {"range": {"sheetId": sheet_id,
-                "startRowIndex": r2,
-                "endRowIndex": r3,
-                "startColumnIndex": 6,
-                "endColumnIndex": 7},"rows": [{"values": [{"userEnteredValue": {"stringValue": "ANDRÉ"}}]}],"fields": "userEnteredValue"}},
-        {"setDataValidation": {"range": {"sheetId": sheet_id,
-                "startRowIndex": r2,
-                "endRowIndex": r3,
-                "startColumnIndex": 6,
-                "endColumnIndex": 7},
-            "rule": {"condition": {"type": "ONE_OF_LIST","values": [{"userEnteredValue": v} for v in LISTA_DROPDOWN_5]},"showCustomUi": True,"strict": False}}}])
-        reqs.extend([
-        {"updateCells": {"range": {"sheetId": sheet_id,
-                "startRowIndex": r3,
-                "endRowIndex": r4,
-                "startColumnIndex": 6,
-                "endColumnIndex": 7},"rows": [{"values": [{"userEnteredValue": {"stringValue": "DIOGO"}}]}],"fields": "userEnteredValue"}},
-        {"setDataValidation": {"range": {"sheetId": sheet_id,
-                "startRowIndex": r3,
-                "endRowIndex": r4,
-                "startColumnIndex": 6,
-                "endColumnIndex": 7},
-            "rule": {"condition": {"type": "ONE_OF_LIST","values": [{"userEnteredValue": v} for v in LISTA_DROPDOWN_5]},"showCustomUi": True,"strict": False}}}])
-        reqs.extend([
-        {"updateCells": {"range": {"sheetId": sheet_id,
-                "startRowIndex": r4,
-                "endRowIndex": r5,
-                "startColumnIndex": 6,
-                "endColumnIndex": 7},"rows": [{"values": [{"userEnteredValue": {"stringValue": "KÁTIA"}}]}],"fields": "userEnteredValue"}},
-        {"setDataValidation": {"range": {"sheetId": sheet_id,
-                "startRowIndex": r4,
-                "endRowIndex": r5,
-                "startColumnIndex": 6,
-                "endColumnIndex": 7},
-            "rule": {"condition": {"type": "ONE_OF_LIST","values": [{"userEnteredValue": v} for v in LISTA_DROPDOWN_5]},"showCustomUi": True,"strict": False}}}])
-        reqs.extend([
-        {"updateCells": {"range": {"sheetId": sheet_id,
-                "startRowIndex": r5,
-                "endRowIndex": r6,
-                "startColumnIndex": 6,
-                "endColumnIndex": 7},"rows": [{"values": [{"userEnteredValue": {"stringValue": "LEO"}}]}],"fields": "userEnteredValue"}},
-        {"setDataValidation": {"range": {"sheetId": sheet_id,
-                "startRowIndex": r5,
-                "endRowIndex": r6,
-                "startColumnIndex": 6,
-                "endColumnIndex": 7},
-            "rule": {"condition": {"type": "ONE_OF_LIST","values": [{"userEnteredValue": v} for v in LISTA_DROPDOWN_5]},"showCustomUi": True,"strict": False}}}])
-
-        reqs.extend([
-        {"updateCells": {"range": {"sheetId": sheet_id,
-                "startRowIndex": r1,
-                "endRowIndex": r2,
-                "startColumnIndex": 8,
-                "endColumnIndex": 9},"rows": [{"values": [{"userEnteredValue": {"stringValue": "ALINE"}}]}],"fields": "userEnteredValue"}},
-        {"setDataValidation": {"range": {"sheetId": sheet_id,
-                "startRowIndex": r1,
-                "endRowIndex": r2,
-                "startColumnIndex": 8,
-                "endColumnIndex": 9},
-            "rule": {"condition": {"type": "ONE_OF_LIST","values": [{"userEnteredValue": v} for v in LISTA_DROPDOWN_5]},"showCustomUi": True,"strict": False}}}])
-        reqs.extend([
-        {"updateCells": {"range": {"sheetId": sheet_id,
-                "startRowIndex": r2,
-                "endRowIndex": r3,
-                "startColumnIndex": 8,
-                "endColumnIndex": 9},"rows": [{"values": [{"userEnteredValue": {"stringValue": "ANDRÉ"}}]}],"fields": "userEnteredValue"}},
-        {"setDataValidation": {"range": {"sheetId": sheet_id,
-                "startRowIndex": r2,
-                "endRowIndex": r3,
-                "startColumnIndex": 8,
-                "endColumnIndex": 9},
-            "rule": {"condition": {"type": "ONE_OF_LIST","values": [{"userEnteredValue": v} for v in LISTA_DROPDOWN_5]},"showCustomUi": True,"strict": False}}}])
-        reqs.extend([
-        {"updateCells": {"range": {"sheetId": sheet_id,
-                "startRowIndex": r3,
-                "endRowIndex": r4,
-                "startColumnIndex": 8,
-                "endColumnIndex": 9},"rows": [{"values": [{"userEnteredValue": {"stringValue": "DIOGO"}}]}],"fields": "userEnteredValue"}},
-        {"setDataValidation": {"range": {"sheetId": sheet_id,
-                "startRowIndex": r3,
-                "endRowIndex": r4,
-                "startColumnIndex": 8,
-                "endColumnIndex": 9},
-            "rule": {"condition": {"type": "ONE_OF_LIST","values": [{"userEnteredValue": v} for v in LISTA_DROPDOWN_5]},"showCustomUi": True,"strict": False}}}])
-        reqs.extend([
-        {"updateCells": {"range": {"sheetId": sheet_id,
-                "startRowIndex": r4,
-                "endRowIndex": r5,
-                "startColumnIndex": 8,
-                "endColumnIndex": 9},"rows": [{"values": [{"userEnteredValue": {"stringValue": "KÁTIA"}}]}],"fields": "userEnteredValue"}},
-        {"setDataValidation": {"range": {"sheetId": sheet_id,
-                "startRowIndex": r4,
-                "endRowIndex": r5,
-                "startColumnIndex": 8,
-                "endColumnIndex": 9},
-            "rule": {"condition": {"type": "ONE_OF_LIST","values": [{"userEnteredValue": v} for v in LISTA_DROPDOWN_5]},"showCustomUi": True,"strict": False}}}])
-        reqs.extend([
-        {"updateCells": {"range": {"sheetId": sheet_id,
-                "startRowIndex": r5,
-                "endRowIndex": r6,
-                "startColumnIndex": 8,
-                "endColumnIndex": 9},"rows": [{"values": [{"userEnteredValue": {"stringValue": "LEO"}}]}],"fields": "userEnteredValue"}},
-        {"setDataValidation": {"range": {"sheetId": sheet_id,
-                "startRowIndex": r5,
-                "endRowIndex": r6,
-                "startColumnIndex": 8,
-                "endColumnIndex": 9},
-            "rule": {"condition": {"type": "ONE_OF_LIST","values": [{"userEnteredValue": v} for v in LISTA_DROPDOWN_5]},"showCustomUi": True,"strict": False}}}])
-        reqs.extend([
-        {"repeatCell": {"range": {"sheetId": sheet_id,
-                "startRowIndex": r1,
-                "endRowIndex": r8,
-                "startColumnIndex": 12,
-                "endColumnIndex": 13},
-            "cell": {"userEnteredValue": {"stringValue": "PL"}},"fields": "userEnteredValue"}},
-        {"setDataValidation": {"range": {"sheetId": sheet_id,
-                "startRowIndex": r1,
-                "endRowIndex": r8,
-                "startColumnIndex": 12,
-                "endColumnIndex": 13},
-            "rule": {"condition": {"type": "ONE_OF_LIST","values": [{"userEnteredValue": v} for v in LISTA_DROPDOWN_6]},"showCustomUi": True,"strict": True}}}])
-        reqs.extend([
-        {"repeatCell": {"range": {"sheetId": sheet_id,
-                "startRowIndex": r1,
-                "endRowIndex": r8,
-                "startColumnIndex": 14,
-                "endColumnIndex": 15},
-            "cell": {"userEnteredValue": {"stringValue": "2026"}},"fields": "userEnteredValue"}},
-        {"setDataValidation": {"range": {"sheetId": sheet_id,
-                "startRowIndex": r1,
-                "endRowIndex": r8,
-                "startColumnIndex": 14,
-                "endColumnIndex": 15},
-            "rule": {"condition": {"type": "ONE_OF_LIST","values": [{"userEnteredValue": v} for v in LISTA_DROPDOWN_7]},"showCustomUi": True,"strict": True}}}])
-
-        # ------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
-        # ------------------------------------------------------------------------------------------------ NOTES -----------------------------------------------------------------------------------------------
-        # ------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
-        reqs.append({"updateCells": {"range": {"sheetId": sheet_id, "startRowIndex": r1 - 1, "endRowIndex": r1, "startColumnIndex": 1, "endColumnIndex": 2},
-            "rows": [{"values": [{"note": "7776 ar-condicionado\n7870 gerência de saúde (- Marcos/Alberto)\n7710 informática\n7468 frequência (Milena)\n7786 polícia legislativa\n7885 plenário (Elton)"}]}],
-            "fields": "note"}})
-
-        reqs.append({"updateCells": {"range": {"sheetId": sheet_id, "startRowIndex": 7, "endRowIndex": 8, "startColumnIndex": 3, "endColumnIndex": 4},
-            "rows": [{"values": [{"note": "CAPÍTULO 2-6, pág 19.\n\n"
-                                        "Prioridades de lançamento (o que devo lançar primeiro?)\n\n"
-                                        "1) PLs, PLCs, PREs e PECs novos\n"
-                                        "2) RQNs novos\n"
-                                        "3) Proposições não recebidas\n"
-                                        "4) RQNs aprovados\n"
-                                        "5) Todos os lançamentos que envolvam a implantação de um boletim novo em proposição anteriormente já implantada\n"
-                                        "6) Lançamentos que consistam não em acrescentar boletins, mas apenas em adicionar uma frase a um boletim já implantado (ex: \"Publicado no DL em...\")"}]}],
-            "fields": "note"}})
-
-        # ------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
-        # ----------------------------------------------------------------------------------------------- BORDERS ----------------------------------------------------------------------------------------------
-        # ------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
-        reqs.append({"updateBorders": {"range": {"sheetId": sheet_id, "startRowIndex": 5, "endRowIndex": footer_start - 1, "startColumnIndex": 8, "endColumnIndex": 9},
-            "right": {"style": "SOLID_MEDIUM", "color": {"red": 0.0, "green": 0.0, "blue": 0.0}}}})
-
-        reqs.append({"updateBorders": {"range": {"sheetId": sheet_id, "startRowIndex": r1 - 1, "endRowIndex": r8, "startColumnIndex": 0, "endColumnIndex": 1},
-            "right": {"style": "DOTTED", "color": {"red": 0.8, "green": 0.0, "blue": 0.0}}}})
-
-        reqs.append({"updateBorders": {"range": {"sheetId": sheet_id, "startRowIndex": r7, "endRowIndex": r7 + 1, "startColumnIndex": 0, "endColumnIndex": 2},
-            "top": {"style": "DOTTED", "color": {"red": 0.8, "green": 0.0, "blue": 0.0}}}})
-
-        reqs.append({"updateBorders": {"range": {"sheetId": sheet_id, "startRowIndex": r, "endRowIndex": r8, "startColumnIndex": 1, "endColumnIndex": 2},
-            "right": {"style": "SOLID", "color": {"red": 0.0, "green": 0.0, "blue": 0.0}},
-            "bottom": {"style": "SOLID_MEDIUM", "color": {"red": 0.0, "green": 0.0, "blue": 0.0}}}})
-
-        reqs.append({"updateBorders": {"range": {"sheetId": sheet_id, "startRowIndex": r, "endRowIndex": r8, "startColumnIndex": 4, "endColumnIndex": 5},
-            "left": {"style": "SOLID", "color": {"red": 0.0, "green": 0.0, "blue": 0.0}}}})
-
-        reqs.append({"updateBorders": {"range": {"sheetId": sheet_id, "startRowIndex": footer_start, "endRowIndex": r8, "startColumnIndex": 17, "endColumnIndex": 18},
-            "left": {"style": "SOLID_MEDIUM", "color": {"red": 0.8, "green": 0.0, "blue": 0.0}}}})
-
-        reqs.append({"updateBorders": {"range": {"sheetId": sheet_id, "startRowIndex": r8, "endRowIndex": r8 + 1, "startColumnIndex": 0, "endColumnIndex": 25},
-            "top": {"style": "SOLID_MEDIUM", "color": {"red": 0.0, "green": 0.0, "blue": 0.0}}}})
-
-        reqs.append({"updateBorders": {"range": {"sheetId": sheet_id, "startRowIndex": r7, "endRowIndex": r8, "startColumnIndex": 0, "endColumnIndex": 25},
-            "bottom": {"style": "SOLID_MEDIUM", "color": {"red": 0.0, "green": 0.0, "blue": 0.0}}}})
-
-        # ====================================================================================================================================================================================================
-        # ========================================================================================== CONDICIONAIS ============================================================================================
-        # ====================================================================================================================================================================================================
-
-        reqs.append({"addConditionalFormatRule": {"rule": {"ranges": [{"sheetId": sheet_id, "startRowIndex": 5, "endRowIndex": ws.row_count, "startColumnIndex": 0, "endColumnIndex": 25}],
-            "booleanRule": {"condition": {"type": "CUSTOM_FORMULA", "values": [{"userEnteredValue": '=$H6=TRUE'}]},
-                "format": {"backgroundColor": {"red": 0.2627450980392157, "green": 0.2627450980392157, "blue": 0.2627450980392157},"textFormat": {"foregroundColor": {"red": 0.6, "green": 0.6, "blue": 0.6}, "bold": True}}}},
-            "index": 0}})
-
-        reqs.append({"addConditionalFormatRule": {"rule": {"ranges": [{"sheetId": sheet_id, "startRowIndex": 5, "endRowIndex": ws.row_count, "startColumnIndex": 0, "endColumnIndex": 25}],
-            "booleanRule": {"condition": {"type": "CUSTOM_FORMULA", "values": [{"userEnteredValue": '=OR($I6=TRUE;REGEXMATCH(TO_TEXT($I6);"-"))'}]},
-                "format": {"backgroundColor": {"red": 0.8, "green": 0.8, "blue": 0.8},"textFormat": {"foregroundColor": {"red": 0.0, "green": 0.0, "blue": 0.0}}}}},
-            "index": 1}})
-
-        reqs.append({"addConditionalFormatRule": {"rule": {"ranges": [{"sheetId": sheet_id, "startRowIndex": 5, "endRowIndex": ws.row_count, "startColumnIndex": 0, "endColumnIndex": 25}],
-            "booleanRule": {"condition": {"type": "CUSTOM_FORMULA", "values": [{"userEnteredValue": '=REGEXMATCH($C6;"^DIÁRIO")'}]},
-                "format": {"backgroundColor": {"red": 102/255, "green": 0.0, "blue": 0.0}, "textFormat": {"foregroundColor": {"red": 1.0, "green": 1.0, "blue": 1.0}, "bold": True}}}},
-            "index": 2}})
-
-        reqs.append({"addConditionalFormatRule": {"rule": {"ranges": [{"sheetId": sheet_id, "startRowIndex": 5, "endRowIndex": ws.row_count, "startColumnIndex": 0, "endColumnIndex": 25}],
-            "booleanRule": {"condition": {"type": "CUSTOM_FORMULA", "values": [{"userEnteredValue": '=REGEXMATCH($C6;"^REUNIÕES")'}]},
-                "format": {"backgroundColor": {"red": 39/255, "green": 78/255, "blue": 19/255}, "textFormat": {"foregroundColor": {"red": 1.0, "green": 1.0, "blue": 1.0}, "bold": True}}}},
-            "index": 3}})
-
-        reqs.append({"addConditionalFormatRule": {"rule": {"ranges": [{"sheetId": sheet_id, "startRowIndex": 5, "endRowIndex": ws.row_count, "startColumnIndex": 0, "endColumnIndex": 25}],
-            "booleanRule": {"condition": {"type": "CUSTOM_FORMULA", "values": [{"userEnteredValue": '=REGEXMATCH($C6;"^REQUERIMENTOS DE COMISSÕES")'}]},
-                "format": {"backgroundColor": {"red": 255/255, "green": 153/255, "blue": 0/255}, "textFormat": {"foregroundColor": {"red": 1.0, "green": 1.0, "blue": 1.0}, "bold": True}}}},
-            "index": 4}})
-
-        reqs.append({"addConditionalFormatRule": {"rule": {"ranges": [{"sheetId": sheet_id, "startRowIndex": 5, "endRowIndex": ws.row_count, "startColumnIndex": 0, "endColumnIndex": 25}],
-            "booleanRule": {"condition": {"type": "CUSTOM_FORMULA", "values": [{"userEnteredValue": '=REGEXMATCH($C6;"^LANÇAMENTOS DE TRAMITAÇÃO")'}]},
-                "format": {"backgroundColor": {"red": 32/255, "green": 18/255, "blue": 77/255}, "textFormat": {"foregroundColor": {"red": 1.0, "green": 1.0, "blue": 1.0}, "bold": True}}}},
-            "index": 5}})
-
-        reqs.append({"addConditionalFormatRule": {"rule": {"ranges": [{"sheetId": sheet_id, "startRowIndex": 5, "endRowIndex": ws.row_count, "startColumnIndex": 0, "endColumnIndex": 25}],
-            "booleanRule": {"condition": {"type": "CUSTOM_FORMULA", "values": [{"userEnteredValue": '=REGEXMATCH($C6;"^CADASTRO DE E-MAILS")'}]},
-                "format": {"backgroundColor": {"red": 7/255, "green": 55/255, "blue": 99/255}, "textFormat": {"foregroundColor": {"red": 1.0, "green": 1.0, "blue": 1.0}, "bold": True}}}},
-            "index": 6}})
-
-        reqs.append({"addConditionalFormatRule": {"rule": {"ranges": [{"sheetId": sheet_id, "startRowIndex": 5, "endRowIndex": ws.row_count, "startColumnIndex": 0, "endColumnIndex": 25}],
-            "booleanRule": {"condition": {"type": "CUSTOM_FORMULA", "values": [{"userEnteredValue": '=REGEXMATCH($C6;"^IMPLANTAÇÃO DE TEXTOS")'}]},
-                "format": {"backgroundColor": {"red": 127/255, "green": 96/255, "blue": 0/255}, "textFormat": {"foregroundColor": {"red": 1.0, "green": 1.0, "blue": 1.0}, "bold": True}}}},
-            "index": 7}})
-
-        reqs.append({"addConditionalFormatRule": {"rule": {"ranges": [{"sheetId": sheet_id, "startRowIndex": 5, "endRowIndex": ws.row_count, "startColumnIndex": 0, "endColumnIndex": 25}],
-            "booleanRule": {"condition": {"type": "CUSTOM_FORMULA", "values": [{"userEnteredValue": '=AND(OR(REGEXMATCH($B6;"^GDI-GGA");REGEXMATCH($C6;"^MATE")))'}]},
-                "format": {"backgroundColor": {"red": 0.0, "green": 0.0, "blue": 0.0}, "textFormat": {"foregroundColor": {"red": 1.0, "green": 1.0, "blue": 1.0}, "bold": True}}}},
-            "index": 8}})
+        def _footer_reqs(sheet_id: int, extra_end: int, n_rows: int) -> list:
+            reqs = []
+            append = reqs.append
+
+            def _range(sr: int, er: int, sc: int, ec: int) -> dict:
+                # GridRange desta aba (dict novo a cada chamada)
+                return {"sheetId": sheet_id, "startRowIndex": sr, "endRowIndex": er, "startColumnIndex": sc, "endColumnIndex": ec}
+
+            def _sv(v: str) -> dict:
+                return {"userEnteredValue": {"stringValue": v}}
+
+            def _sf(f: str) -> dict:
+                return {"userEnteredValue": {"formulaValue": f}}
+
+            # linhas do rodapé em índice 0-based (direto em startRowIndex); r0 = footer_start (1-based)
+            r0, r1, r2, r3, r4, r5, r6, r7, r8 = range(footer_start - 1, footer_start + 8)
+
+            # -------------------------------------------------------------------------------------------------------------------------------------------------
+            # -------------------------------------------------------------------- VALUES ---------------------------------------------------------------------
+            # -------------------------------------------------------------------------------------------------------------------------------------------------
+            append({"updateCells": {
+                    "range": {"sheetId": sheet_id, "startRowIndex": r0,  "endRowIndex": r0 + 1,  "startColumnIndex": 1,  "endColumnIndex": 2},  # B
+                    "rows": [{"values": [_sf('=HYPERLINK("http://meet.google.com/api-pefj-mvq";"GDI-GGA")')]}],
+                    "fields": "userEnteredValue"}})
+
+            append({"updateCells": {
+                    "range": {"sheetId": sheet_id, "startRowIndex": r1, "endRowIndex": r1 + 1, "startColumnIndex": 0,  "endColumnIndex": 1},  # A
+                    "rows": [{"values": [_sf('=HYPERLINK("https://mediaserver.almg.gov.br/acervo/511/376/2511376.pdf";IMAGE("https://cdn-icons-png.flaticon.com/512/3079/3079014.png";4;19;19))')]}],
+                    "fields": "userEnteredValue"}})
+
+            append({"updateCells": {
+                    "range": {"sheetId": sheet_id, "startRowIndex": r1, "endRowIndex": r1 + 1, "startColumnIndex": 1,  "endColumnIndex": 2},  # B
+                    "rows": [{"values": [_sf('=HYPERLINK("https://intra.almg.gov.br/export/sites/default/atendimento/docs/lista-telefonica.pdf";IMAGE("https://cdn-icons-png.flaticon.com/512/4783/4783130.png";4;33;33))')]}],
+                    "fields": "userEnteredValue"}})
+
+            append({"updateCells": {
+                    "range": {"sheetId": sheet_id, "startRowIndex": r1, "endRowIndex": r1 + 1, "startColumnIndex": 2,  "endColumnIndex": 3},  # C
+                    "rows": [{"values": [_sf('=HYPERLINK("https://sites.google.com/view/gga-gdi-almg/";IMAGE("https://yt3.ggpht.com/ytc/AKedOLS-fgkzGxYUBgBejVblA1CLhE69pbiZyoH7spcNRQ=s900-c-k-c0x00ffffff-no-rj";4;112;125))')]}],
+                    "fields": "userEnteredValue"}})
+
+            append({"updateCells": {
+                    "range": {"sheetId": sheet_id, "startRowIndex": r1, "endRowIndex": r1 + 1, "startColumnIndex": 4,  "endColumnIndex": 5},  # E
+                    "rows": [{"values": [_sf(f'=SUM(FILTER(F{r1 + 2}:F;E{r1 + 2}:E<>""))')]}],
+                    "fields": "userEnteredValue"}})
+
+            append({"updateCells": {
+                    "range": {"sheetId": sheet_id, "startRowIndex": r1, "endRowIndex": r1 + 1, "startColumnIndex": 5,  "endColumnIndex": 6},  # F
+                    "rows": [{"values": [_sv("TOTAL")]}],
+                    "fields": "userEnteredValue"}})
+
+            # H/K do rodapé: SUMIF sobre o corpo (linhas 6..extra_end) com o nome digitado na própria linha (G/I),
+            # então qualquer nome conta, não só os da lista; F soma os totais já exibidos no próprio rodapé
+            RODAPE_NOMES = ["ALINE", "ANDRÉ", "DIOGO", "KÁTIA", "LEO"]
+            lin_ini = r2 + 1  # 1-based (A1)
+            ult = r8 + 1      # 1-based (A1)
+
+            append({"repeatCell": {
+                    "range": {"sheetId": sheet_id, "startRowIndex": r2, "endRowIndex": r6 + 1, "startColumnIndex": 5, "endColumnIndex": 6},  # F (hyperlink)
+                    "cell": _sf(f'=SUMIF($G${lin_ini}:$G${ult};E{lin_ini};$H${lin_ini}:$H${ult})+SUMIF($I${lin_ini}:$I${ult};E{lin_ini};$K${lin_ini}:$K${ult})'),
+                    "fields": "userEnteredValue"}})
+
+            append({"updateCells": {
+                    "range": {"sheetId": sheet_id, "startRowIndex": r1, "endRowIndex": r1 + 1, "startColumnIndex": 6,  "endColumnIndex": 7},  # G
+                    "rows": [{"values": [_sv("IMPLANTAÇÃO")]}],
+                    "fields": "userEnteredValue"}})
+
+            append({"updateCells": {
+                    "range": {"sheetId": sheet_id, "startRowIndex": r1, "endRowIndex": r1 + 1, "startColumnIndex": 7,  "endColumnIndex": 8},  # H (ícone)
+                    "rows": [{"values": [_sf('=IMAGE("https://encrypted-tbn0.gstatic.com/images?q=tbn:ANd9GcRYV-RpYwK3orapycj_CXJGevAVSORX9_E2jUYZLgID8L3bLwfSRXMX7ksvRTsEEoRBeNE&usqp=CAU";4;17;17)')]}],
+                    "fields": "userEnteredValue"}})
+            append({"repeatCell": {
+                    "range": {"sheetId": sheet_id, "startRowIndex": r2, "endRowIndex": r6 + 1, "startColumnIndex": 7, "endColumnIndex": 8},  # L (hyperlink)
+                    "cell": _sf(f'=SUMIF($F$6:$F${extra_end};G{lin_ini};$E$6:$E${extra_end})'),
+                    "fields": "userEnteredValue"}})
+            append({"updateCells": {
+                    "range": {"sheetId": sheet_id, "startRowIndex": r1, "endRowIndex": r1 + 1, "startColumnIndex": 8,  "endColumnIndex": 9},  # I
+                    "rows": [{"values": [_sv("CONFERÊNCIA")]}],
+                    "fields": "userEnteredValue"}})
+
+            append({"updateCells": {
+                    "range": {"sheetId": sheet_id, "startRowIndex": r1, "endRowIndex": r1 + 1, "startColumnIndex": 10, "endColumnIndex": 11},  # K (ícone)
+                    "rows": [{"values": [_sf('=IMAGE("https://w7.pngwing.com/pngs/894/494/png-transparent-black-male-symbol-art-avatar-education-professor-user-profile-faculty-boss-face-heroes-service-thumbnail.png";4;17;17)')]}],
+
+                    "fields": "userEnteredValue"}})
+            append({"repeatCell": {
+                    "range": {"sheetId": sheet_id, "startRowIndex": r2, "endRowIndex": r6 + 1, "startColumnIndex": 10, "endColumnIndex": 11},  # K (hyperlink)
+                    "cell": _sf(f'=SUMIF($G$6:$G${extra_end};I{lin_ini};$H$6:$H${extra_end})'),
+                    "fields": "userEnteredValue"}})
+
+            append({"updateCells": {
+                    "range": {"sheetId": sheet_id, "startRowIndex": r1, "endRowIndex": r1 + 1, "startColumnIndex": 11, "endColumnIndex": 12},  # L (ícone)
+                    "rows": [{"values": [_sf('=IMAGE("https://encrypted-tbn0.gstatic.com/images?q=tbn:ANd9GcRyxXB7iHrkoP3waMJDQVtKeDlVpA7sno_XMNVpY20s5rmcQyJh")')]}],
+                    "fields": "userEnteredValue"}})
+
+            append({"repeatCell": {
+                    "range": {"sheetId": sheet_id, "startRowIndex": r2, "endRowIndex": r8 + 1, "startColumnIndex": 11, "endColumnIndex": 12},  # L (hyperlink)
+                    "cell": _sf(f'=HYPERLINK("https://www.almg.gov.br/atividade_parlamentar/tramitacao_projetos/interna.html?a="&O{r2 + 1}&"&n="&N{r2 + 1}&"&t="&M{r2 + 1}&"&aba=js_tabTramitacao";IMAGE("https://seeklogo.com/images/B/bandeira-minas-gerais-logo-AD7B6F3604-seeklogo.com.png";4;14;14))'),
+                    "fields": "userEnteredValue"}})
+
+            append({"updateCells": {
+                    "range": {"sheetId": sheet_id, "startRowIndex": r1, "endRowIndex": r1 + 1, "startColumnIndex": 12, "endColumnIndex": 13},  # M
+                    "rows": [{"values": [_sv("PROPOSIÇÕES RELEVANTES")]}],
+                    "fields": "userEnteredValue"}})
+
+            append({"updateCells": {
+                    "range": {"sheetId": sheet_id, "startRowIndex": r1, "endRowIndex": r1 + 1, "startColumnIndex": 15, "endColumnIndex": 16},  # P
+                    "rows": [{"values": [_sf('=HYPERLINK("https://dspace.almg.gov.br/server/api/core/bitstreams/7cd591b0-1a2c-41cc-9341-78919e827df1/content";IMAGE("https://www.almg.gov.br/servicos/biblioteca/livraria-do-legislativo/capas/capa-regimento-interno.png";4;130;140))')]}],
+                    "fields": "userEnteredValue"}})
+
+            append({"updateCells": {
+                    "range": {"sheetId": sheet_id, "startRowIndex": r1, "endRowIndex": r1 + 1, "startColumnIndex": 17, "endColumnIndex": 18},  # R
+                    "rows": [{"values": [_sf('=HYPERLINK("https://www.cbhdoce.org.br/wp-content/uploads/2016/01/ConstituicaoEstadual.pdf";IMAGE("https://encrypted-tbn0.gstatic.com/images?q=tbn:ANd9GcT5c5T7Fvx5UqHvPvb1EWmn6zxEyl9XZua3dQ&s";4;130;140))')]}],
+                    "fields": "userEnteredValue"}})
+
+            append({"updateCells": {
+                    "range": {"sheetId": sheet_id, "startRowIndex": r1, "endRowIndex": r1 + 1, "startColumnIndex": 19, "endColumnIndex": 20},  # T
+                    "rows": [{"values": [_sf('=HYPERLINK("https://www.planalto.gov.br/ccivil_03/constituicao/ConstituicaoCompilado.htm";IMAGE("https://www2.camara.leg.br/atividade-legislativa/legislacao/Constituicoes_Brasileiras/constituicao-cidada/regulamentacao/imagens/copy_of_1.jpg/@@images/8beeb113-f656-495f-9c90-c81fb62a2ebb.jpeg";4;130;125))')]}],
+                    "fields": "userEnteredValue"}})
+
+            append({"updateCells": {
+                    "range": {"sheetId": sheet_id, "startRowIndex": r1, "endRowIndex": r1 + 1, "startColumnIndex": 21, "endColumnIndex": 22},  # V
+                    "rows": [{"values": [_sf('=HYPERLINK("https://dspace.almg.gov.br/server/api/core/bitstreams/7cd591b0-1a2c-41cc-9341-78919e827df1/content";IMAGE("https://www.aracruz.es.leg.br/imagens/PORTLETREGIMENTOINTERNO.png/image_preview";4;130;125))')]}],
+                    "fields": "userEnteredValue"}})
+
+            append({"updateCells": {
+                    "range": {"sheetId": sheet_id, "startRowIndex": r1, "endRowIndex": r1 + 1, "startColumnIndex": 23, "endColumnIndex": 24},  # X
+                    "rows": [{"values": [_sf('=HYPERLINK("https://www.cbhdoce.org.br/wp-content/uploads/2016/01/ConstituicaoEstadual.pdf";IMAGE("https://upload.wikimedia.org/wikipedia/commons/d/d2/Bras%C3%A3o_de_Minas_Gerais.svg"))')]}],
+                    "fields": "userEnteredValue"}})
+
+            append({"updateCells": {
+                    "range": {"sheetId": sheet_id, "startRowIndex": r3, "endRowIndex": r3 + 1, "startColumnIndex": 0,  "endColumnIndex": 1},  # A
+                    "rows": [{"values": [_sf('=HYPERLINK("https://intra.almg.gov.br/acontece/noticias/";IMAGE("https://intra.almg.gov.br/.content/imagens/logo-intra.svg";4;20;75))')]}],
+                    "fields": "userEnteredValue"}})
+
+            append({"updateCells": {
+                    "range": {"sheetId": sheet_id, "startRowIndex": r6, "endRowIndex": r6 + 1, "startColumnIndex": 0,  "endColumnIndex": 1},  # A
+                    "rows": [{"values": [_sf('=HYPERLINK("https://calendar.google.com/calendar/u/0?cid=a3RyajJsZmRwdGpxYTdrczBqNXVhbXBldmdAZ3JvdXAuY2FsZW5kYXIuZ29vZ2xlLmNvbQ";IMAGE("https://cdn-icons-png.flaticon.com/512/217/217837.png";4;18;18))')]}],
+                    "fields": "userEnteredValue"}})
+
+            append({"updateCells": {
+                    "range": {"sheetId": sheet_id, "startRowIndex": r6, "endRowIndex": r6 + 1, "startColumnIndex": 1,  "endColumnIndex": 2},  # B
+                    "rows": [{"values": [_sf('=HYPERLINK("https://ead.almg.gov.br/moodle/";IMAGE("https://ead.almg.gov.br/moodle/pluginfile.php/2/course/section/288/servidor_ALMG.png?time=1657626782411"))')]}],
+                    "fields": "userEnteredValue"}})
+
+            # ------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+            # ----------------------------------------------------------------------------------------------- MERGES -----------------------------------------------------------------------------------------------
+            # ------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+            append({"mergeCells": {"range": {"sheetId": sheet_id, "startRowIndex": r1, "endRowIndex": r2 + 1, "startColumnIndex": 0, "endColumnIndex": 1}, "mergeType": "MERGE_ALL"}})  # CALENDAR A
+            append({"mergeCells": {"range": {"sheetId": sheet_id, "startRowIndex": r1, "endRowIndex": r2 + 1, "startColumnIndex": 1, "endColumnIndex": 2}, "mergeType": "MERGE_ALL"}})  # PHONE B
+            append({"mergeCells": {"range": {"sheetId": sheet_id, "startRowIndex": r3, "endRowIndex": r5 + 1, "startColumnIndex": 0, "endColumnIndex": 2}, "mergeType": "MERGE_ALL"}})  # INTRA A:B
+            append({"mergeCells": {"range": {"sheetId": sheet_id, "startRowIndex": r6, "endRowIndex": r8 + 1, "startColumnIndex": 0, "endColumnIndex": 1}, "mergeType": "MERGE_ALL"}})  # AGENDA A
+            append({"mergeCells": {"range": {"sheetId": sheet_id, "startRowIndex": r6, "endRowIndex": r8 + 1, "startColumnIndex": 1, "endColumnIndex": 2}, "mergeType": "MERGE_ALL"}})  # GGA B
+            append({"mergeCells": {"range": {"sheetId": sheet_id, "startRowIndex": r1, "endRowIndex": r8 + 1, "startColumnIndex": 2, "endColumnIndex": 4}, "mergeType": "MERGE_ALL"}})  # ALMG C:D
+            append({"mergeCells": {"range": {"sheetId": sheet_id, "startRowIndex": r1, "endRowIndex": r1 + 1, "startColumnIndex": 8,  "endColumnIndex": 10}, "mergeType": "MERGE_ALL"}})  # CONFERÊNCIA (título)
+            append({"mergeCells": {"range": {"sheetId": sheet_id, "startRowIndex": r1, "endRowIndex": r1 + 1, "startColumnIndex": 12, "endColumnIndex": 15}, "mergeType": "MERGE_ALL"}})  # PROPOSIÇÕES (título)
+            append({"mergeCells": {"range": {"sheetId": sheet_id, "startRowIndex": r1, "endRowIndex": r8 + 1, "startColumnIndex": 15, "endColumnIndex": 17}, "mergeType": "MERGE_ALL"}})  # REGIMENTO
+            append({"mergeCells": {"range": {"sheetId": sheet_id, "startRowIndex": r1, "endRowIndex": r8 + 1, "startColumnIndex": 17, "endColumnIndex": 19}, "mergeType": "MERGE_ALL"}})  # CONST. ESTADUAL
+            append({"mergeCells": {"range": {"sheetId": sheet_id, "startRowIndex": r1, "endRowIndex": r8 + 1, "startColumnIndex": 19, "endColumnIndex": 21}, "mergeType": "MERGE_ALL"}})  # CONST. FEDERAL
+            append({"mergeCells": {"range": {"sheetId": sheet_id, "startRowIndex": r1, "endRowIndex": r8 + 1, "startColumnIndex": 21, "endColumnIndex": 23}, "mergeType": "MERGE_ALL"}})  # REGIMENTO (img)
+            append({"mergeCells": {"range": {"sheetId": sheet_id, "startRowIndex": r1, "endRowIndex": r8 + 1, "startColumnIndex": 23, "endColumnIndex": 25}, "mergeType": "MERGE_ALL"}})  # CONST. ESTADUAL (img)
+            append({"mergeCells": {"range": {"sheetId": sheet_id, "startRowIndex": r2, "endRowIndex": r2 + 1, "startColumnIndex": 8, "endColumnIndex": 10}, "mergeType": "MERGE_ALL"}})  # ALINE
+            append({"mergeCells": {"range": {"sheetId": sheet_id, "startRowIndex": r3, "endRowIndex": r3 + 1, "startColumnIndex": 8, "endColumnIndex": 10}, "mergeType": "MERGE_ALL"}})  # ANDRÉ
+            append({"mergeCells": {"range": {"sheetId": sheet_id, "startRowIndex": r4, "endRowIndex": r4 + 1, "startColumnIndex": 8, "endColumnIndex": 10}, "mergeType": "MERGE_ALL"}})  # DIOGO
+            append({"mergeCells": {"range": {"sheetId": sheet_id, "startRowIndex": r5, "endRowIndex": r5 + 1, "startColumnIndex": 8, "endColumnIndex": 10}, "mergeType": "MERGE_ALL"}})  # KÁTIA
+            append({"mergeCells": {"range": {"sheetId": sheet_id, "startRowIndex": r6, "endRowIndex": r6 + 1, "startColumnIndex": 8, "endColumnIndex": 10}, "mergeType": "MERGE_ALL"}})  # LEO
+            append({"mergeCells": {"range": {"sheetId": sheet_id, "startRowIndex": r7, "endRowIndex": r7 + 1, "startColumnIndex": 8, "endColumnIndex": 10}, "mergeType": "MERGE_ALL"}})  # VINÍCIUS
+            append({"mergeCells": {"range": {"sheetId": sheet_id, "startRowIndex": r8, "endRowIndex": r8 + 1, "startColumnIndex": 8, "endColumnIndex": 10}, "mergeType": "MERGE_ALL"}})  # WELDER
+
+            for rr in range(6, extra_end + 1):   # COLUNAS J:O
+                append(req_merge(sheet_id, f"J{rr}:O{rr}"))
+
+            # ------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+            # ----------------------------------------------------------------------------------------------- STYLES -----------------------------------------------------------------------------------------------
+            # ------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+            append({"repeatCell": {"range": {"sheetId": sheet_id, "startRowIndex": extra_end, "endRowIndex": extra_end, "startColumnIndex": 2, "endColumnIndex": 3},
+                "cell": {"userEnteredFormat": {"horizontalAlignment": "LEFT", "verticalAlignment": "MIDDLE"}},
+                "fields": "userEnteredFormat(horizontalAlignment,verticalAlignment)"}})
+            append({"repeatCell": {"range": {"sheetId": sheet_id, "startRowIndex": r0 - 1, "endRowIndex": r8 + 1, "startColumnIndex": 2, "endColumnIndex": 3},
+                "cell": {"userEnteredFormat": {"horizontalAlignment": "CENTER", "verticalAlignment": "MIDDLE", "backgroundColor": {"red": 0.953, "green": 0.953, "blue": 0.953}}},
+                "fields": "userEnteredFormat(horizontalAlignment,verticalAlignment,backgroundColor)"}})
+            append({"repeatCell": {"range": {"sheetId": sheet_id, "startRowIndex": r1, "endRowIndex": r5, "startColumnIndex": 0, "endColumnIndex": 2},
+                "cell": {"userEnteredFormat": {"backgroundColor": {"red": 0.9764706, "green": 0.7960784, "blue": 0.6117647}}},
+                "fields": "userEnteredFormat(backgroundColor)"}})
+            append({"repeatCell": {"range": {"sheetId": sheet_id, "startRowIndex": r3, "endRowIndex": r6, "startColumnIndex": 0, "endColumnIndex": 2},
+                "cell": {"userEnteredFormat": {"backgroundColor": {"red": 0.988, "green": 0.820, "blue": 0.800}}},
+                "fields": "userEnteredFormat(backgroundColor)"}})
+            append({"repeatCell": {"range": {"sheetId": sheet_id, "startRowIndex": r1, "endRowIndex": r1 + 1, "startColumnIndex": 4, "endColumnIndex": 6},
+                "cell": {"userEnteredFormat": {
+                    "backgroundColor": {"red": 0.6, "green": 0.0, "blue": 0.0},
+                    "horizontalAlignment": "CENTER",
+                    "verticalAlignment": "MIDDLE",
+                    "textFormat": {"fontFamily": "Vidaloka", "fontSize": 8, "bold": True, "foregroundColor": {"red": 0.85, "green": 0.67, "blue": 0.10}}}},
+                "fields": "userEnteredFormat(backgroundColor,horizontalAlignment,verticalAlignment,textFormat)"}})
+            append({"repeatCell": {"range": {"sheetId": sheet_id, "startRowIndex": r1, "endRowIndex": r1 + 1, "startColumnIndex": 6, "endColumnIndex": 11},
+                "cell": {"userEnteredFormat": {
+                    "backgroundColor": {"red": 0.0, "green": 0.0, "blue": 0.0},
+                    "horizontalAlignment": "CENTER",
+                    "verticalAlignment": "MIDDLE",
+                    "textFormat": {"fontFamily": "Vidaloka", "fontSize": 7, "bold": True, "foregroundColor": {"red": 1.0, "green": 1.0, "blue": 1.0}}}},
+                "fields": "userEnteredFormat(backgroundColor,horizontalAlignment,verticalAlignment,textFormat)"}})
+            append({"repeatCell": {"range": {"sheetId": sheet_id, "startRowIndex": r1, "endRowIndex": r1 + 1, "startColumnIndex": 11, "endColumnIndex": 15},
+                "cell": {"userEnteredFormat": {
+                    "backgroundColor": {"red": 0.9019608, "green": 0.5686275, "blue": 0.21960788},
+                    "horizontalAlignment": "CENTER",
+                    "verticalAlignment": "MIDDLE",
+                    "textFormat": {"fontFamily": "Vidaloka", "fontSize": 7, "bold": True, "foregroundColor": {"red": 0.0, "green": 0.0, "blue": 0.0}}}},
+                "fields": "userEnteredFormat(backgroundColor,horizontalAlignment,verticalAlignment,textFormat)"}})
+            append({"repeatCell": {"range": {"sheetId": sheet_id, "startRowIndex": r1 + 1, "endRowIndex": r8 + 1, "startColumnIndex": 11, "endColumnIndex": 15},
+                "cell": {"userEnteredFormat": {
+                    "backgroundColor": {"red": 1.0, "green": 0.949, "blue": 0.8},
+                    "horizontalAlignment": "CENTER",
+                    "verticalAlignment": "MIDDLE",
+                    "textFormat": {"fontFamily": "Special Elite", "fontSize": 8, "bold": True, "foregroundColor": {"red": 0.6, "green": 0.0, "blue": 0.0}}}},
+                "fields": "userEnteredFormat(backgroundColor,horizontalAlignment,verticalAlignment,textFormat)"}})
+            # E..K (nomes e contagens): cinza + Boogaloo 8; nomes à direita, números centralizados
+            for col, alinh in ((4, "RIGHT"), (5, "CENTER"), (6, "RIGHT"), (7, "CENTER"), (8, "RIGHT"), (10, "CENTER")):
+                append({"repeatCell": {"range": _range(r2, r8 + 1, col, col + 1),
+                    "cell": {"userEnteredFormat": {"backgroundColor": {"red": 0.741, "green": 0.741, "blue": 0.741}, "horizontalAlignment": alinh, "verticalAlignment": "MIDDLE",
+                            "textFormat": {"fontFamily": "Boogaloo", "fontSize": 8, "bold": False}}},
+                    "fields": "userEnteredFormat(backgroundColor,horizontalAlignment,verticalAlignment,textFormat)"}})
+
+            # ------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+            # ----------------------------------------------------------------------------------------------- VALUES -----------------------------------------------------------------------------------------------
+            # ------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+            # nomes da equipe nas colunas E, G e I: uma pessoa por linha (r2..r6, contíguas) + dropdown DD5
+            NOMES_ROWS = [{"values": [_sv(nome)]} for nome in RODAPE_NOMES]
+            for col in (4, 6, 8):
+                nomes_rng = _range(r2, r2 + len(RODAPE_NOMES), col, col + 1)
+                append({"updateCells": {"range": nomes_rng, "rows": NOMES_ROWS, "fields": "userEnteredValue"}})
+                append({"setDataValidation": {"range": nomes_rng,
+                    "rule": _dd_rule(LISTA_DROPDOWN_5, strict=False)}})
+
+            tipo_rng = _range(r2, r8 + 1, 12, 13)  # M: tipo (PL) + DD6
+            append({"repeatCell": {"range": tipo_rng, "cell": _sv("PL"), "fields": "userEnteredValue"}})
+            append({"setDataValidation": {"range": tipo_rng, "rule": _dd_rule(LISTA_DROPDOWN_6, strict=True)}})
+
+            ano_rng = _range(r2, r8 + 1, 14, 15)   # O: ano (2026) + DD7
+            append({"repeatCell": {"range": ano_rng, "cell": _sv("2026"), "fields": "userEnteredValue"}})
+            append({"setDataValidation": {"range": ano_rng, "rule": _dd_rule(LISTA_DROPDOWN_7, strict=True)}})
+
+            # ------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+            # ------------------------------------------------------------------------------------------------ NOTES -----------------------------------------------------------------------------------------------
+            # ------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+            append({"updateCells": {"range": {"sheetId": sheet_id, "startRowIndex": r1, "endRowIndex": r1 + 1, "startColumnIndex": 1, "endColumnIndex": 2},
+                "rows": [{"values": [{"note": NOTA_RAMAIS}]}],
+                "fields": "note"}})
+
+            append({"updateCells": {"range": {"sheetId": sheet_id, "startRowIndex": 7, "endRowIndex": 8, "startColumnIndex": 3, "endColumnIndex": 4},
+                "rows": [{"values": [{"note": NOTA_PRIORIDADES}]}],
+                "fields": "note"}})
+
+            # ------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+            # ----------------------------------------------------------------------------------------------- BORDERS ----------------------------------------------------------------------------------------------
+            # ------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+            # BLACK / DARK_RED_1 (#CC0000 = 0.8 de vermelho) são as cores globais; os dicts são compartilhados
+            def _border(sr: int, er: int, sc: int, ec: int, **edges) -> dict:
+                return {"updateBorders": {"range": _range(sr, er, sc, ec), **edges}}
+
+            append(_border(5, footer_start - 1, 8, 9, right=border("SOLID_MEDIUM", BLACK)))
+            append(_border(r1, r8 + 1, 0, 1, right=border("DOTTED", DARK_RED_1)))
+            append(_border(r7 + 1, r7 + 2, 0, 2, top=border("DOTTED", DARK_RED_1)))
+            append(_border(r0, r8 + 1, 1, 2, right=border("SOLID", BLACK), bottom=border("SOLID_MEDIUM", BLACK)))
+            append(_border(r0, r8 + 1, 4, 5, left=border("SOLID", BLACK)))
+            append(_border(r1, r8 + 1, 17, 18, left=border("SOLID_MEDIUM", DARK_RED_1)))
+            # linha final do rodapé (r8): a base SOLID_MEDIUM já é o "top" da linha seguinte — uma request só
+            append(_border(r8, r8 + 1, 0, 25, bottom=border("SOLID_MEDIUM", BLACK)))
+
+            # ====================================================================================================================================================================================================
+            # ========================================================================================== CONDICIONAIS ============================================================================================
+            # ====================================================================================================================================================================================================
+            # (fórmula, fundo, fonte, negrito) — a ordem define o "index" da regra; negrito None = não mexe
+            # os prefixos de C têm uma cor cada e nenhum contém o outro, então não dá para fundir regras
+            CF_RULES = [
+                ('=$H6=TRUE',                                                    "#434343", "#999999", True),
+                ('=OR($I6=TRUE;REGEXMATCH(TO_TEXT($I6);"-"))',                   "#CCCCCC", "#000000", None),
+                ('=REGEXMATCH($C6;"^DIÁRIO")',                                   "#660000", "#FFFFFF", True),
+                ('=REGEXMATCH($C6;"^REUNIÕES")',                                 "#274E13", "#FFFFFF", True),
+                ('=REGEXMATCH($C6;"^REQUERIMENTOS DE COMISSÕES")',               "#FF9900", "#FFFFFF", True),
+                ('=REGEXMATCH($C6;"^LANÇAMENTOS DE TRAMITAÇÃO")',                "#20124D", "#FFFFFF", True),
+                ('=REGEXMATCH($C6;"^CADASTRO DE E-MAILS")',                      "#073763", "#FFFFFF", True),
+                ('=REGEXMATCH($C6;"^IMPLANTAÇÃO DE TEXTOS")',                    "#7F6000", "#FFFFFF", True),
+                ('=OR(REGEXMATCH($B6;"^GDI-GGA");REGEXMATCH($C6;"^MATE"))',       "#000000", "#FFFFFF", True),
+            ]
+            CF_RANGES = [{"sheetId": sheet_id, "startRowIndex": 5, "endRowIndex": n_rows, "startColumnIndex": 0, "endColumnIndex": 25}]
+
+            for i, (formula, bg_hex, fg_hex, bold) in enumerate(CF_RULES):
+                text_fmt = {"foregroundColor": rgb_hex_to_api(fg_hex)}
+                if bold is not None:
+                    text_fmt["bold"] = bold
+                append({"addConditionalFormatRule": {"rule": {"ranges": CF_RANGES,
+                    "booleanRule": {"condition": {"type": "CUSTOM_FORMULA", "values": [{"userEnteredValue": formula}]},
+                        "format": {"backgroundColor": rgb_hex_to_api(bg_hex), "textFormat": text_fmt}}},
+                    "index": i}})
+
+            return reqs
+
+        reqs.extend(_footer_reqs(sheet_id, extra_end, ws.row_count))
 
         # ====================================================================================================================================================================================================
         # ============================================================================================ CHECKBOX ==============================================================================================
@@ -2956,17 +3734,77 @@ def main(entrada_override=None, spreadsheet_url_or_id=None, auth_mode="colab", s
         # ============================================================================================= VALUES ===============================================================================================
         # ====================================================================================================================================================================================================
 
-        dd = int(diario_key[6:8])
-        mm = int(diario_key[4:6])
-        yyyy = int(diario_key[0:4])
-        a5_txt = f"{dd}/{mm}"
-
-        from datetime import datetime, timedelta
+        yyyy, mm, dd = int(diario_key[0:4]), int(diario_key[4:6]), int(diario_key[6:8])
 
         data = []
+        aba = f"{tab_name}!"  # prefixo dos ranges desta aba, montado uma vez
 
         def add(a1, values):
-            data.append({"range": f"{tab_name}!{a1}", "values": values})
+            data.append({"range": aba + a1, "values": values})
+
+        def add_coluna(col, formula):
+            # mesma fórmula de col6 até a linha antes do rodapé: um repeatCell (o Sheets ajusta as refs relativas
+            # linha a linha) em vez de N cópias do texto no values_batch_update; col é a letra ("A", "AA", ...)
+            col0 = gspread.utils.a1_to_rowcol(f"{col}1")[1] - 1
+            reqs.append({"repeatCell": {
+                    "range": {"sheetId": sheet_id, "startRowIndex": 5, "endRowIndex": footer_start - 1, "startColumnIndex": col0, "endColumnIndex": col0 + 1},
+                    "cell": {"userEnteredValue": {"formulaValue": formula}},
+                    "fields": "userEnteredValue"}})
+
+        RE_CELULA = re.compile(r"^([A-Z]+)(\d+)$")
+
+        def _juntar_celulas(data: list) -> list:
+            # células únicas vizinhas na mesma linha (H1, I1, ..., O1) viram um só ValueRange (H1:O1);
+            # ranges de várias células seguem como estão
+            outros, cels = [], {}
+            for d in data:
+                aba, _, a1 = d["range"].rpartition("!")
+                if RE_CELULA.match(a1) and len(d["values"]) == 1 and len(d["values"][0]) == 1:
+                    row, col = gspread.utils.a1_to_rowcol(a1)
+                    cels[(aba, row, col)] = d["values"][0][0]
+                else:
+                    outros.append(d)
+
+            runs = []  # [aba, linha, col_ini, col_fim, valores]
+            for (aba, row, col) in sorted(cels):
+                run = runs[-1] if runs else None
+                if run and run[0] == aba and run[1] == row and run[3] == col - 1:
+                    run[3] = col
+                    run[4].append(cels[(aba, row, col)])
+                else:
+                    runs.append([aba, row, col, col, [cels[(aba, row, col)]]])
+
+            for aba, row, c0, c1, vals in runs:
+                a1 = gspread.utils.rowcol_to_a1(row, c0)
+                if c1 > c0:
+                    a1 += ":" + gspread.utils.rowcol_to_a1(row, c1)
+                outros.append({"range": f"{aba}!{a1}", "values": [vals]})
+            return outros
+
+        def _juntar_validacoes(reqs: list) -> list:
+            # setDataValidation com a mesma regra, nas mesmas colunas e em linhas contíguas (os checkboxes linha a
+            # linha) viram um só request com o range esticado; uma validação de outra regra nas mesmas colunas
+            # fecha o grupo, então a ordem entre regras diferentes é a mesma de antes; a regra entra na chave pela
+            # identidade (as de _dd_rule e REGRA_CHECKBOX são objetos compartilhados), sem serializar nada
+            saida, abertos = [], {}
+            for r in reqs:
+                dv = r.get("setDataValidation")
+                rng = dv.get("range") if dv else None
+                if not rng or any(k not in rng for k in ("startRowIndex", "endRowIndex", "startColumnIndex", "endColumnIndex")):
+                    saida.append(r)
+                    continue
+                sid, sc, ec = rng.get("sheetId"), rng["startColumnIndex"], rng["endColumnIndex"]
+                chave = (sid, sc, ec, id(dv.get("rule")))
+                for k in [k for k in abertos if k != chave and k[0] == sid and k[1] < ec and sc < k[2]]:
+                    del abertos[k]
+                grupo = abertos.get(chave)
+                if grupo is not None and grupo["range"]["endRowIndex"] == rng["startRowIndex"]:
+                    grupo["range"]["endRowIndex"] = rng["endRowIndex"]
+                    continue
+                grupo = {**dv, "range": dict(rng)}
+                saida.append({"setDataValidation": grupo})
+                abertos[chave] = grupo
+            return saida
 
         add("A5:B5", [[f"=DATE({yyyy};{mm};{dd})", ""]])
         add("A1", [[ '=HYPERLINK("https://www.almg.gov.br/home/index.html";IMAGE("https://sisap.almg.gov.br/banner.png";4;43;110))' ]])
@@ -3006,1127 +3844,90 @@ def main(entrada_override=None, spreadsheet_url_or_id=None, auth_mode="colab", s
         add("B7", [["-"]])
         add("E8:G8", [[dmenos2]])
 
-        add(f"A6:A{footer_start - 1}", [['''=IFS(
-
-    OR(
-    INDIRECT("C"&ROW())="-";
-    INDIRECT("C"&ROW())="?")
-    ;"-";
-
-    OR(INDIRECT("U"&ROW())<>"TOTAL");
-    IFS(
-    OR(INDIRECT("C"&ROW())="";INDIRECT("C"&ROW())="IMPLANTAÇÃO DE TEXTOS";INDIRECT("U"&ROW())="IMPLANTAÇÃO");"";
-
-    OR(INDIRECT("C"&ROW())="DIÁRIO DO EXECUTIVO";INDIRECT("C"&ROW())="LEIS";INDIRECT("C"&ROW())="LEI, COM PROPOSIÇÃO ANEXADA";LEFT(INDIRECT("C"&ROW());4)="VETO");
-        HYPERLINK(
-        "https://www.jornalminasgerais.mg.gov.br/edicao-do-dia?dados=" &
-        ENCODEURL("{""dataPublicacaoSelecionada"":""" & TEXT($B$6;"yyyy-mm-dd") & "T03:00:00.000Z""}");
-        IMAGE("https://www.almg.gov.br/favicon.ico";4;15;15)
-        );
-
-    INDIRECT("C"&ROW())="DIÁRIO DO EXECUTIVO - EDIÇÃO EXTRA";
-        HYPERLINK(
-        "https://www.jornalminasgerais.mg.gov.br/edicao-do-dia?dados=" &
-        ENCODEURL("{""dataPublicacaoSelecionada"":""" & TEXT($B$6;"yyyy-mm-dd") & "T03:00:00.000Z""}");
-        IMAGE("https://www.almg.gov.br/favicon.ico";4;15;15)
-        );
-
-    INDIRECT("C"&ROW())="DIÁRIO DO LEGISLATIVO";HYPERLINK("https://diariolegislativo.almg.gov.br/"&RIGHT(INDIRECT("B"&ROW());4)&"/L"&RIGHT(INDIRECT("B"&ROW());4)&MID(INDIRECT("B"&ROW());4;2)&LEFT(INDIRECT("B"&ROW());2)&".pdf";IMAGE("https://www.almg.gov.br/favicon.ico";4;15;15));
-    INDIRECT("C"&ROW())="DIÁRIO DO LEGISLATIVO - EDIÇÃO EXTRA";HYPERLINK("https://diariolegislativo.almg.gov.br/"&RIGHT(INDIRECT("B"&ROW());4)&"/L"&RIGHT(INDIRECT("B"&ROW());4)&MID(INDIRECT("B"&ROW());4;2)&LEFT(INDIRECT("B"&ROW());2)&"E.pdf";IMAGE("https://www.almg.gov.br/favicon.ico";4;15;15));
-
-    INDIRECT("C"&ROW())="REUNIÕES DE PLENÁRIO";HYPERLINK("https://www.almg.gov.br/atividade-parlamentar/plenario/agenda/?pesquisou=true&q=&tipo=&dataInicio="&TO_TEXT(INDIRECT("B"&ROW()))&"&dataFim="&TO_TEXT(INDIRECT("B"&ROW()));IMAGE("https://www.almg.gov.br/favicon.ico";4;15;15));
-
-    INDIRECT("C"&ROW())="REUNIÕES DE COMISSÕES";HYPERLINK("https://www.almg.gov.br/atividade-parlamentar/comissoes/agenda/?pesquisou=true&q=&tpComissao=&idComissao=&dataInicio="&TO_TEXT(INDIRECT("B"&ROW()))&"&dataFim="&TO_TEXT(INDIRECT("B"&ROW()))&"&pesquisa=todas&ordem=1&tp=30";IMAGE("https://www.almg.gov.br/favicon.ico";4;15;15));
-
-    INDIRECT("C"&ROW())="REQUERIMENTOS DE COMISSÕES";HYPERLINK("https://www.almg.gov.br/atividade-parlamentar/comissoes/agenda/?pesquisou=true&q=&tpComissao=&idComissao=&dataInicio="&TO_TEXT($V$2)&"&dataFim="&TO_TEXT($V$2)&"&pesquisa=todas&ordem=1&tp=30";IMAGE("https://www.almg.gov.br/favicon.ico";4;15;15));
-    INDIRECT("C"&ROW())="OFÍCIOS DA SECRETARIA-GERAL DA MESA";HYPERLINK("https://stl.almg.gov.br/";IMAGE("https://www.almg.gov.br/favicon.ico";4;15;15));
-    INDIRECT("C"&ROW())="LANÇAMENTOS DE PRECLUSÃO DE PRAZO";HYPERLINK("https://webmail.almg.gov.br/";IMAGE("https://www.almg.gov.br/favicon.ico";4;15;15));
-    INDIRECT("C"&ROW())="LANÇAMENTOS DE TRAMITAÇÃO";HYPERLINK("https://www.almg.gov.br/";IMAGE("https://www.almg.gov.br/favicon.ico";4;15;15));
-    INDIRECT("C"&ROW())="CADASTRO DE E-MAILS";HYPERLINK("https://webmail.almg.gov.br/";IMAGE("https://www.almg.gov.br/favicon.ico";4;15;15));
-
-    INDIRECT("C"&ROW())="DIÁRIO DO EXECUTIVO";HYPERLINK("https://www.jornalminasgerais.mg.gov.br/?dataJornal="&RIGHT($B$6;4)&"-"&MID($B$6;4;2)&"-"&LEFT($B$6;2)&"";IMAGE("https://seeklogo.com/images/B/bandeira-minas-gerais-logo-AD7B6F3604-seeklogo.com.png";4;15;15));
-    LEFT(INDIRECT("C"&ROW());27)="RECEBIMENTO DE PROPOSIÇÃO: ";HYPERLINK("https://stl.almg.gov.br/html5/?versao=3.1.2#rest-oficios-"&MID($B$6;8;4)&"-"&RIGHT($B$6;4)&"-SGM";IMAGE("https://seeklogo.com/images/B/bandeira-minas-gerais-logo-AD7B6F3604-seeklogo.com.png";4;15;15));
-    INDIRECT("C"&ROW())="DESIGNAÇÃO DE RELATOR";HYPERLINK("https://webmail.almg.gov.br/imp/dynamic.php?page=mailbox#mbox:SU5CT1guREVTSUdOQcOHw4NPIERFIFJFTEFUT1I";IMAGE("https://seeklogo.com/images/B/bandeira-minas-gerais-logo-AD7B6F3604-seeklogo.com.png";4;15;15));
-    INDIRECT("C"&ROW())="CUMPRIMENTO DE DILIGÊNCIA";HYPERLINK("https://webmail.almg.gov.br/imp/dynamic.php?page=mailbox#mbox:SU5CT1guQ1VNUFJJTUVOVE8gREUgRElMSUfDik5DSUE";IMAGE("https://seeklogo.com/images/B/bandeira-minas-gerais-logo-AD7B6F3604-seeklogo.com.png";4;15;15));
-    INDIRECT("C"&ROW())="REUNIÃO ORIGINADA DE REQUERIMENTO";HYPERLINK("https://webmail.almg.gov.br/imp/dynamic.php?page=mailbox#mbox:SU5CT1guUkVVTknDg08gT1JJR0lOQURBIERFIFJRQw";IMAGE("https://seeklogo.com/images/B/bandeira-minas-gerais-logo-AD7B6F3604-seeklogo.com.png";4;15;15));
-    LEFT(INDIRECT("C"&ROW());32)="REUNIÃO COM DEBATE DE PROPOSIÇÃO";HYPERLINK("https://webmail.almg.gov.br/imp/dynamic.php?page=mailbox#mbox:SU5CT1guUkVVTknDg08gQ09NIERFQkFURSBERSBQUk9QT1NJw4fDg08";IMAGE("https://seeklogo.com/images/B/bandeira-minas-gerais-logo-AD7B6F3604-seeklogo.com.png";4;15;15));
-    INDIRECT("C"&ROW())="SECRETARIA-GERAL DA MESA";HYPERLINK("https://webmail.almg.gov.br/imp/dynamic.php?page=mailbox#mbox:SU5CT1guU0VDUkVUQVJJQS1HRVJBTCBEQSBNRVNB";IMAGE("https://seeklogo.com/images/B/bandeira-minas-gerais-logo-AD7B6F3604-seeklogo.com.png";4;15;15));
-
-    OR(
-    LEFT(INDIRECT("C"&ROW());9)="ORDINÁRIA";
-    LEFT(INDIRECT("C"&ROW());14)="EXTRAORDINÁRIA";
-    LEFT(INDIRECT("C"&ROW());8)="ESPECIAL";
-    LEFT(INDIRECT("C"&ROW());14)="SOLENE");
-    IFS(
-    E6="cancelada";
-    HYPERLINK("https://www.almg.gov.br/atividade_parlamentar/plenario/interna.html?tipo=pauta&dDet="&LEFT($X$4;2)&"|"&MID($X$4;4;2)&"|"&RIGHT($X$4;4)&"&hDet="&TO_TEXT(INDIRECT("B"&ROW()));
-    IMAGE("https://seeklogo.com/images/B/bandeira-minas-gerais-logo-AD7B6F3604-seeklogo.com.png";4;15;15));
-    E6<>"cancelada";
-    HYPERLINK("https://www.almg.gov.br/atividade_parlamentar/plenario/interna.html?tipo=res&dia="&LEFT($X$4;2)&"&mes="&MID($X$4;4;2)&"&ano="&RIGHT($X$4;4)&"&hr="&TO_TEXT(INDIRECT("B"&ROW()));
-    IMAGE("https://seeklogo.com/images/B/bandeira-minas-gerais-logo-AD7B6F3604-seeklogo.com.png";4;15;15)));
-
-    OR(LEFT(INDIRECT("C"&ROW());10)="COMISSÃO D";LEFT(INDIRECT("C"&ROW());10)="COMISSÃO E";LEFT(INDIRECT("C"&ROW());6)="GRANDE";LEFT(INDIRECT("C"&ROW());7)="REUNIÃO";RIGHT(INDIRECT("C"&ROW());11)="PERMANENTES";RIGHT(INDIRECT("C"&ROW());8)="CONJUNTA";LEFT(INDIRECT("C"&ROW());4)="CIPE");HYPERLINK("https://www.almg.gov.br/atividade-parlamentar/comissoes/"
-    &IFS(RIGHT(INDIRECT("C"&ROW());6)="VISITA";"visita";RIGHT(INDIRECT("C"&ROW());8)<>"VISITA";"reuniao")&"/?idTipo="
-    &IFS(
-    OR(RIGHT(INDIRECT("C"&ROW());11)="GASTRONOMIA";RIGHT(INDIRECT("C"&ROW());6)="URBANA");"2";
-    OR(MID(INDIRECT("C"&ROW());10;14)="EXTRAORDINÁRIA";MID(INDIRECT("C"&ROW());13;5)="ÉTICA";RIGHT(INDIRECT("C"&ROW());8)="ESPECIAL");"5";
-    OR(RIGHT(INDIRECT("C"&ROW());14)="EXTRAORDINÁRIA";MID(INDIRECT("C"&ROW());13;8)="PROPOSTA";RIGHT(INDIRECT("C"&ROW());7)="ANIMAIS";RIGHT(INDIRECT("C"&ROW());6)="CÂNCER";RIGHT(INDIRECT("C"&ROW());7)="MARIANA");"2";
-    OR(LEFT(INDIRECT("C"&ROW());6)="GRANDE";LEFT(INDIRECT("C"&ROW());7)="REUNIÃO";RIGHT(INDIRECT("C"&ROW());11)="PERMANENTES";RIGHT(INDIRECT("C"&ROW());8)="CONJUNTA");"3";
-    RIGHT(INDIRECT("C"&ROW());14)="REFORMA URBANA";"1";
-    RIGHT(INDIRECT("C"&ROW());8)="REGIONAL";"6";
-    LEFT(INDIRECT("C"&ROW());4)="CIPE";"7";
-    RIGHT(INDIRECT("C"&ROW());14)<>"EXTRAORDINÁRIA";"1")
-    &"&idCom="
-    &IFS(
-    LEFT(INDIRECT("C"&ROW());33)="COMISSÃO DE ADMINISTRAÇÃO PÚBLICA";"1";
-    LEFT(INDIRECT("C"&ROW());40)="COMISSÃO DE AGROPECUÁRIA E AGROINDÚSTRIA";"1075";
-    LEFT(INDIRECT("C"&ROW());48)="COMISSÃO DE ASSUNTOS MUNICIPAIS E REGIONALIZAÇÃO";"3";
-    LEFT(INDIRECT("C"&ROW());34)="COMISSÃO DE CONSTITUIÇÃO E JUSTIÇA";"5";
-    LEFT(INDIRECT("C"&ROW());19)="COMISSÃO DE CULTURA";"675";
-    LEFT(INDIRECT("C"&ROW());50)="COMISSÃO DE DEFESA DO CONSUMIDOR E DO CONTRIBUINTE";"489";
-    LEFT(INDIRECT("C"&ROW());41)="COMISSÃO DE DEFESA DOS DIREITOS DA MULHER";"1132";
-    LEFT(INDIRECT("C"&ROW());57)="COMISSÃO DE DEFESA DOS DIREITOS DA PESSOA COM DEFICIÊNCIA";"859";
-    LEFT(INDIRECT("C"&ROW());37)="COMISSÃO DE DESENVOLVIMENTO ECONÔMICO";"1077";
-    LEFT(INDIRECT("C"&ROW());28)="COMISSÃO DE DIREITOS HUMANOS";"8";
-    LEFT(INDIRECT("C"&ROW());42)="COMISSÃO DE EDUCAÇÃO, CIÊNCIA E TECNOLOGIA";"849";
-    LEFT(INDIRECT("C"&ROW());38)="COMISSÃO DE ESPORTE, LAZER E JUVENTUDE";"850";
-    LEFT(INDIRECT("C"&ROW());50)="COMISSÃO DE FISCALIZAÇÃO FINANCEIRA E ORÇAMENTÁRIA";"10";
-    LEFT(INDIRECT("C"&ROW());55)="COMISSÃO DE MEIO AMBIENTE E DESENVOLVIMENTO SUSTENTÁVEL";"799";
-    LEFT(INDIRECT("C"&ROW());27)="COMISSÃO DE MINAS E ENERGIA";"800";
-    LEFT(INDIRECT("C"&ROW());32)="COMISSÃO DE PARTICIPAÇÃO POPULAR";"585";
-    LEFT(INDIRECT("C"&ROW());63)="COMISSÃO DE PREVENÇÃO E COMBATE AO USO DE CRACK E OUTRAS DROGAS";"959";
-    LEFT(INDIRECT("C"&ROW());19)="COMISSÃO DE REDAÇÃO";"13";
-    LEFT(INDIRECT("C"&ROW());17)="COMISSÃO DE SAÚDE";"14";
-    LEFT(INDIRECT("C"&ROW());29)="COMISSÃO DE SEGURANÇA PÚBLICA";"508";
-    LEFT(INDIRECT("C"&ROW());60)="COMISSÃO DO TRABALHO, DA PREVIDÊNCIA E DA ASSISTÊNCIA SOCIAL";"1076";
-    LEFT(INDIRECT("C"&ROW());52)="COMISSÃO DE TRANSPORTE, COMUNICAÇÃO E OBRAS PÚBLICAS";"12";
-    LEFT(INDIRECT("C"&ROW());17)="COMISSÃO DE ÉTICA";"578";
-    LEFT(INDIRECT("C"&ROW());71)="COMISSÃO EXTRAORDINÁRIA DAS ENERGIAS RENOVÁVEIS E DOS RECURSOS HÍDRICOS";"1211";
-    LEFT(INDIRECT("C"&ROW());62)="COMISSÃO EXTRAORDINÁRIA DE ACOMPANHAMENTO DO ACORDO DE MARIANA";"1232";
-    LEFT(INDIRECT("C"&ROW());66)="COMISSÃO EXTRAORDINÁRIA DE DEFESA DA HABITAÇÃO E DA REFORMA URBANA";"1260";
-    LEFT(INDIRECT("C"&ROW());62)="COMISSÃO EXTRAORDINÁRIA DE PREVENÇÃO E ENFRENTAMENTO AO CÂNCER";"1258";
-    LEFT(INDIRECT("C"&ROW());47)="COMISSÃO EXTRAORDINÁRIA DE PROTEÇÃO AOS ANIMAIS";"1230";
-    LEFT(INDIRECT("C"&ROW());41)="COMISSÃO EXTRAORDINÁRIA DAS PRIVATIZAÇÕES";"1212";
-    LEFT(INDIRECT("C"&ROW());48)="COMISSÃO EXTRAORDINÁRIA DE TURISMO E GASTRONOMIA";"1261";
-    LEFT(INDIRECT("C"&ROW());46)="COMISSÃO EXTRAORDINÁRIA PRÓ-FERROVIAS MINEIRAS";"1217";
-    LEFT(INDIRECT("C"&ROW());15)="GRANDE COMISSÃO";"10";
-    LEFT(INDIRECT("C"&ROW());53)="COMISSÃO DE PROPOSTA DE EMENDA À CONSTITUIÇÃO 42 2024";"1279";
-    LEFT(INDIRECT("C"&ROW());53)="COMISSÃO DE PROPOSTA DE EMENDA À CONSTITUIÇÃO 24 2023";"1280";
-    LEFT(INDIRECT("C"&ROW());53)="COMISSÃO DE PROPOSTA DE EMENDA À CONSTITUIÇÃO 58 2025";"1281";
-    LEFT(INDIRECT("C"&ROW());45)="COMISSÃO DE MEMBROS DAS COMISSÕES PERMANENTES";"10";
-    RIGHT(INDIRECT("C"&ROW());9)="PCD + SPU";959;
-    RIGHT(INDIRECT("C"&ROW());9)="CTU + DEC";675;
-    LEFT(INDIRECT("C"&ROW());16)="REUNIÃO CONJUNTA";"1";
-    LEFT(INDIRECT("C"&ROW());4)="CIPE";"811";
-    LEFT(INDIRECT("C"&ROW());24)="COMISSÃO DE VETO 18 2025";"1265";
-    LEFT(INDIRECT("C"&ROW());24)="COMISSÃO DE VETO 19 2025";"1264";
-    LEFT(INDIRECT("C"&ROW());24)="COMISSÃO DE VETO 20 2025";"1267";
-    LEFT(INDIRECT("C"&ROW());24)="COMISSÃO DE VETO 21 2025";"1262";
-    LEFT(INDIRECT("C"&ROW());24)="COMISSÃO DE VETO 22 2025";"1266";
-    LEFT(INDIRECT("C"&ROW());24)="COMISSÃO DE VETO 23 2025";"1263";
-    LEFT(INDIRECT("C"&ROW());24)="COMISSÃO DE VETO 24 2025";"1270"
-    )&"&dia="&IFS(MID($A$5;2;1)="/";LEFT($A$5;1);MID($A$5;2;1)<>"/";LEFT($A$5;2))&"&mes="&IFS(MID($A$5;3;1)="/";IFS(MID($A$5;4;1)<>"1";RIGHT($A$5;1);MID($A$5;4;1)="1";IFS(MID($A$5;5;1)="";RIGHT($A$5;1);MID($A$5;5;1)<>"";RIGHT($A$5;2)));MID($A$5;2;1)="/";IFS(MID($A$5;3;1)<>"1";RIGHT($A$5;1);MID($A$5;3;1)="1";IFS(MID($A$5;4;1)="";RIGHT($A$5;1);MID($A$5;4;1)<>"";RIGHT($A$5;2))))&"&ano="&RIGHT($B$6;4)&"&hr="&TO_TEXT(INDIRECT("B"&ROW()))&"&tpCom="&IFS(LEFT(INDIRECT("C"&ROW());45)="COMISSÃO DE MEMBROS DAS COMISSÕES PERMANENTES";"3";LEFT(INDIRECT("C"&ROW());45)<>"COMISSÃO DE MEMBROS DAS COMISSÕES PERMANENTES";"2")&"&aba=js_tabResultado";
-    IMAGE("https://seeklogo.com/images/B/bandeira-minas-gerais-logo-AD7B6F3604-seeklogo.com.png";4;15;15));
-
-
-
-    OR(LEFT(INDIRECT("C"&ROW());5)="RQC: ");HYPERLINK("https://www.almg.gov.br/atividade-parlamentar/comissoes/reuniao/?idTipo="
-    &IFS(
-    OR(RIGHT(INDIRECT("C"&ROW());11)="GASTRONOMIA";RIGHT(INDIRECT("C"&ROW());6)="URBANA");"2";
-    OR(RIGHT(INDIRECT("C"&ROW());14)="EXTRAORDINÁRIA";RIGHT(INDIRECT("C"&ROW());25)="EXTRAORDINÁRIA, APROVADOS";RIGHT(INDIRECT("C"&ROW());26)="EXTRAORDINÁRIA - APROVADOS";RIGHT(INDIRECT("C"&ROW());25)="EXTRAORDINÁRIA, RECEBIDOS";RIGHT(INDIRECT("C"&ROW());26)="EXTRAORDINÁRIA - RECEBIDOS";RIGHT(INDIRECT("C"&ROW());37)="EXTRAORDINÁRIA, RECEBIDOS E APROVADOS";RIGHT(INDIRECT("C"&ROW());38)="EXTRAORDINÁRIA - RECEBIDOS E APROVADOS";MID(INDIRECT("C"&ROW());13;8)="PROPOSTA";RIGHT(INDIRECT("C"&ROW());7)="ANIMAIS";RIGHT(INDIRECT("C"&ROW());6)="CÂNCER";RIGHT(INDIRECT("C"&ROW());7)="MARIANA");"2";
-    OR(LEFT(INDIRECT("C"&ROW());6)="GRANDE";LEFT(INDIRECT("C"&ROW());7)="REUNIÃO";RIGHT(INDIRECT("C"&ROW());11)="PERMANENTES";RIGHT(INDIRECT("C"&ROW());8)="CONJUNTA";RIGHT(INDIRECT("C"&ROW());19)="CONJUNTA, APROVADOS";RIGHT(INDIRECT("C"&ROW());19)="CONJUNTA, RECEBIDOS");"3";
-    OR(MID(INDIRECT("C"&ROW());10;14)="EXTRAORDINÁRIA";RIGHT(INDIRECT("C"&ROW());8)="ESPECIAL");"5";
-    LEFT(INDIRECT("C"&ROW());4)="CIPE";"6";
-    RIGHT(INDIRECT("C"&ROW());14)<>"EXTRAORDINÁRIA";"1")
-    &"&idCom="
-    &IFS(
-    LEFT(INDIRECT("C"&ROW());26)="RQC: ADMINISTRAÇÃO PÚBLICA";"1";
-    LEFT(INDIRECT("C"&ROW());33)="RQC: AGROPECUÁRIA E AGROINDÚSTRIA";"1075";
-    LEFT(INDIRECT("C"&ROW());41)="RQC: ASSUNTOS MUNICIPAIS E REGIONALIZAÇÃO";"3";
-    LEFT(INDIRECT("C"&ROW());27)="RQC: CONSTITUIÇÃO E JUSTIÇA";"5";
-    LEFT(INDIRECT("C"&ROW());12)="RQC: CULTURA";"675";
-    LEFT(INDIRECT("C"&ROW());43)="RQC: DEFESA DO CONSUMIDOR E DO CONTRIBUINTE";"489";
-    LEFT(INDIRECT("C"&ROW());34)="RQC: DEFESA DOS DIREITOS DA MULHER";"1132";
-    LEFT(INDIRECT("C"&ROW());50)="RQC: DEFESA DOS DIREITOS DA PESSOA COM DEFICIÊNCIA";"859";
-    LEFT(INDIRECT("C"&ROW());30)="RQC: DESENVOLVIMENTO ECONÔMICO";"1077";
-    LEFT(INDIRECT("C"&ROW());21)="RQC: DIREITOS HUMANOS";"8";
-    LEFT(INDIRECT("C"&ROW());35)="RQC: EDUCAÇÃO, CIÊNCIA E TECNOLOGIA";"849";
-    LEFT(INDIRECT("C"&ROW());31)="RQC: ESPORTE, LAZER E JUVENTUDE";"850";
-    LEFT(INDIRECT("C"&ROW());43)="RQC: FISCALIZAÇÃO FINANCEIRA E ORÇAMENTÁRIA";"10";
-    LEFT(INDIRECT("C"&ROW());48)="RQC: MEIO AMBIENTE E DESENVOLVIMENTO SUSTENTÁVEL";"799";
-    LEFT(INDIRECT("C"&ROW());20)="RQC: MINAS E ENERGIA";"800";
-    LEFT(INDIRECT("C"&ROW());25)="RQC: PARTICIPAÇÃO POPULAR";"585";
-    LEFT(INDIRECT("C"&ROW());56)="RQC: PREVENÇÃO E COMBATE AO USO DE CRACK E OUTRAS DROGAS";"959";
-    LEFT(INDIRECT("C"&ROW());12)="RQC: REDAÇÃO";"13";
-    LEFT(INDIRECT("C"&ROW());10)="RQC: SAÚDE";"14";
-    LEFT(INDIRECT("C"&ROW());22)="RQC: SEGURANÇA PÚBLICA";"508";
-    LEFT(INDIRECT("C"&ROW());53)="RQC: TRABALHO, DA PREVIDÊNCIA E DA ASSISTÊNCIA SOCIAL";"1076";
-    LEFT(INDIRECT("C"&ROW());45)="RQC: TRANSPORTE, COMUNICAÇÃO E OBRAS PÚBLICAS";"12";
-    LEFT(INDIRECT("C"&ROW());67)="RQC: EXTRAORDINÁRIA DAS ENERGIAS RENOVÁVEIS E DOS RECURSOS HÍDRICOS";"1211";
-    LEFT(INDIRECT("C"&ROW());58)="RQC: EXTRAORDINÁRIA DE ACOMPANHAMENTO DO ACORDO DE MARIANA";"1232";
-    LEFT(INDIRECT("C"&ROW());62)="RQC: EXTRAORDINÁRIA DE DEFESA DA HABITAÇÃO E DA REFORMA URBANA";"1260";
-    LEFT(INDIRECT("C"&ROW());58)="RQC: EXTRAORDINÁRIA DE PREVENÇÃO E ENFRENTAMENTO AO CÂNCER";"1258";
-    LEFT(INDIRECT("C"&ROW());43)="RQC: EXTRAORDINÁRIA DE PROTEÇÃO AOS ANIMAIS";"1230";
-    LEFT(INDIRECT("C"&ROW());37)="RQC: EXTRAORDINÁRIA DAS PRIVATIZAÇÕES";"1212";
-    LEFT(INDIRECT("C"&ROW());44)="RQC: EXTRAORDINÁRIA DE TURISMO E GASTRONOMIA";"1261";
-    LEFT(INDIRECT("C"&ROW());42)="RQC: EXTRAORDINÁRIA PRÓ-FERROVIAS MINEIRAS";"1217";
-    LEFT(INDIRECT("C"&ROW());38)="RQC: PROPOSTA DE EMENDA À CONSTITUIÇÃO";"1234";
-    LEFT(INDIRECT("C"&ROW());38)="RQC: PROPOSTA DE EMENDA À CONSTITUIÇÃO";"1227";
-    LEFT(INDIRECT("C"&ROW());38)="RQC: PROPOSTA DE EMENDA À CONSTITUIÇÃO";"1218";
-    LEFT(INDIRECT("C"&ROW());45)="RQC: MEMBROS DAS COMISSÕES PERMANENTES";"10";
-    LEFT(INDIRECT("C"&ROW());18)="RQC: CIPE RIO DOCE";"811"
-    )&"&dia="&IFS(MID($A$5;2;1)="/";LEFT($A$5;1);MID($A$5;2;1)<>"/";LEFT($A$5;2))&"&mes="&IFS(MID($A$5;3;1)="/";IFS(MID($A$5;4;1)<>"1";RIGHT($A$5;1);MID($A$5;4;1)="1";IFS(MID($A$5;5;1)="";RIGHT($A$5;1);MID($A$5;5;1)<>"";RIGHT($A$5;2)));MID($A$5;2;1)="/";IFS(MID($A$5;3;1)<>"1";RIGHT($A$5;1);MID($A$5;3;1)="1";IFS(MID($A$5;4;1)="";RIGHT($A$5;1);MID($A$5;4;1)<>"";RIGHT($A$5;2))))&"&ano="&RIGHT($B$6;4)&"&hr="&TO_TEXT(INDIRECT("B"&ROW()))&"&tpCom="&IFS(LEFT(INDIRECT("C"&ROW());45)="RQC: MEMBROS DAS COMISSÕES PERMANENTES";"3";LEFT(INDIRECT("C"&ROW());45)<>"RQC: MEMBROS DAS COMISSÕES PERMANENTES";"2")&"&aba=js_tabResultado";
-    IMAGE("https://seeklogo.com/images/B/bandeira-minas-gerais-logo-AD7B6F3604-seeklogo.com.png";4;15;15));
-
-
-
-    OR(LEFT(INDIRECT("C"&ROW());19)="AUDIÊNCIA PÚBLICA: ");HYPERLINK("https://www.almg.gov.br/atividade-parlamentar/comissoes/reuniao/?idTipo="
-    &IFS(
-    OR(RIGHT(INDIRECT("C"&ROW());11)="GASTRONOMIA";RIGHT(INDIRECT("C"&ROW());6)="URBANA");"2";
-    OR(RIGHT(INDIRECT("C"&ROW());14)="EXTRAORDINÁRIA";RIGHT(INDIRECT("C"&ROW());25)="EXTRAORDINÁRIA, APROVADOS";RIGHT(INDIRECT("C"&ROW());25)="EXTRAORDINÁRIA, RECEBIDOS";MID(INDIRECT("C"&ROW());13;8)="PROPOSTA";RIGHT(INDIRECT("C"&ROW());7)="ANIMAIS";RIGHT(INDIRECT("C"&ROW());6)="CÂNCER";RIGHT(INDIRECT("C"&ROW());7)="MARIANA");"2";
-    OR(LEFT(INDIRECT("C"&ROW());6)="GRANDE";LEFT(INDIRECT("C"&ROW());7)="REUNIÃO";RIGHT(INDIRECT("C"&ROW());11)="PERMANENTES";RIGHT(INDIRECT("C"&ROW());8)="CONJUNTA";RIGHT(INDIRECT("C"&ROW());19)="CONJUNTA, APROVADOS";RIGHT(INDIRECT("C"&ROW());19)="CONJUNTA, RECEBIDOS");"3";
-    OR(MID(INDIRECT("C"&ROW());10;14)="EXTRAORDINÁRIA";RIGHT(INDIRECT("C"&ROW());8)="ESPECIAL");"5";
-    LEFT(INDIRECT("C"&ROW());4)="CIPE";"6";
-    RIGHT(INDIRECT("C"&ROW());14)<>"EXTRAORDINÁRIA";"1")
-    &"&idCom="
-    &IFS(
-    MID(INDIRECT("C"&ROW());20;3)="APU";"1";
-    MID(INDIRECT("C"&ROW());20;3)="AAG";"1075";
-    MID(INDIRECT("C"&ROW());20;3)="AMR";"3";
-    MID(INDIRECT("C"&ROW());20;3)="CJU";"5";
-    MID(INDIRECT("C"&ROW());20;3)="CTU";"675";
-    MID(INDIRECT("C"&ROW());20;3)="DCC";"489";
-    MID(INDIRECT("C"&ROW());20;3)="DDM";"1132";
-    MID(INDIRECT("C"&ROW());20;3)="DPD";"859";
-    MID(INDIRECT("C"&ROW());20;3)="DEC";"1077";
-    MID(INDIRECT("C"&ROW());20;3)="DHU";"8";
-    MID(INDIRECT("C"&ROW());20;3)="ECT";"849";
-    MID(INDIRECT("C"&ROW());20;3)="ELJ";"850";
-    MID(INDIRECT("C"&ROW());20;3)="FFO";"10";
-    MID(INDIRECT("C"&ROW());20;3)="MAD";"799";
-    MID(INDIRECT("C"&ROW());20;3)="MEN";"800";
-    MID(INDIRECT("C"&ROW());20;3)="PPO";"585";
-    MID(INDIRECT("C"&ROW());20;3)="PCD";"959";
-    MID(INDIRECT("C"&ROW());20;3)="RED";"13";
-    MID(INDIRECT("C"&ROW());20;3)="SAU";"14";
-    MID(INDIRECT("C"&ROW());20;3)="SPU";"508";
-    MID(INDIRECT("C"&ROW());20;3)="TPA";"1076";
-    MID(INDIRECT("C"&ROW());20;3)="TCO";"12"
-    )&"&dia="&MID(INDIRECT("C"&ROW());25;2)
-    &"&mes="&MID(INDIRECT("C"&ROW());28;2)
-    &"&ano="&MID(INDIRECT("C"&ROW());31;4)
-    &"&hr="&TO_TEXT(INDIRECT("B"&ROW()))&"&tpCom="&IFS(LEFT(INDIRECT("C"&ROW());45)="RQC: MEMBROS DAS COMISSÕES PERMANENTES";"3";LEFT(INDIRECT("C"&ROW());45)<>"RQC: MEMBROS DAS COMISSÕES PERMANENTES";"2")&"&aba=js_tabResultado";
-    IMAGE("https://seeklogo.com/images/B/bandeira-minas-gerais-logo-AD7B6F3604-seeklogo.com.png";4;15;15));
-
-
-
-    OR(INDIRECT("C"&ROW())<>"REUNIÕES DE PLENÁRIO");
-    HYPERLINK("https://www.almg.gov.br/export/sites/default/consulte/arquivo_diario_legislativo/pdfs/"&RIGHT($B$6;4)&"/"&MID($B$6;4;2)&"/L"&RIGHT($B$6;4)&MID($B$6;4;2)&LEFT($B$6;2)&".pdf#page="&IFS(MID(INDIRECT("B"&ROW());3;1)="";IFS(LEFT(INDIRECT("B"&ROW());1)=0;LEFT(INDIRECT("B"&ROW());2);LEFT(INDIRECT("B"&ROW());1)<>0;LEFT(INDIRECT("B"&ROW());2));MID(INDIRECT("B"&ROW());3;1)<>"";LEFT(INDIRECT("B"&ROW());3));
-
-    IMAGE("https://seeklogo.com/images/B/bandeira-minas-gerais-logo-AD7B6F3604-seeklogo.com.png";4;15;15))
-    ))''']] * ((footer_start - 1) - 5))
-
-        add(f"P6:P{footer_start - 1}", [['''=IFS(
-
-    OR(INDIRECT("E"&ROW())<>"DIOGO");
-    IFS(
-    OR(INDIRECT("E"&ROW())="-";INDIRECT("E"&ROW())="cancelada";INDIRECT("E"&ROW())="sem quórum");"-";
-    INDIRECT("E"&ROW())<>"cancelada";
-    IFS(
-    OR(INDIRECT("T"&ROW())="-";INDIRECT("H"&ROW())="-");"-";INDIRECT("T"&ROW())="??";
-    IMAGE("https://cdn.iconscout.com/icon/premium/png-512-thumb/broken-link-18-610397.png";4;20;20);
-
-    T6<>"??";
-    IFS(
-    OR(INDIRECT("C"&ROW())="";INDIRECT("C"&ROW())="DIÁRIO DO EXECUTIVO";INDIRECT("C"&ROW())="DIÁRIO DO EXECUTIVO - EDIÇÃO EXTRA";INDIRECT("C"&ROW())="DIÁRIO DO LEGISLATIVO";INDIRECT("C"&ROW())="DIÁRIO DO LEGISLATIVO - EDIÇÃO EXTRA";INDIRECT("C"&ROW())="REUNIÕES DE PLENÁRIO";INDIRECT("C"&ROW())="REUNIÕES DE COMISSÕES";INDIRECT("C"&ROW())="REQUERIMENTOS DE COMISSÕES";INDIRECT("C"&ROW())="LANÇAMENTOS DE TRAMITAÇÃO";INDIRECT("C"&ROW())="CADASTRO DE E-MAILS";INDIRECT("C"&ROW())="OFÍCIOS DA SECRETARIA-GERAL DA MESA";INDIRECT("C"&ROW())="LANÇAMENTOS DE PRECLUSÃO DE PRAZO";INDIRECT("C"&ROW())="IMPLANTAÇÃO DE TEXTOS";INDIRECT("C"&ROW())="REQUERIMENTOS DE COMISSÕES");" ";
-
-    OR(INDIRECT("C"&ROW())<>"REUNIÕES DE PLENÁRIO");IFS($A$683=FALSE;
-
-    HYPERLINK("https://integracao.almg.gov.br/mate-brs/index.html?first=false&search=odp&pagina=1&tp=200&aba=js_tabpesquisaAvancada&txtPalavras="&T6;IMAGE("https://www.almg.gov.br/favicon.ico";4;17;17));
-    $A$683=TRUE;HYPERLINK(X6;IMAGE("https://www.almg.gov.br/favicon.ico";4;17;17)))))))''']] * ((footer_start - 1) - 5))
-
-        add(f"Q6:Q{footer_start - 1}", [['''=IFS(
-
-    OR(INDIRECT("C"&ROW())="";
-    LEFT(INDIRECT("C"&ROW());6)="DIÁRIO";
-    LEFT(INDIRECT("C"&ROW());8)="REUNIÕES";
-    INDIRECT("C"&ROW())="REQUERIMENTOS DE COMISSÕES";
-    INDIRECT("C"&ROW())="LANÇAMENTOS DE TRAMITAÇÃO";
-    INDIRECT("C"&ROW())="CADASTRO DE E-MAILS";
-    INDIRECT("C"&ROW())="OFÍCIOS DA SECRETARIA-GERAL DA MESA";
-    INDIRECT("C"&ROW())="LANÇAMENTOS DE PRECLUSÃO DE PRAZO";
-    INDIRECT("C"&ROW())="IMPLANTAÇÃO DE TEXTOS");"";
-
-    OR(
-    INDIRECT("C"&ROW())="ALINE";
-    INDIRECT("C"&ROW())="ANDRÉ";
-    INDIRECT("C"&ROW())="DIOGO";
-    INDIRECT("C"&ROW())="KÁTIA";
-    INDIRECT("C"&ROW())="LEO";
-    INDIRECT("C"&ROW())="WELDER";
-    INDIRECT("C"&ROW())="TOTAL";
-    ISNUMBER(INDIRECT("C"&ROW()));
-    INDIRECT("C"&ROW())="?";INDIRECT("K"&ROW())="-";
-    INDIRECT("K"&ROW())="cancelada";
-    INDIRECT("K"&ROW())="sem quórum";
-    INDIRECT("K"&ROW())="não publicado");"-";
-
-    OR(
-    INDIRECT("C"&ROW())="-";
-    INDIRECT("C"&ROW())="ERRATAS";
-    INDIRECT("C"&ROW())="MANIFESTAÇÕES";
-    INDIRECT("C"&ROW())="VOTAÇÕES NOMINAIS";
-    RIGHT(INDIRECT("C"&ROW());18)="EMENDAS PUBLICADAS";
-    LEFT(INDIRECT("C"&ROW());17)="VOTAÇÕES NOMINAIS");"-";
-
-
-    LEFT(INDIRECT("C"&ROW());6)<>"DIÁRIO";
-    IFS(
-
-    OR(INDIRECT("C"&ROW())="EMENDA À CONSTITUIÇÃO PROMULGADA";INDIRECT("C"&ROW())="EMENDAS À CONSTITUIÇÃO PROMULGADAS");"PL??";
-    OR(INDIRECT("C"&ROW())="PROPOSTA DE AÇÃO LEGISLATIVA";INDIRECT("C"&ROW())="PROPOSTAS DE AÇÃO LEGISLATIVA");"PLE1";
-    RIGHT(INDIRECT("C"&ROW());48)="PROPOSTAS DE AÇÃO LEGISLATIVA REFERENTES AO PPAG";"PLE1";
-    RIGHT(INDIRECT("C"&ROW());24)="VOTAÇÃO DE REQUERIMENTOS";"RQN??/PL??";
-    INDIRECT("C"&ROW())="VETO TOTAL A PROPOSIÇÃO DE LEI";"PL80";
-    INDIRECT("C"&ROW())="VETO PARCIAL A PROPOSIÇÃO DE LEI";"PL82";
-    INDIRECT("C"&ROW())="VETO PARCIAL A PROPOSIÇÃO DE LEI COMPLEMENTAR";"PLC14";
-    OR(INDIRECT("C"&ROW())="RESOLUÇÃO";INDIRECT("C"&ROW())="RESOLUÇÕES");"PRE131";
-    INDIRECT("C"&ROW())="PROPOSIÇÕES DE LEI";"PL63";
-    INDIRECT("C"&ROW())="DECISÃO DA MESA";"PL??";
-    INDIRECT("C"&ROW())="DECISÕES DA PRESIDÊNCIA";"PL??";
-    OR(INDIRECT("C"&ROW())="DESIGNAÇÃO DE COMISSÕES";INDIRECT("C"&ROW())="TRAMITAÇÃO DE PROPOSIÇÕES: DESIGNAÇÃO DE COMISSÕES");"PL??";
-    INDIRECT("C"&ROW())="OFÍCIOS DE PREFEITURA QUE ENCAMINHAM DECRETOS DE CALAMIDADE PÚBLICA";"PL??";
-    INDIRECT("C"&ROW())="PROPOSIÇÃO: REQUERIMENTOS - INDICAÇÃO TCE";"PL??";
-    INDIRECT("C"&ROW())="SOLENE";"-";
-    INDIRECT("C"&ROW())="ESPECIAL";"PL??";
-    INDIRECT("C"&ROW())="ORDINÁRIA";"PL??";
-    INDIRECT("C"&ROW())="EXTRAORDINÁRIA";"PL??";
-    INDIRECT("C"&ROW())="EXTRAORDINÁRIA: PARECERES DE REDAÇÃO FINAL APROVADOS";"PL62";
-    OR(INDIRECT("C"&ROW())="ERRATAS";INDIRECT("C"&ROW())="ERRATA");"PL??";
-    RIGHT(INDIRECT("C"&ROW());23)="LEITURA DE COMUNICAÇÕES";"-";
-    OR(RIGHT(INDIRECT("C"&ROW());11)="PROMULGADAS");"PL112";
-    OR(LEFT(INDIRECT("C"&ROW());27)="LEI, COM PROPOSIÇÃO ANEXADA");"PL81//PL5";
-    OR(LEFT(INDIRECT("C"&ROW());3)="LEI");"PL81";
-    OR(LEFT(INDIRECT("C"&ROW());16)="LEI COMPLEMENTAR");"PL81";
-    OR(INDIRECT("C"&ROW())="EMENDAS OU SUBSTITUTIVOS PUBLICADOS";INDIRECT("C"&ROW())="EMENDAS NÃO RECEBIDAS PUBLICADAS");"PL??";
-    LEFT(INDIRECT("C"&ROW());8)="COMISSÃO";"RQN??";
-    LEFT(INDIRECT("C"&ROW());4)="CIPE";"RQN??";
-    LEFT(INDIRECT("C"&ROW());16)="REUNIÃO CONJUNTA";"RQN??";
-    OR(LEFT(INDIRECT("C"&ROW());19)="RELATÓRIO DE VISITA";LEFT(INDIRECT("C"&ROW());46)="TRAMITAÇÃO DE PROPOSIÇÕES: RELATÓRIO DE VISITA");"RQC18";
-    RIGHT(INDIRECT("C"&ROW());33)="RELATÓRIO DE EVENTO INSTITUCIONAL";"REL1";
-    RIGHT(INDIRECT("C"&ROW());24)="REQUERIMENTOS ORDINÁRIOS";"RQO1";
-    RIGHT(INDIRECT("C"&ROW());24)="REQUERIMENTOS APROVADOS";"RQN66";
-    RIGHT(INDIRECT("C"&ROW());26)="COMUNICAÇÃO DA PRESIDÊNCIA";"RQN26";
-    OR(LEFT(INDIRECT("C"&ROW());22)="DECISÃO DA PRESIDÊNCIA";LEFT(INDIRECT("C"&ROW());49)="TRAMITAÇÃO DE PROPOSIÇÕES: DECISÃO DA PRESIDÊNCIA");"PL??";
-    RIGHT(INDIRECT("C"&ROW());22)="PALAVRAS DO PRESIDENTE";"PL??";
-    LEFT(INDIRECT("C"&ROW());25)="DESPACHO DE REQUERIMENTOS";"RQN83";
-    INDIRECT("C"&ROW())="TRAMITAÇÃO DE PROPOSIÇÕES: PARECERES";"PL178";
-    INDIRECT("C"&ROW())="PARECERES SOBRE VETO";"PL??";
-    INDIRECT("C"&ROW())="PARECERES SOBRE SUBSTITUTIVO";"PL??";
-    LEFT(INDIRECT("C"&ROW());17)="AUDIÊNCIA PÚBLICA";"-";
-    LEFT(INDIRECT("C"&ROW());23)="AUDIÊNCIA DE CONVIDADOS";"-";
-
-    OR(LEFT(INDIRECT("C"&ROW());36)="MENSAGEM DO GOVERNADOR QUE ENCAMINHA";
-    LEFT(INDIRECT("C"&ROW());38)="MENSAGENS DO GOVERNADOR QUE ENCAMINHAM";
-    LEFT(INDIRECT("C"&ROW());63)="TRAMITAÇÃO DE PROPOSIÇÕES: MENSAGEM DO GOVERNADOR QUE ENCAMINHA";
-    LEFT(INDIRECT("C"&ROW());65)="TRAMITAÇÃO DE PROPOSIÇÕES: MENSAGENS DO GOVERNADOR QUE ENCAMINHAM";
-    LEFT(INDIRECT("C"&ROW());35)="MENSAGEM DO GOVERNADOR QUE COMUNICA";
-    LEFT(INDIRECT("C"&ROW());62)="TRAMITAÇÃO DE PROPOSIÇÕES: MENSAGEM DO GOVERNADOR QUE COMUNICA";
-    LEFT(INDIRECT("C"&ROW());35)="MENSAGEM DO GOVERNADOR QUE SOLICITA");IFS(
-    OR(RIGHT(INDIRECT("C"&ROW());14)="PROJETO DE LEI";RIGHT(INDIRECT("C"&ROW());27)="PROJETO DE LEI COMPLEMENTAR";RIGHT(INDIRECT("C"&ROW());15)="PROJETOS DE LEI";RIGHT(INDIRECT("C"&ROW());36)="PROJETO DE LEI - CRÉDITO SUPLEMENTAR";);"PL??";
-    RIGHT(INDIRECT("C"&ROW());42)="EMENDA OU SUBSTITUTIVO COM DESPACHO À MESA";"MSG5 // PL156";
-    RIGHT(INDIRECT("C"&ROW());41)="EMENDA OU SUBSTITUTIVO COM DESPACHO À FFO";"MSG7 // PL624";
-    RIGHT(INDIRECT("C"&ROW());12)="VETO PARCIAL";"PL??";
-    RIGHT(INDIRECT("C"&ROW());10)="VETO TOTAL";"PL??";
-    RIGHT(INDIRECT("C"&ROW());29)="REGIME ESPECIAL DE TRIBUTAÇÃO";"MSG21";
-    RIGHT(INDIRECT("C"&ROW());9)="INDICAÇÃO";"PL??";
-    RIGHT(INDIRECT("C"&ROW());28)="PEDIDO DE REGIME DE URGÊNCIA";"PL??";
-    RIGHT(INDIRECT("C"&ROW());18)="CONVÊNIO DO CONFAZ";"MSG11";
-    RIGHT(INDIRECT("C"&ROW());16)="CONVÊNIO DO ICMS";"MSG11";
-    RIGHT(INDIRECT("C"&ROW());44)="PRESTAÇÃO DE CONTAS DA ADMINISTRAÇÃO PÚBLICA";"PL??";
-    RIGHT(INDIRECT("C"&ROW());36)="RELATÓRIO SOBRE A SITUAÇÃO DO ESTADO";"MSG22";
-    RIGHT(INDIRECT("C"&ROW());29)="DESARQUIVAMENTO DE PROPOSIÇÃO";"MSG8 // RQN80";
-    RIGHT(INDIRECT("C"&ROW());19)="RETIRADA DE PROJETO";"MSG12 // RQN80";
-    RIGHT(INDIRECT("C"&ROW());16)="AUSÊNCIA DO PAÍS";"OFI10"
-    );
-
-    OR(LEFT(INDIRECT("C"&ROW());20)="OFÍCIO DO GOVERNADOR";
-    MID(INDIRECT("C"&ROW());28;20)="OFÍCIO DO GOVERNADOR";
-    LEFT(INDIRECT("C"&ROW());25)="OFÍCIO DO VICE-GOVERNADOR");IFS(
-    RIGHT(INDIRECT("C"&ROW());28)="COMUNICANDO AUSÊNCIA DO PAÍS";"OFI10";
-    RIGHT(INDIRECT("C"&ROW());35)="COMUNICANDO QUE ENCAMINHOU MENSAGEM";"OFI??");
-
-    LEFT(INDIRECT("C"&ROW());27)="REQUERIMENTOS DE COMISSÕES: ";IFS(
-    RIGHT(INDIRECT("C"&ROW());21)="RECEBIDOS E APROVADOS";"RQC3";
-    RIGHT(INDIRECT("C"&ROW());9)="APROVADOS";"RQC2";
-    RIGHT(INDIRECT("C"&ROW());13)="NÃO RECEBIDOS";"RQC130";
-    RIGHT(INDIRECT("C"&ROW());9)="RECEBIDOS";"RQC1";
-    RIGHT(INDIRECT("C"&ROW());12)="PREJUDICADOS";"RQC6";
-    RIGHT(INDIRECT("C"&ROW());10)="REJEITADOS";"RQC17";
-    RIGHT(INDIRECT("C"&ROW());9)="RELATÓRIO";"RQC18";
-    RIGHT(INDIRECT("C"&ROW());9)="RELATORIA";"RQC19";
-    RIGHT(INDIRECT("C"&ROW());10)="REITERADOS";"RQC23";
-    RIGHT(INDIRECT("C"&ROW());9)="RETIRADOS";"RQC26";
-    RIGHT(INDIRECT("C"&ROW());9)="EMENDADOS";"RQC25";
-    RIGHT(INDIRECT("C"&ROW());7)="ADIADOS";"RQC15";
-    RIGHT(INDIRECT("C"&ROW());10)<>"RECEBIDOS";"RQC3");
-
-    LEFT(INDIRECT("C"&ROW());3)="RQC";IFS(
-    RIGHT(INDIRECT("C"&ROW());21)="RECEBIDOS E APROVADOS";"RQC13";
-    RIGHT(INDIRECT("C"&ROW());9)="APROVADOS";"RQC12";
-    RIGHT(INDIRECT("C"&ROW());13)="NÃO RECEBIDOS";"RQC130";
-    RIGHT(INDIRECT("C"&ROW());9)="RECEBIDOS";"RQC11";
-    RIGHT(INDIRECT("C"&ROW());12)="PREJUDICADOS";"RQC6";
-    RIGHT(INDIRECT("C"&ROW());9)="RELATÓRIO";"RQC18";
-    RIGHT(INDIRECT("C"&ROW());10)="REJEITADOS";"RQC17";
-    RIGHT(INDIRECT("C"&ROW());10)="REITERADOS";"RQC23";
-    RIGHT(INDIRECT("C"&ROW());9)="RETIRADOS";"RQC26";
-    RIGHT(INDIRECT("C"&ROW());9)="RELATORIA";"RQC19";
-    RIGHT(INDIRECT("C"&ROW());9)="EMENDADOS";"RQC28 // RQC29";
-    RIGHT(INDIRECT("C"&ROW());7)="ADIADOS";"RQC16";
-    RIGHT(INDIRECT("C"&ROW());10)<>"RECEBIDOS";"RQC13");
-
-    OR(LEFT(INDIRECT("C"&ROW());10)="OFÍCIOS - ";LEFT(INDIRECT("C"&ROW());27)="CORRESPONDÊNCIA: OFÍCIOS - ");IFS(
-    RIGHT(INDIRECT("C"&ROW());15)="PROJETOS DE LEI";"PL330";
-    RIGHT(INDIRECT("C"&ROW());13)="REQUERIMENTOS";"RQN30";
-    RIGHT(INDIRECT("C"&ROW());5)="VETOS";"PL330";
-    RIGHT(INDIRECT("C"&ROW());20)="PRORROGAÇÃO DE PRAZO";"RQN67";
-    RIGHT(INDIRECT("C"&ROW());33)="PROPOSTA DE EMENDA À CONSTITUIÇÃO";"PL330");
-
-    OR(LEFT(INDIRECT("C"&ROW());42)="OFÍCIO DO TRIBUNAL DE CONTAS QUE ENCAMINHA";
-    LEFT(INDIRECT("C"&ROW());69)="TRAMITAÇÃO DE PROPOSIÇÕES: OFÍCIO DO TRIBUNAL DE CONTAS QUE ENCAMINHA");IFS(
-    RIGHT(INDIRECT("C"&ROW());14)="PROJETO DE LEI";"PL??";
-    RIGHT(INDIRECT("C"&ROW());23)="RELATÓRIO DE ATIVIDADES";"PL??";
-    RIGHT(INDIRECT("C"&ROW());23)="BALANÇO GERAL DO ESTADO";"PL??";
-    RIGHT(INDIRECT("C"&ROW());19)="PRESTAÇÃO DE CONTAS";"PL??");
-
-    OR(LEFT(INDIRECT("C"&ROW());29)="OFÍCIO DO TRIBUNAL DE JUSTIÇA";
-    LEFT(INDIRECT("C"&ROW());56)="TRAMITAÇÃO DE PROPOSIÇÕES: OFÍCIO DO TRIBUNAL DE JUSTIÇA");IFS(
-    OR(RIGHT(INDIRECT("C"&ROW());14)="PROJETO DE LEI";RIGHT(INDIRECT("C"&ROW());27)="PROJETO DE LEI COMPLEMENTAR");"OFI4");
-
-    OR(LEFT(INDIRECT("C"&ROW());28)="OFÍCIO DA DEFENSORIA PÚBLICA";
-    LEFT(INDIRECT("C"&ROW());55)="TRAMITAÇÃO DE PROPOSIÇÕES: OFÍCIO DA DEFENSORIA PÚBLICA");IFS(
-    RIGHT(INDIRECT("C"&ROW());14)="PROJETO DE LEI";"OFI4");
-
-    OR(LEFT(INDIRECT("C"&ROW());28)="OFÍCIO DO MINISTÉRIO PÚBLICO";
-    LEFT(INDIRECT("C"&ROW());55)="TRAMITAÇÃO DE PROPOSIÇÕES: OFÍCIO DO MINISTÉRIO PÚBLICO");IFS(
-    RIGHT(INDIRECT("C"&ROW());14)="PROJETO DE LEI";"OFI??");
-
-    LEFT(INDIRECT("C"&ROW());39)="OFÍCIO DA PROCURADORIA-GERAL DE JUSTIÇA";IFS(
-    RIGHT(INDIRECT("C"&ROW());14)="PROJETO DE LEI";"OFI4");
-
-    OR(LEFT(INDIRECT("C"&ROW());42)="APRESENTAÇÃO DE PROPOSIÇÕES: REQUERIMENTOS";LEFT(INDIRECT("C"&ROW());69)="TRAMITAÇÃO DE PROPOSIÇÕES: APRESENTAÇÃO DE PROPOSIÇÕES: REQUERIMENTOS");IFS(
-    RIGHT(INDIRECT("C"&ROW());19)="COMISSÕES TEMÁTICAS";"RQN27";
-    RIGHT(INDIRECT("C"&ROW());15)="COM COMUNICAÇÃO";"RQN26";
-    RIGHT(INDIRECT("C"&ROW());15)="SEM COMUNICAÇÃO";"RQN85";
-    RIGHT(INDIRECT("C"&ROW());8)="ANEXADOS";"RQN40/RQN47";
-    RIGHT(INDIRECT("C"&ROW());19)="CIDADANIA HONORÁRIA";"RQN88";
-    RIGHT(INDIRECT("C"&ROW());13)="INDICAÇÃO TCE";"RQN??";
-    RIGHT(INDIRECT("C"&ROW());25)="ASSEMBLEIA FISCALIZA MAIS";"RQN??";
-    RIGHT(INDIRECT("C"&ROW());18)="FRENTE PARLAMENTAR";"RQN??";
-    RIGHT(INDIRECT("C"&ROW());24)="INCLUSÃO EM ORDEM DO DIA";"RQN??";
-    RIGHT(INDIRECT("C"&ROW());22)="RETIRADA DE TRAMITAÇÃO";"RQN80";
-    RIGHT(INDIRECT("C"&ROW());15)="DESARQUIVAMENTO";"RQN26/RQN85";
-    RIGHT(INDIRECT("C"&ROW());15)="DESANEXAÇÃO";"RQN??";
-    RIGHT(INDIRECT("C"&ROW());17)="COMISSÃO SEGUINTE";"RQN??";
-    RIGHT(INDIRECT("C"&ROW());17)="MAIS UMA COMISSÃO";"RQN??";
-    RIGHT(INDIRECT("C"&ROW());7)="RECURSO";"RQN??";
-    RIGHT(INDIRECT("C"&ROW());21)="PEDIDO DE INFORMAÇÕES";"RQN??";
-    RIGHT(INDIRECT("C"&ROW());22)="PEDIDO DE PROVIDÊNCIAS";"RQN??";
-    RIGHT(INDIRECT("C"&ROW());14)="PERDA DE PRAZO";"RQN??";
-    RIGHT(INDIRECT("C"&ROW());16)="REUNIÃO ESPECIAL";"RQN80";
-    RIGHT(INDIRECT("C"&ROW());38)="MESA DA ASSEMBLEIA, VOTADO EM PLENÁRIO";"RQN14";
-    RIGHT(INDIRECT("C"&ROW());57)="MESA DA ASSEMBLEIA, PROVIDÊNCIA INTERNA";"RQN92";
-    RIGHT(INDIRECT("C"&ROW());19)="DESPACHO A DEPUTADO";"RQN??";
-    RIGHT(INDIRECT("C"&ROW());19)="DESPACHO A SERVIDOR";"RQN??";
-    RIGHT(INDIRECT("C"&ROW());13)="SETOR DA CASA";"RQO16";
-    RIGHT(INDIRECT("C"&ROW());19)<>"COMISSÕES TEMÁTICAS";"RQN27");
-
-    OR(LEFT(INDIRECT("C"&ROW());62)="APRESENTAÇÃO DE PROPOSIÇÕES: PROPOSTA DE EMENDA À CONSTITUIÇÃO";LEFT(INDIRECT("C"&ROW());60)="TRAMITAÇÃO DE PROPOSIÇÕES: PROPOSTA DE EMENDA À CONSTITUIÇÃO");"PEC5";
-
-    OR(LEFT(INDIRECT("C"&ROW());44)="APRESENTAÇÃO DE PROPOSIÇÕES: PROJETOS DE LEI";
-    LEFT(INDIRECT("C"&ROW());42)="TRAMITAÇÃO DE PROPOSIÇÕES: PROJETOS DE LEI");IFS(
-    RIGHT(INDIRECT("C"&ROW());19)="COMISSÕES TEMÁTICAS";"PL3";
-    RIGHT(INDIRECT("C"&ROW());18)="MESA DA ASSEMBLEIA";"PL282";
-    RIGHT(INDIRECT("C"&ROW());8)="ANEXADOS";"PL145/PL204");
-
-    OR(LEFT(INDIRECT("C"&ROW());50)="APRESENTAÇÃO DE PROPOSIÇÕES: PROJETOS DE RESOLUÇÃO";
-    LEFT(INDIRECT("C"&ROW());48)="TRAMITAÇÃO DE PROPOSIÇÕES: PROJETOS DE RESOLUÇÃO");IFS(
-    RIGHT(INDIRECT("C"&ROW());29)="REGIME ESPECIAL DE TRIBUTAÇÃO";"PRE140";
-    RIGHT(INDIRECT("C"&ROW());19)="APROVAÇÃO DE CONTAS";"PRE137";
-    RIGHT(INDIRECT("C"&ROW());24)="RATIFICAÇÃO DE CONVÊNIOS";"PRE9";
-    RIGHT(INDIRECT("C"&ROW());37)="ESTRUTURA DA SECRETARIA DA ASSEMBLEIA";"PRE134";
-    RIGHT(INDIRECT("C"&ROW());19)="COMISSÕES TEMÁTICAS";"PL3";
-    RIGHT(INDIRECT("C"&ROW());8)="ANEXADOS";"PL145/PL204";
-    RIGHT(INDIRECT("C"&ROW());19)="CIDADANIA HONORÁRIA";"PRE11";
-    RIGHT(INDIRECT("C"&ROW());18)="CALAMIDADE PÚBLICA";"PRE12";
-    RIGHT(INDIRECT("C"&ROW());21)="LICENÇA AO GOVERNADOR";"PRE13"
-    );
-
-    LEFT(INDIRECT("C"&ROW());25)="PROPOSIÇÕES NÃO RECEBIDAS";IFS(
-    RIGHT(INDIRECT("C"&ROW());15)="PROJETOS DE LEI";"PL130";
-    RIGHT(INDIRECT("C"&ROW());13)="REQUERIMENTOS";"RQN130";
-    RIGHT(INDIRECT("C"&ROW());15)<>"PROJETOS DE LEI";"PL130");
-
-    LEFT(INDIRECT("C"&ROW());25)="RECEBIMENTO DE PROPOSIÇÃO";"PL367";
-    LEFT(INDIRECT("C"&ROW());23)="DESIGNAÇÃO DE RELATORIA";"PL264";
-    LEFT(INDIRECT("C"&ROW());25)="CUMPRIMENTO DE DILIGÊNCIA";"PL373";
-    LEFT(INDIRECT("C"&ROW());32)="REUNIÃO COM DEBATE DE PROPOSIÇÃO";"RQC7";
-    LEFT(INDIRECT("C"&ROW());33)="REUNIÃO ORIGINADA DE REQUERIMENTO";"RQC5";
-    INDIRECT("C"&ROW())="PAUTA COMPLETA DE REUNIÃO COM DEBATE DE PROPOSIÇÃO";"RQC7";
-    INDIRECT("C"&ROW())="RESULTADO COMPLETO DE REUNIÃO COM DEBATE DE PROPOSIÇÃO";"RQC8";
-    INDIRECT("C"&ROW())="INÍCIO DE APRECIAÇÃO NA PRÓXIMA COMISSÃO";"RQC??";
-    INDIRECT("C"&ROW())="CONGRATULAÇÕES ENTREGUES EM REUNIÃO";"RQN18";
-    INDIRECT("C"&ROW())="ENTREGA DE DIPLOMA";"RQN18";
-    LEFT(INDIRECT("C"&ROW());16)="CONSULTA PÚBLICA";"PL532";
-
-    INDIRECT("C"&ROW())="PROPOSIÇÃO DE LEI ENCAMINHADA PARA SANÇÃO";"PL63";
-    INDIRECT("C"&ROW())="REMESSA - PEDIDO DE INFORMAÇÃO";"RQN20";
-    INDIRECT("C"&ROW())="REMESSA - REQUERIMENTO APROVADO";"RQN17";
-    INDIRECT("C"&ROW())="OFÍCIO - PEDIDO DE INFORMAÇÃO";"RQN20";
-    INDIRECT("C"&ROW())="OFÍCIO - PEDIDO DE INFORMAÇÃO";"PL71";
-    INDIRECT("C"&ROW())="OFÍCIO - REQUERIMENTO APROVADO";"RQN17";
-    INDIRECT("C"&ROW())="OFÍCIO - VOTO DE CONGRATULAÇÕES";"RQN48";
-    INDIRECT("C"&ROW())="OFÍCIO - MANIFESTAÇÃO DE APLAUSO";"RQN50";
-    INDIRECT("C"&ROW())="OFÍCIO - MANIFESTAÇÃO DE APOIO";"RQN50";
-    INDIRECT("C"&ROW())="OFÍCIO - MANIFESTAÇÃO DE REPÚDIO";"RQN50";
-    INDIRECT("C"&ROW())="OFÍCIO - MANIFESTAÇÃO DE PROTESTO";"RQN50";
-    INDIRECT("C"&ROW())="OFÍCIO - MANIFESTAÇÃO DE PESAR";"RQN49";
-    INDIRECT("C"&ROW())="OFÍCIO COMUNICANDO MANUTENÇÃO TOTAL DO VETO";"PL93";
-    INDIRECT("C"&ROW())="OFÍCIO COMUNICANDO REJEIÇÃO TOTAL DO VETO";"PL92";
-    INDIRECT("C"&ROW())="OFÍCIO COMUNICANDO REJEIÇÃO PARCIAL DO VETO";"PL598";
-    INDIRECT("C"&ROW())="OFÍCIO COMUNICANDO APROVAÇÃO DA INDICAÇÃO";"IND10";
-    INDIRECT("C"&ROW())="OFÍCIO ENCAMINHADO AOS DESTINATÁRIOS POR E-MAIL";"RQN31";
-
-    INDIRECT("C"&ROW())="PRECLUSÃO DE PRAZO: PROJETOS DE LEI";"PL66";
-    INDIRECT("C"&ROW())="PRECLUSÃO DE PRAZO: REQUERIMENTOS, APROVADOS";"RQN16";
-    INDIRECT("C"&ROW())="PRECLUSÃO DE PRAZO: REQUERIMENTOS, REJEITADOS";"RQN28";
-    INDIRECT("C"&ROW())="PRECLUSÃO DE PRAZO: REQUERIMENTOS, RECURSO";"RQN87";
-    INDIRECT("C"&ROW())="PRECLUSÃO DE PRAZO: INCONSTITUCIONALIDADE";"PL125"
-
-    ))''']] * ((footer_start - 1) - 5))
-
-        add(f"R6:R{footer_start - 1}", [['''=IFS(
-
-    OR(
-    INDIRECT("C"&ROW())="";
-    LEFT(INDIRECT("C"&ROW());6)="DIÁRIO";
-    LEFT(INDIRECT("C"&ROW());8)="REUNIÕES";
-    INDIRECT("C"&ROW())="REQUERIMENTOS DE COMISSÕES";
-    INDIRECT("C"&ROW())="LANÇAMENTOS DE TRAMITAÇÃO";
-    INDIRECT("C"&ROW())="CADASTRO DE E-MAILS";
-    INDIRECT("C"&ROW())="OFÍCIOS DA SECRETARIA-GERAL DA MESA";
-    INDIRECT("C"&ROW())="LANÇAMENTOS DE PRECLUSÃO DE PRAZO";
-    INDIRECT("C"&ROW())="IMPLANTAÇÃO DE TEXTOS");"";
-
-    OR(
-    INDIRECT("C"&ROW())="ALINE";
-    INDIRECT("C"&ROW())="ANDRÉ";
-    INDIRECT("C"&ROW())="DIOGO";
-    INDIRECT("C"&ROW())="KÁTIA";
-    INDIRECT("C"&ROW())="LEO";
-    INDIRECT("C"&ROW())="WELDER";
-    INDIRECT("C"&ROW())="TOTAL";
-    ISNUMBER(INDIRECT("C"&ROW()));
-    INDIRECT("C"&ROW())="?";
-    INDIRECT("K"&ROW())="-";
-    INDIRECT("K"&ROW())="cancelada";
-    INDIRECT("K"&ROW())="sem quórum";
-    INDIRECT("K"&ROW())="não publicado");"-";
-
-    OR(
-    INDIRECT("C"&ROW())="-";
-    INDIRECT("C"&ROW())="VOTAÇÕES NOMINAIS";
-    RIGHT(INDIRECT("C"&ROW());18)="EMENDAS PUBLICADAS";
-    LEFT(INDIRECT("C"&ROW());17)="VOTAÇÕES NOMINAIS");"-";
-
-
-    LEFT(INDIRECT("C"&ROW());6)<>"DIÁRIO";
-    IFS(
-
-    OR(INDIRECT("C"&ROW())="EMENDA À CONSTITUIÇÃO PROMULGADA";INDIRECT("C"&ROW())="EMENDAS À CONSTITUIÇÃO PROMULGADAS");"3.3.1-D";
-    OR(INDIRECT("C"&ROW())="PROPOSTA DE AÇÃO LEGISLATIVA";INDIRECT("C"&ROW())="PROPOSTAS DE AÇÃO LEGISLATIVA");"4.2.6";
-    RIGHT(INDIRECT("C"&ROW());48)="PROPOSTAS DE AÇÃO LEGISLATIVA REFERENTES AO PPAG";"4.2.6-B";
-    RIGHT(INDIRECT("C"&ROW());24)="VOTAÇÃO DE REQUERIMENTOS";"4.11";
-    INDIRECT("C"&ROW())="MANIFESTAÇÕES";"4.14";
-    RIGHT(INDIRECT("C"&ROW());24)="REQUERIMENTOS APROVADOS";"4.15";
-    OR(INDIRECT("C"&ROW())="ERRATAS";INDIRECT("C"&ROW())="ERRATA");"4.16";
-    INDIRECT("C"&ROW())="DECISÕES DA PRESIDÊNCIA";"4.4";
-    OR(LEFT(INDIRECT("C"&ROW());22)="DECISÃO DA PRESIDÊNCIA";LEFT(INDIRECT("C"&ROW());49)="TRAMITAÇÃO DE PROPOSIÇÕES: DECISÃO DA PRESIDÊNCIA");"4.4";
-    INDIRECT("C"&ROW())="TRAMITAÇÃO DE PROPOSIÇÕES: PARECERES";"6";
-    INDIRECT("C"&ROW())="PARECERES SOBRE VETO";"12.7";
-    INDIRECT("C"&ROW())="PARECERES SOBRE SUBSTITUTIVO";"-";
-    OR(LEFT(INDIRECT("C"&ROW());3)="LEI");"7.1";
-    INDIRECT("C"&ROW())="ORDINÁRIA";"10.8";
-
-    INDIRECT("C"&ROW())="VETO TOTAL A PROPOSIÇÃO DE LEI";"7.2";
-    LEFT(INDIRECT("C"&ROW());32)="VETO PARCIAL A PROPOSIÇÃO DE LEI";"7.2";
-    OR(INDIRECT("C"&ROW())="RESOLUÇÃO";INDIRECT("C"&ROW())="RESOLUÇÕES");"3.3.1-A";
-    INDIRECT("C"&ROW())="PROPOSIÇÕES DE LEI";"3.3.2";
-    INDIRECT("C"&ROW())="DECISÃO DA MESA";"???";
-    OR(INDIRECT("C"&ROW())="DESIGNAÇÃO DE COMISSÕES";INDIRECT("C"&ROW())="TRAMITAÇÃO DE PROPOSIÇÕES: DESIGNAÇÃO DE COMISSÕES");"4.7";
-    INDIRECT("C"&ROW())="OFÍCIOS DE PREFEITURA QUE ENCAMINHAM DECRETOS DE CALAMIDADE PÚBLICA";"???";
-    INDIRECT("C"&ROW())="PROPOSIÇÃO: REQUERIMENTOS - INDICAÇÃO TCE";"???";
-    INDIRECT("C"&ROW())="SOLENE";"-";
-    INDIRECT("C"&ROW())="ESPECIAL";"??";
-    INDIRECT("C"&ROW())="EXTRAORDINÁRIA";"???";
-    INDIRECT("C"&ROW())="EXTRAORDINÁRIA: PARECERES DE REDAÇÃO FINAL APROVADOS";"PL62";
-    RIGHT(INDIRECT("C"&ROW());23)="LEITURA DE COMUNICAÇÕES";"-";
-    OR(INDIRECT("C"&ROW())="EMENDAS OU SUBSTITUTIVOS PUBLICADOS";INDIRECT("C"&ROW())="EMENDAS NÃO RECEBIDAS PUBLICADAS");"???";
-    LEFT(INDIRECT("C"&ROW());16)="REUNIÃO CONJUNTA";"RQN??";
-    OR(LEFT(INDIRECT("C"&ROW());19)="RELATÓRIO DE VISITA";LEFT(INDIRECT("C"&ROW());46)="TRAMITAÇÃO DE PROPOSIÇÕES: RELATÓRIO DE VISITA");"5.3";
-    RIGHT(INDIRECT("C"&ROW());33)="RELATÓRIO DE EVENTO INSTITUCIONAL";"4.2.9";
-    RIGHT(INDIRECT("C"&ROW());24)="REQUERIMENTOS ORDINÁRIOS";"RQO1";
-    RIGHT(INDIRECT("C"&ROW());22)="PALAVRAS DO PRESIDENTE";"4.5";
-    RIGHT(INDIRECT("C"&ROW());26)="COMUNICAÇÃO DA PRESIDÊNCIA";"4.9";
-    LEFT(INDIRECT("C"&ROW());25)="DESPACHO DE REQUERIMENTOS";"4.10";
-    LEFT(INDIRECT("C"&ROW());17)="AUDIÊNCIA PÚBLICA";"???";
-    LEFT(INDIRECT("C"&ROW());23)="AUDIÊNCIA DE CONVIDADOS";"???";
-
-    OR(LEFT(INDIRECT("C"&ROW());36)="MENSAGEM DO GOVERNADOR QUE ENCAMINHA";
-    LEFT(INDIRECT("C"&ROW());38)="MENSAGENS DO GOVERNADOR QUE ENCAMINHAM";
-    LEFT(INDIRECT("C"&ROW());63)="TRAMITAÇÃO DE PROPOSIÇÕES: MENSAGEM DO GOVERNADOR QUE ENCAMINHA";
-    LEFT(INDIRECT("C"&ROW());65)="TRAMITAÇÃO DE PROPOSIÇÕES: MENSAGENS DO GOVERNADOR QUE ENCAMINHAM";
-    LEFT(INDIRECT("C"&ROW());35)="MENSAGEM DO GOVERNADOR QUE COMUNICA";
-    LEFT(INDIRECT("C"&ROW());62)="TRAMITAÇÃO DE PROPOSIÇÕES: MENSAGEM DO GOVERNADOR QUE COMUNICA";
-    LEFT(INDIRECT("C"&ROW());35)="MENSAGEM DO GOVERNADOR QUE SOLICITA");IFS(
-    OR(RIGHT(INDIRECT("C"&ROW());14)="PROJETO DE LEI";RIGHT(INDIRECT("C"&ROW());27)="PROJETO DE LEI COMPLEMENTAR";RIGHT(INDIRECT("C"&ROW());15)="PROJETOS DE LEI";RIGHT(INDIRECT("C"&ROW());36)="PROJETO DE LEI - CRÉDITO SUPLEMENTAR");"4.2.1-A";
-    RIGHT(INDIRECT("C"&ROW());42)="EMENDA OU SUBSTITUTIVO COM DESPACHO À MESA";"4.2.1-B";
-    RIGHT(INDIRECT("C"&ROW());41)="EMENDA OU SUBSTITUTIVO COM DESPACHO À FFO";"4.2.1-B";
-    RIGHT(INDIRECT("C"&ROW());12)="VETO PARCIAL";"4.2.1-C";
-    RIGHT(INDIRECT("C"&ROW());10)="VETO TOTAL";"4.2.1-C";
-    RIGHT(INDIRECT("C"&ROW());29)="REGIME ESPECIAL DE TRIBUTAÇÃO";"4.2.1-D";
-    RIGHT(INDIRECT("C"&ROW());9)="INDICAÇÃO";"4.2.1-F";
-    RIGHT(INDIRECT("C"&ROW());28)="PEDIDO DE REGIME DE URGÊNCIA";"4.2.1-G";
-    RIGHT(INDIRECT("C"&ROW());18)="CONVÊNIO DO CONFAZ";"4.2.1-I";
-    RIGHT(INDIRECT("C"&ROW());16)="CONVÊNIO DO ICMS";"4.2.1-I";
-    RIGHT(INDIRECT("C"&ROW());44)="PRESTAÇÃO DE CONTAS DA ADMINISTRAÇÃO PÚBLICA";"4.2.1-L";
-    RIGHT(INDIRECT("C"&ROW());36)="RELATÓRIO SOBRE A SITUAÇÃO DO ESTADO";"4.2.2-L.2";
-    RIGHT(INDIRECT("C"&ROW());29)="DESARQUIVAMENTO DE PROPOSIÇÃO";"4.2.1-T";
-    RIGHT(INDIRECT("C"&ROW());19)="RETIRADA DE PROJETO";"4.2.1-M";
-    RIGHT(INDIRECT("C"&ROW());16)="AUSÊNCIA DO PAÍS";"4.2.2-C.2"
-    );
-
-    OR(LEFT(INDIRECT("C"&ROW());20)="OFÍCIO DO GOVERNADOR";
-    MID(INDIRECT("C"&ROW());28;20)="OFÍCIO DO GOVERNADOR";
-    LEFT(INDIRECT("C"&ROW());25)="OFÍCIO DO VICE-GOVERNADOR");IFS(
-    RIGHT(INDIRECT("C"&ROW());28)="COMUNICANDO AUSÊNCIA DO PAÍS";"4.2.2-C.2";
-    RIGHT(INDIRECT("C"&ROW());35)="COMUNICANDO QUE ENCAMINHOU MENSAGEM";"4.2.2-C");
-
-    OR(LEFT(INDIRECT("C"&ROW());8)="COMISSÃO";LEFT(INDIRECT("C"&ROW());4)="CIPE");IFS(
-    MID(INDIRECT("C"&ROW());13;12)="CONSTITUIÇÃO";"10.2";
-    MID(INDIRECT("C"&ROW());13;12)="FISCALIZAÇÃO";"10.3";
-    MID(INDIRECT("C"&ROW());13;12)="PARTICIPAÇÃO";"10.4";
-    MID(INDIRECT("C"&ROW());13;7)="REDAÇÃO";"10.5";
-    MID(INDIRECT("C"&ROW());11;8)="ESPECIAL";"10.6";
-    MID(INDIRECT("C"&ROW());13;12)<>"CONSTITUIÇÃO";"10");
-
-    LEFT(INDIRECT("C"&ROW());27)="REQUERIMENTOS DE COMISSÃO: ";IFS(
-    RIGHT(INDIRECT("C"&ROW());9)="RECEBIDOS";"5.2.1";
-    RIGHT(INDIRECT("C"&ROW());14)="VOTAÇÃO ADIADA";"5.2.2";
-    RIGHT(INDIRECT("C"&ROW());9)="APROVADOS";"5.2.3";
-    RIGHT(INDIRECT("C"&ROW());9)="EMENDADOS";"5.2.3.1";
-    RIGHT(INDIRECT("C"&ROW());7)="ADIADOS";"5.2.2";
-    RIGHT(INDIRECT("C"&ROW());9)="RETIRADOS";"5.2.4";
-    RIGHT(INDIRECT("C"&ROW());12)="PREJUDICADOS";"5.2.5";
-    RIGHT(INDIRECT("C"&ROW());10)="ARQUIVADOS";"5.2.6";
-    RIGHT(INDIRECT("C"&ROW());16)="REUNIÃO CONJUNTA";"5.2.7";
-    RIGHT(INDIRECT("C"&ROW());11)="RATIFICADOS";"5.2.8";
-    RIGHT(INDIRECT("C"&ROW());25)="ASSEMBLEIA FISCALIZA MAIS";"5.2.9";
-    RIGHT(INDIRECT("C"&ROW());9)="RELATÓRIO";"5.3";
-    RIGHT(INDIRECT("C"&ROW());10)="REITERADOS";"5.5";
-    RIGHT(INDIRECT("C"&ROW());10)="REJEITADOS";"5.6";
-    RIGHT(INDIRECT("C"&ROW());10)<>"RECEBIDOS";"5.2.3");
-
-    LEFT(INDIRECT("C"&ROW());3)="RQC";IFS(
-    RIGHT(INDIRECT("C"&ROW());9)="RECEBIDOS";"5.2.1";
-    RIGHT(INDIRECT("C"&ROW());14)="VOTAÇÃO ADIADA";"5.2.2";
-    RIGHT(INDIRECT("C"&ROW());9)="APROVADOS";"5.2.3";
-    RIGHT(INDIRECT("C"&ROW());9)="EMENDADOS";"5.2.3.1";
-    RIGHT(INDIRECT("C"&ROW());7)="ADIADOS";"5.2.2";
-    RIGHT(INDIRECT("C"&ROW());9)="RETIRADOS";"5.2.4";
-    RIGHT(INDIRECT("C"&ROW());12)="PREJUDICADOS";"5.2.5";
-    RIGHT(INDIRECT("C"&ROW());10)="ARQUIVADOS";"5.2.6";
-    RIGHT(INDIRECT("C"&ROW());16)="REUNIÃO CONJUNTA";"5.2.7";
-    RIGHT(INDIRECT("C"&ROW());11)="RATIFICADOS";"5.2.8";
-    RIGHT(INDIRECT("C"&ROW());25)="ASSEMBLEIA FISCALIZA MAIS";"5.2.9";
-    RIGHT(INDIRECT("C"&ROW());9)="RELATÓRIO";"5.3";
-    RIGHT(INDIRECT("C"&ROW());10)="REITERADOS";"5.5";
-    RIGHT(INDIRECT("C"&ROW());10)="REJEITADOS";"5.6";
-    RIGHT(INDIRECT("C"&ROW());10)<>"RECEBIDOS";"5.2");
-
-    OR(LEFT(INDIRECT("C"&ROW());10)="OFÍCIOS - ";LEFT(INDIRECT("C"&ROW());27)="CORRESPONDÊNCIA: OFÍCIOS - ");IFS(
-    RIGHT(INDIRECT("C"&ROW());15)="PROJETOS DE LEI";"4.1.2";
-    RIGHT(INDIRECT("C"&ROW());13)="REQUERIMENTOS";"4.1.1";
-    RIGHT(INDIRECT("C"&ROW());5)="VETOS";"4.1.2";
-    RIGHT(INDIRECT("C"&ROW());20)="PRORROGAÇÃO DE PRAZO";"4.1.4";
-    RIGHT(INDIRECT("C"&ROW());33)="PROPOSTA DE EMENDA À CONSTITUIÇÃO";"4.1.2");
-
-    OR(LEFT(INDIRECT("C"&ROW());42)="OFÍCIO DO TRIBUNAL DE CONTAS QUE ENCAMINHA";
-    LEFT(INDIRECT("C"&ROW());69)="TRAMITAÇÃO DE PROPOSIÇÕES: OFÍCIO DO TRIBUNAL DE CONTAS QUE ENCAMINHA");IFS(
-    RIGHT(INDIRECT("C"&ROW());14)="PROJETO DE LEI";"4.2.2-A.1";
-    RIGHT(INDIRECT("C"&ROW());23)="RELATÓRIO DE ATIVIDADES";"4.2.2-A.3";
-    RIGHT(INDIRECT("C"&ROW());23)="BALANÇO GERAL DO ESTADO";"4.2.2-A.4";
-    RIGHT(INDIRECT("C"&ROW());19)="PRESTAÇÃO DE CONTAS";"4.2.2-A.5");
-
-    OR(LEFT(INDIRECT("C"&ROW());29)="OFÍCIO DO TRIBUNAL DE JUSTIÇA";
-    LEFT(INDIRECT("C"&ROW());56)="TRAMITAÇÃO DE PROPOSIÇÕES: OFÍCIO DO TRIBUNAL DE JUSTIÇA");IFS(
-    OR(RIGHT(INDIRECT("C"&ROW());14)="PROJETO DE LEI";RIGHT(INDIRECT("C"&ROW());27)="PROJETO DE LEI COMPLEMENTAR");"4.2.2-B.1");
-
-    OR(LEFT(INDIRECT("C"&ROW());28)="OFÍCIO DA DEFENSORIA PÚBLICA";
-    LEFT(INDIRECT("C"&ROW());55)="TRAMITAÇÃO DE PROPOSIÇÕES: OFÍCIO DA DEFENSORIA PÚBLICA");IFS(
-    RIGHT(INDIRECT("C"&ROW());14)="PROJETO DE LEI";"4.2.2-F.1");
-
-    OR(LEFT(INDIRECT("C"&ROW());28)="OFÍCIO DO MINISTÉRIO PÚBLICO";
-    LEFT(INDIRECT("C"&ROW());55)="TRAMITAÇÃO DE PROPOSIÇÕES: OFÍCIO DO MINISTÉRIO PÚBLICO");IFS(
-    RIGHT(INDIRECT("C"&ROW());14)="PROJETO DE LEI";"4.2.2-D.1");
-
-    LEFT(INDIRECT("C"&ROW());39)="OFÍCIO DA PROCURADORIA-GERAL DE JUSTIÇA";IFS(
-    RIGHT(INDIRECT("C"&ROW());14)="PROJETO DE LEI";"4.2.2-D.1");
-
-    OR(LEFT(INDIRECT("C"&ROW());42)="APRESENTAÇÃO DE PROPOSIÇÕES: REQUERIMENTOS";LEFT(INDIRECT("C"&ROW());69)="TRAMITAÇÃO DE PROPOSIÇÕES: APRESENTAÇÃO DE PROPOSIÇÕES: REQUERIMENTOS");IFS(
-    RIGHT(INDIRECT("C"&ROW());19)="COMISSÕES TEMÁTICAS";"4.2.7-A";
-    RIGHT(INDIRECT("C"&ROW());15)="COM COMUNICAÇÃO";"4.2.7-B";
-    RIGHT(INDIRECT("C"&ROW());15)="SEM COMUNICAÇÃO";"4.2.7-C";
-    RIGHT(INDIRECT("C"&ROW());8)="ANEXADOS";"4.2.7-D";
-    RIGHT(INDIRECT("C"&ROW());19)="CIDADANIA HONORÁRIA";"4.2.7-E";
-    RIGHT(INDIRECT("C"&ROW());13)="INDICAÇÃO TCE";"4.2.7-F";
-    RIGHT(INDIRECT("C"&ROW());25)="ASSEMBLEIA FISCALIZA MAIS";"4.2.7-G";
-    RIGHT(INDIRECT("C"&ROW());18)="FRENTE PARLAMENTAR";"4.2.7-H";
-    RIGHT(INDIRECT("C"&ROW());24)="INCLUSÃO EM ORDEM DO DIA";"4.2.7-I.1";
-    RIGHT(INDIRECT("C"&ROW());22)="RETIRADA DE TRAMITAÇÃO";"4.2.7-I.2";
-    RIGHT(INDIRECT("C"&ROW());15)="DESARQUIVAMENTO";"4.2.7-I.3";
-    RIGHT(INDIRECT("C"&ROW());15)="DESANEXAÇÃO";"4.2.7-I.4";
-    RIGHT(INDIRECT("C"&ROW());17)="COMISSÃO SEGUINTE";"4.2.7-I.5";
-    RIGHT(INDIRECT("C"&ROW());17)="MAIS UMA COMISSÃO";"4.2.7-I.6";
-    RIGHT(INDIRECT("C"&ROW());7)="RECURSO";"4.2.7-I.7";
-    RIGHT(INDIRECT("C"&ROW());21)="PEDIDO DE INFORMAÇÕES";"4.2.7-I";
-    RIGHT(INDIRECT("C"&ROW());22)="PEDIDO DE PROVIDÊNCIAS";"4.2.7-I";
-    RIGHT(INDIRECT("C"&ROW());14)="PERDA DE PRAZO";"4.2.7-I";
-    RIGHT(INDIRECT("C"&ROW());16)="REUNIÃO ESPECIAL";"4.2.7-I";
-    RIGHT(INDIRECT("C"&ROW());38)="MESA DA ASSEMBLEIA, VOTADO EM PLENÁRIO";"4.2.7-J";
-    RIGHT(INDIRECT("C"&ROW());57)="MESA DA ASSEMBLEIA, ENCAMINHADOS PARA PROVIDÊNCIA INTERNA";"4.2.7-J";
-    RIGHT(INDIRECT("C"&ROW());19)="DESPACHO A DEPUTADO";"4.2.7-K.2.1";
-    RIGHT(INDIRECT("C"&ROW());19)="DESPACHO A SERVIDOR";"4.2.7-K.2.2";
-    RIGHT(INDIRECT("C"&ROW());13)="SETOR DA CASA";"4.2.7-K.2.3";
-    RIGHT(INDIRECT("C"&ROW());19)<>"COMISSÕES TEMÁTICAS";"4.2.7-A");
-
-    OR(LEFT(INDIRECT("C"&ROW());62)="APRESENTAÇÃO DE PROPOSIÇÕES: PROPOSTA DE EMENDA À CONSTITUIÇÃO";LEFT(INDIRECT("C"&ROW());60)="TRAMITAÇÃO DE PROPOSIÇÕES: PROPOSTA DE EMENDA À CONSTITUIÇÃO");"4.2.3";
-
-    OR(LEFT(INDIRECT("C"&ROW());44)="APRESENTAÇÃO DE PROPOSIÇÕES: PROJETOS DE LEI";
-    LEFT(INDIRECT("C"&ROW());42)="TRAMITAÇÃO DE PROPOSIÇÕES: PROJETOS DE LEI");IFS(
-    RIGHT(INDIRECT("C"&ROW());19)="COMISSÕES TEMÁTICAS";"4.2.4-A";
-    RIGHT(INDIRECT("C"&ROW());8)="ANEXADOS";"4.2.4-B";
-    RIGHT(INDIRECT("C"&ROW());18)="MESA DA ASSEMBLEIA";"4.2.4-D");
-
-    OR(LEFT(INDIRECT("C"&ROW());50)="APRESENTAÇÃO DE PROPOSIÇÕES: PROJETOS DE RESOLUÇÃO";
-    LEFT(INDIRECT("C"&ROW());48)="TRAMITAÇÃO DE PROPOSIÇÕES: PROJETOS DE RESOLUÇÃO");IFS(
-    RIGHT(INDIRECT("C"&ROW());29)="REGIME ESPECIAL DE TRIBUTAÇÃO";"4.2.5-A";
-    RIGHT(INDIRECT("C"&ROW());19)="APROVAÇÃO DE CONTAS";"4.2.5-B";
-    RIGHT(INDIRECT("C"&ROW());24)="RATIFICAÇÃO DE CONVÊNIOS";"4.2.5-C";
-    RIGHT(INDIRECT("C"&ROW());37)="ESTRUTURA DA SECRETARIA DA ASSEMBLEIA";"4.2.5-D";
-    RIGHT(INDIRECT("C"&ROW());19)="COMISSÕES TEMÁTICAS";"4.2.5-E";
-    RIGHT(INDIRECT("C"&ROW());8)="ANEXADOS";"4.2.5-F";
-    RIGHT(INDIRECT("C"&ROW());19)="CIDADANIA HONORÁRIA";"4.2.5-G";
-    RIGHT(INDIRECT("C"&ROW());18)="CALAMIDADE PÚBLICA";"4.2.5-H";
-    RIGHT(INDIRECT("C"&ROW());21)="LICENÇA AO GOVERNADOR";"4.2.5-I"
-    );
-
-    LEFT(INDIRECT("C"&ROW());25)="PROPOSIÇÕES NÃO RECEBIDAS";IFS(
-    RIGHT(INDIRECT("C"&ROW());15)="PROJETOS DE LEI";"4.3";
-    RIGHT(INDIRECT("C"&ROW());13)="REQUERIMENTOS";"4.3";
-    RIGHT(INDIRECT("C"&ROW());15)<>"PROJETOS DE LEI";"4.3");
-
-    INDIRECT("C"&ROW())="CONGRATULAÇÕES ENTREGUES EM REUNIÃO";"8.4";
-    INDIRECT("C"&ROW())="ENTREGA DE DIPLOMA";"8.4";
-    LEFT(INDIRECT("C"&ROW());25)="RECEBIMENTO DE PROPOSIÇÃO";"9.1";
-    LEFT(INDIRECT("C"&ROW());23)="DESIGNAÇÃO DE RELATORIA";"9.2";
-    LEFT(INDIRECT("C"&ROW());25)="CUMPRIMENTO DE DILIGÊNCIA";"9.3";
-    LEFT(INDIRECT("C"&ROW());32)="REUNIÃO COM DEBATE DE PROPOSIÇÃO";"9.8";
-    LEFT(INDIRECT("C"&ROW());33)="REUNIÃO ORIGINADA DE REQUERIMENTO";"9.7";
-    INDIRECT("C"&ROW())="PAUTA COMPLETA DE REUNIÃO COM DEBATE DE PROPOSIÇÃO";"9.8.1";
-    INDIRECT("C"&ROW())="RESULTADO COMPLETO DE REUNIÃO COM DEBATE DE PROPOSIÇÃO";"9.8.2";
-    LEFT(INDIRECT("C"&ROW());16)="CONSULTA PÚBLICA";"9.9";
-
-    INDIRECT("C"&ROW())="REMESSA - PEDIDO DE INFORMAÇÃO";"8.6";
-    INDIRECT("C"&ROW())="REMESSA - REQUERIMENTO APROVADO";"8.5";
-    INDIRECT("C"&ROW())="OFÍCIO - PEDIDO DE INFORMAÇÃO";"8.6";
-    INDIRECT("C"&ROW())="OFÍCIO - PEDIDO DE INFORMAÇÃO";"8.7";
-    INDIRECT("C"&ROW())="OFÍCIO - REQUERIMENTO APROVADO";"8.5";
-    INDIRECT("C"&ROW())="OFÍCIO - MANIFESTAÇÃO DE APLAUSO";"8.1";
-    INDIRECT("C"&ROW())="OFÍCIO - MANIFESTAÇÃO DE APOIO";"8.1";
-    INDIRECT("C"&ROW())="OFÍCIO - MANIFESTAÇÃO DE REPÚDIO";"8.1";
-    INDIRECT("C"&ROW())="OFÍCIO - MANIFESTAÇÃO DE PROTESTO";"8.1";
-    INDIRECT("C"&ROW())="OFÍCIO - MANIFESTAÇÃO DE PESAR";"8.2";
-    INDIRECT("C"&ROW())="OFÍCIO - VOTO DE CONGRATULAÇÕES";"8.3";
-    INDIRECT("C"&ROW())="OFÍCIO COMUNICANDO MANUTENÇÃO TOTAL DO VETO";"8.9";
-    INDIRECT("C"&ROW())="OFÍCIO COMUNICANDO REJEIÇÃO TOTAL DO VETO";"8.10";
-    INDIRECT("C"&ROW())="OFÍCIO COMUNICANDO REJEIÇÃO PARCIAL DO VETO";"8.11";
-    INDIRECT("C"&ROW())="OFÍCIO COMUNICANDO APROVAÇÃO DA INDICAÇÃO";"8.11";
-    INDIRECT("C"&ROW())="OFÍCIO ENCAMINHADO AOS DESTINATÁRIOS POR E-MAIL";"8.12";
-
-    INDIRECT("C"&ROW())="PROPOSIÇÃO DE LEI ENCAMINHADA PARA SANÇÃO";"8.8";
-    INDIRECT("C"&ROW())="PRECLUSÃO DE PRAZO: PROJETOS DE LEI";"11.1.1";
-    INDIRECT("C"&ROW())="PRECLUSÃO DE PRAZO: REQUERIMENTOS, APROVADOS";"11.1.2-A";
-    INDIRECT("C"&ROW())="PRECLUSÃO DE PRAZO: REQUERIMENTOS, REJEITADOS";"11.1.2-B";
-    INDIRECT("C"&ROW())="PRECLUSÃO DE PRAZO: REQUERIMENTOS, RECURSO";"11.1.2-C";
-    INDIRECT("C"&ROW())="PRECLUSÃO DE PRAZO: INCONSTITUCIONALIDADE";"11.2"
-
-    ))''']] * ((footer_start - 1) - 5))
-
-        add(f"S6:S{footer_start - 1}", [['''=IFS(
-
-    OR(
-    INDIRECT("C"&ROW())="";
-    LEFT(INDIRECT("C"&ROW());6)="DIÁRIO";
-    LEFT(INDIRECT("C"&ROW());8)="REUNIÕES";
-    INDIRECT("C"&ROW())="REQUERIMENTOS DE COMISSÕES";
-    INDIRECT("C"&ROW())="LANÇAMENTOS DE TRAMITAÇÃO";
-    INDIRECT("C"&ROW())="CADASTRO DE E-MAILS";
-    INDIRECT("C"&ROW())="OFÍCIOS DA SECRETARIA-GERAL DA MESA";
-    INDIRECT("C"&ROW())="LANÇAMENTOS DE PRECLUSÃO DE PRAZO";
-    INDIRECT("C"&ROW())="IMPLANTAÇÃO DE TEXTOS");"";
-
-    OR(
-    INDIRECT("C"&ROW())="ALINE";
-    INDIRECT("C"&ROW())="ANDRÉ";
-    INDIRECT("C"&ROW())="DIOGO";
-    INDIRECT("C"&ROW())="KÁTIA";
-    INDIRECT("C"&ROW())="LEO";
-    INDIRECT("C"&ROW())="WELDER";
-    INDIRECT("C"&ROW())="TOTAL";
-    INDIRECT("C"&ROW())="?";
-    ISNUMBER(INDIRECT("C"&ROW()));
-    INDIRECT("K"&ROW())="-";
-    INDIRECT("K"&ROW())="cancelada";
-    INDIRECT("K"&ROW())="sem quórum";
-    INDIRECT("K"&ROW())="não publicado");"-";
-
-    OR(
-    INDIRECT("C"&ROW())="-";
-    INDIRECT("C"&ROW())="VOTAÇÕES NOMINAIS";
-    RIGHT(INDIRECT("C"&ROW());18)="EMENDAS PUBLICADAS";
-    LEFT(INDIRECT("C"&ROW());17)="VOTAÇÕES NOMINAIS");"-";
-
-    LEFT(INDIRECT("C"&ROW());6)<>"DIÁRIO";IFS(
-
-    INDIRECT("C"&ROW())="IMPLANTAÇÃO DE TEXTOS";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=27";"PÁG 27");
-    OR(INDIRECT("C"&ROW())="EMENDA À CONSTITUIÇÃO PROMULGADA";INDIRECT("C"&ROW())="EMENDAS À CONSTITUIÇÃO PROMULGADAS");HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=47";"PÁG 47");
-    OR(INDIRECT("C"&ROW())="PROPOSTA DE AÇÃO LEGISLATIVA";INDIRECT("C"&ROW())="PROPOSTAS DE AÇÃO LEGISLATIVA");HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=194";"PÁG 194");
-    RIGHT(INDIRECT("C"&ROW());48)="PROPOSTAS DE AÇÃO LEGISLATIVA REFERENTES AO PPAG";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=195";"PÁG 195");
-    INDIRECT("C"&ROW())="ESPECIAL";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=371";"PÁG 371");
-    INDIRECT("C"&ROW())="ORDINÁRIA";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=386";"PÁG 386");
-    INDIRECT("C"&ROW())="EXTRAORDINÁRIA";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=386";"PÁG 386");
-    INDIRECT("C"&ROW())="SOLENE";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=386";"PÁG 386");
-    OR(INDIRECT("C"&ROW())="RESOLUÇÃO";INDIRECT("C"&ROW())="RESOLUÇÕES");HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=43";"PÁG 43");
-    INDIRECT("C"&ROW())="PROPOSIÇÕES DE LEI";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=48";"PÁG 48");
-    INDIRECT("C"&ROW())="DECISÃO DA MESA";"PÁG ??";
-    INDIRECT("C"&ROW())="DECISÕES DA PRESIDÊNCIA";"PÁG ??";
-    INDIRECT("C"&ROW())="MANIFESTAÇÕES";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=276";"PÁG 276");
-    RIGHT(INDIRECT("C"&ROW());24)="VOTAÇÃO DE REQUERIMENTOS";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=265";"PÁG 265");
-    INDIRECT("C"&ROW())="OFÍCIOS DE PREFEITURA QUE ENCAMINHAM DECRETOS DE CALAMIDADE PÚBLICA";"PÁG ??";
-    LEFT(INDIRECT("C"&ROW());16)="REUNIÃO CONJUNTA";"PÁG ??";
-    INDIRECT("C"&ROW())="VETO TOTAL A PROPOSIÇÃO DE LEI";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=303";"PÁG 303");
-    LEFT(INDIRECT("C"&ROW());32)="VETO PARCIAL A PROPOSIÇÃO DE LEI";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=303";"PÁG 303");
-    OR(INDIRECT("C"&ROW())="DESIGNAÇÃO DE COMISSÕES";INDIRECT("C"&ROW())="TRAMITAÇÃO DE PROPOSIÇÕES: DESIGNAÇÃO DE COMISSÕES");HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=251";"PÁG 251");
-    INDIRECT("C"&ROW())="PROPOSIÇÃO: REQUERIMENTOS - INDICAÇÃO TCE";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=197";"PÁG 197");
-    INDIRECT("C"&ROW())="TRAMITAÇÃO DE PROPOSIÇÕES: PARECERES";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=301";"PÁG 301");
-    INDIRECT("C"&ROW())="PARECERES SOBRE VETO";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=434";"PÁG 434");
-    INDIRECT("C"&ROW())="PARECERES SOBRE SUBSTITUTIVO";"PÁG ??";
-    OR(INDIRECT("C"&ROW())="ERRATAS";INDIRECT("C"&ROW())="ERRATA");HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=279";"PÁG 279");
-    RIGHT(INDIRECT("C"&ROW());23)="LEITURA DE COMUNICAÇÕES";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=255";"PÁG 255");
-    OR(LEFT(INDIRECT("C"&ROW());3)="LEI");HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=315";"PÁG 315");
-    OR(INDIRECT("C"&ROW())="EMENDAS OU SUBSTITUTIVOS PUBLICADOS";INDIRECT("C"&ROW())="EMENDAS NÃO RECEBIDAS PUBLICADAS");"PÁG ??";
-    OR(LEFT(INDIRECT("C"&ROW());19)="RELATÓRIO DE VISITA";LEFT(INDIRECT("C"&ROW());46)="TRAMITAÇÃO DE PROPOSIÇÕES: RELATÓRIO DE VISITA");HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=290";"PÁG 290");
-    RIGHT(INDIRECT("C"&ROW());33)="RELATÓRIO DE EVENTO INSTITUCIONAL";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=223";"PÁG 223");
-    RIGHT(INDIRECT("C"&ROW());24)="REQUERIMENTOS APROVADOS";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=277";"PÁG 277");
-    RIGHT(INDIRECT("C"&ROW());26)="COMUNICAÇÃO DA PRESIDÊNCIA";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=246";"PÁG 246");
-    OR(LEFT(INDIRECT("C"&ROW());22)="DECISÃO DA PRESIDÊNCIA";LEFT(INDIRECT("C"&ROW());49)="TRAMITAÇÃO DE PROPOSIÇÕES: DECISÃO DA PRESIDÊNCIA");HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=243";"PÁG 243");
-    RIGHT(INDIRECT("C"&ROW());22)="PALAVRAS DO PRESIDENTE";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=242";"PÁG 242");
-    LEFT(INDIRECT("C"&ROW());25)="DESPACHO DE REQUERIMENTOS";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=262";"PÁG 262");
-    LEFT(INDIRECT("C"&ROW());17)="AUDIÊNCIA PÚBLICA";"PÁG ??";
-    LEFT(INDIRECT("C"&ROW());23)="AUDIÊNCIA DE CONVIDADOS";"PÁG ??";
-
-    OR(LEFT(INDIRECT("C"&ROW());36)="MENSAGEM DO GOVERNADOR QUE ENCAMINHA";
-    LEFT(INDIRECT("C"&ROW());38)="MENSAGENS DO GOVERNADOR QUE ENCAMINHAM";
-    LEFT(INDIRECT("C"&ROW());63)="TRAMITAÇÃO DE PROPOSIÇÕES: MENSAGEM DO GOVERNADOR QUE ENCAMINHA";
-    LEFT(INDIRECT("C"&ROW());65)="TRAMITAÇÃO DE PROPOSIÇÕES: MENSAGENS DO GOVERNADOR QUE ENCAMINHAM";
-    LEFT(INDIRECT("C"&ROW());35)="MENSAGEM DO GOVERNADOR QUE COMUNICA";
-    LEFT(INDIRECT("C"&ROW());62)="TRAMITAÇÃO DE PROPOSIÇÕES: MENSAGEM DO GOVERNADOR QUE COMUNICA";
-    LEFT(INDIRECT("C"&ROW());35)="MENSAGEM DO GOVERNADOR QUE SOLICITA");IFS(
-    OR(RIGHT(INDIRECT("C"&ROW());14)="PROJETO DE LEI";RIGHT(INDIRECT("C"&ROW());27)="PROJETO DE LEI COMPLEMENTAR";RIGHT(INDIRECT("C"&ROW());15)="PROJETOS DE LEI";RIGHT(INDIRECT("C"&ROW());36)="PROJETO DE LEI - CRÉDITO SUPLEMENTAR");HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=58";"PÁG 58");
-    RIGHT(INDIRECT("C"&ROW());42)="EMENDA OU SUBSTITUTIVO COM DESPACHO À MESA";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=65";"PÁG 65");
-    RIGHT(INDIRECT("C"&ROW());41)="EMENDA OU SUBSTITUTIVO COM DESPACHO À FFO";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=65";"PÁG 65");
-    RIGHT(INDIRECT("C"&ROW());12)="VETO PARCIAL";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=73";"PÁG 73");
-    RIGHT(INDIRECT("C"&ROW());10)="VETO TOTAL";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=73";"PÁG 73");
-    RIGHT(INDIRECT("C"&ROW());29)="REGIME ESPECIAL DE TRIBUTAÇÃO";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=78";"PÁG 78");
-    RIGHT(INDIRECT("C"&ROW());9)="INDICAÇÃO";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=81";"PÁG 81");
-    RIGHT(INDIRECT("C"&ROW());28)="PEDIDO DE REGIME DE URGÊNCIA";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=84";"PÁG 84");
-    RIGHT(INDIRECT("C"&ROW());18)="CONVÊNIO DO CONFAZ";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=89";"PÁG 89");
-    RIGHT(INDIRECT("C"&ROW());16)="CONVÊNIO DO ICMS";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=90";"PÁG 90");
-    RIGHT(INDIRECT("C"&ROW());44)="PRESTAÇÃO DE CONTAS DA ADMINISTRAÇÃO PÚBLICA";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=93";"PÁG 93");
-    RIGHT(INDIRECT("C"&ROW());36)="RELATÓRIO SOBRE A SITUAÇÃO DO ESTADO";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=97";"PÁG 97");
-    RIGHT(INDIRECT("C"&ROW());29)="DESARQUIVAMENTO DE PROPOSIÇÃO";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=110";"PÁG 110");
-    RIGHT(INDIRECT("C"&ROW());19)="RETIRADA DE PROJETO";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=110";"PÁG 100");
-    RIGHT(INDIRECT("C"&ROW());16)="AUSÊNCIA DO PAÍS";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=140";"PÁG 140")
-    );
-
-    OR(LEFT(INDIRECT("C"&ROW());20)="OFÍCIO DO GOVERNADOR";
-    MID(INDIRECT("C"&ROW());28;20)="OFÍCIO DO GOVERNADOR";
-    LEFT(INDIRECT("C"&ROW());25)="OFÍCIO DO VICE-GOVERNADOR");
-    IFS(
-    RIGHT(INDIRECT("C"&ROW());28)="COMUNICANDO AUSÊNCIA DO PAÍS";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=139";"PÁG 139");
-    RIGHT(INDIRECT("C"&ROW());35)="COMUNICANDO QUE ENCAMINHOU MENSAGEM";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=138";"PÁG 138"));
-
-    OR(LEFT(INDIRECT("C"&ROW());27)="REQUERIMENTOS DE COMISSÃO: ";LEFT(INDIRECT("C"&ROW());3)="RQC");IFS(
-    RIGHT(INDIRECT("C"&ROW());9)="APROVADOS";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=285";"PÁG 285");
-    RIGHT(INDIRECT("C"&ROW());9)="EMENDADOS";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=291";"PÁG 291");
-    RIGHT(INDIRECT("C"&ROW());7)="ADIADOS";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=291";"PÁG 301");
-    RIGHT(INDIRECT("C"&ROW());9)="RECEBIDOS";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=286";"PÁG 286");
-    RIGHT(INDIRECT("C"&ROW());12)="PREJUDICADOS";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=283";"PÁG 283");
-    RIGHT(INDIRECT("C"&ROW());9)="RELATÓRIO";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=294";"PÁG 294");
-    RIGHT(INDIRECT("C"&ROW());10)="REITERADOS";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=296";"PÁG 296");
-    RIGHT(INDIRECT("C"&ROW());9)<>"APROVADOS";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=285";"PÁG 285"));
-
-    OR(LEFT(INDIRECT("C"&ROW());10)="OFÍCIOS - ";LEFT(INDIRECT("C"&ROW());27)="CORRESPONDÊNCIA: OFÍCIOS - ");IFS(
-    RIGHT(INDIRECT("C"&ROW());15)="PROJETOS DE LEI";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=51";"PÁG 51");
-    RIGHT(INDIRECT("C"&ROW());13)="REQUERIMENTOS";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=50";"PÁG 50");
-    RIGHT(INDIRECT("C"&ROW());5)="VETOS";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=51";"PÁG 51");
-    RIGHT(INDIRECT("C"&ROW());20)="PRORROGAÇÃO DE PRAZO";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=53";"PÁG 53");
-    RIGHT(INDIRECT("C"&ROW());33)="PROPOSTA DE EMENDA À CONSTITUIÇÃO";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=51";"PÁG 51"));
-
-    OR(LEFT(INDIRECT("C"&ROW());42)="OFÍCIO DO TRIBUNAL DE CONTAS QUE ENCAMINHA";LEFT(INDIRECT("C"&ROW());69)="TRAMITAÇÃO DE PROPOSIÇÕES: OFÍCIO DO TRIBUNAL DE CONTAS QUE ENCAMINHA");IFS(
-    RIGHT(INDIRECT("C"&ROW());14)="PROJETO DE LEI";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=113";"PÁG 113");
-    RIGHT(INDIRECT("C"&ROW());23)="RELATÓRIO DE ATIVIDADES";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=117";"PÁG 117");
-    RIGHT(INDIRECT("C"&ROW());23)="BALANÇO GERAL DO ESTADO";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=118";"PÁG 118");
-    RIGHT(INDIRECT("C"&ROW());19)="PRESTAÇÃO DE CONTAS";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=120";"PÁG 120"));
-
-    OR(LEFT(INDIRECT("C"&ROW());29)="OFÍCIO DO TRIBUNAL DE JUSTIÇA";
-    LEFT(INDIRECT("C"&ROW());56)="TRAMITAÇÃO DE PROPOSIÇÕES: OFÍCIO DO TRIBUNAL DE JUSTIÇA");IFS(
-    OR(RIGHT(INDIRECT("C"&ROW());14)="PROJETO DE LEI";RIGHT(INDIRECT("C"&ROW());27)="PROJETO DE LEI COMPLEMENTAR");HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=123";"PÁG 123"));
-
-    OR(LEFT(INDIRECT("C"&ROW());28)="OFÍCIO DA DEFENSORIA PÚBLICA";
-    LEFT(INDIRECT("C"&ROW());55)="TRAMITAÇÃO DE PROPOSIÇÕES: OFÍCIO DA DEFENSORIA PÚBLICA");IFS(
-    RIGHT(INDIRECT("C"&ROW());14)="PROJETO DE LEI";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=148";"PÁG 148"));
-
-    OR(LEFT(INDIRECT("C"&ROW());28)="OFÍCIO DO MINISTÉRIO PÚBLICO";
-    LEFT(INDIRECT("C"&ROW());55)="TRAMITAÇÃO DE PROPOSIÇÕES: OFÍCIO DO MINISTÉRIO PÚBLICO");IFS(
-    RIGHT(INDIRECT("C"&ROW());14)="PROJETO DE LEI";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=144";"PÁG 144"));
-
-    LEFT(INDIRECT("C"&ROW());39)="OFÍCIO DA PROCURADORIA-GERAL DE JUSTIÇA";IFS(
-    RIGHT(INDIRECT("C"&ROW());14)="PROJETO DE LEI";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=144";"PÁG 144"));
-
-    OR(LEFT(INDIRECT("C"&ROW());42)="APRESENTAÇÃO DE PROPOSIÇÕES: REQUERIMENTOS";LEFT(INDIRECT("C"&ROW());69)="TRAMITAÇÃO DE PROPOSIÇÕES: APRESENTAÇÃO DE PROPOSIÇÕES: REQUERIMENTOS");IFS(
-    RIGHT(INDIRECT("C"&ROW());19)="COMISSÕES TEMÁTICAS";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=197";"PÁG 197");
-    RIGHT(INDIRECT("C"&ROW());15)="COM COMUNICAÇÃO";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=201";"PÁG 201");
-    RIGHT(INDIRECT("C"&ROW());15)="SEM COMUNICAÇÃO";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=203";"PÁG 203");
-    RIGHT(INDIRECT("C"&ROW());8)="ANEXADOS";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=204";"PÁG 204");
-    RIGHT(INDIRECT("C"&ROW());19)="CIDADANIA HONORÁRIA";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=206";"PÁG 206");
-    RIGHT(INDIRECT("C"&ROW());13)="INDICAÇÃO TCE";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=207";"PÁG 207");
-    RIGHT(INDIRECT("C"&ROW());25)="ASSEMBLEIA FISCALIZA MAIS";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=210";"PÁG 210");
-    RIGHT(INDIRECT("C"&ROW());18)="FRENTE PARLAMENTAR";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=211";"PÁG 211");
-    RIGHT(INDIRECT("C"&ROW());24)="INCLUSÃO EM ORDEM DO DIA";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=215";"PÁG 215");
-    RIGHT(INDIRECT("C"&ROW());22)="RETIRADA DE TRAMITAÇÃO";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=215";"PÁG 215");
-    RIGHT(INDIRECT("C"&ROW());15)="DESARQUIVAMENTO";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=216";"PÁG 216");
-    RIGHT(INDIRECT("C"&ROW());11)="DESANEXAÇÃO";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=218";"PÁG 218");
-    RIGHT(INDIRECT("C"&ROW());17)="COMISSÃO SEGUINTE";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=220";"PÁG 220");
-    RIGHT(INDIRECT("C"&ROW());17)="MAIS UMA COMISSÃO";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=221";"PÁG 221");
-    RIGHT(INDIRECT("C"&ROW());7)="RECURSO";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=222";"PÁG 222");
-    RIGHT(INDIRECT("C"&ROW());21)="PEDIDO DE INFORMAÇÕES";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=213";"PÁG 213");
-    RIGHT(INDIRECT("C"&ROW());22)="PEDIDO DE PROVIDÊNCIAS";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=213";"PÁG 213");
-    RIGHT(INDIRECT("C"&ROW());14)="PERDA DE PRAZO";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=213";"PÁG 213");
-    RIGHT(INDIRECT("C"&ROW());16)="REUNIÃO ESPECIAL";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=213";"PÁG 213");
-    RIGHT(INDIRECT("C"&ROW());38)="MESA DA ASSEMBLEIA, VOTADO EM PLENÁRIO";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=223";"PÁG 223");
-    RIGHT(INDIRECT("C"&ROW());57)="MESA DA ASSEMBLEIA, ENCAMINHADOS PARA PROVIDÊNCIA INTERNA";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=223";"PÁG 223");
-    RIGHT(INDIRECT("C"&ROW());19)="DESPACHO A DEPUTADO";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=226";"PÁG 226");
-    RIGHT(INDIRECT("C"&ROW());19)="DESPACHO A SERVIDOR";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=227";"PÁG 227");
-    RIGHT(INDIRECT("C"&ROW());13)="SETOR DA CASA";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=229";"PÁG 229");
-    RIGHT(INDIRECT("C"&ROW());19)<>"COMISSÕES TEMÁTICAS";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=197";"PÁG 197"));
-
-    OR(LEFT(INDIRECT("C"&ROW());62)="APRESENTAÇÃO DE PROPOSIÇÕES: PROPOSTA DE EMENDA À CONSTITUIÇÃO";LEFT(INDIRECT("C"&ROW());60)="TRAMITAÇÃO DE PROPOSIÇÕES: PROPOSTA DE EMENDA À CONSTITUIÇÃO");HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=167";"PÁG 167");
-
-    OR(LEFT(INDIRECT("C"&ROW());44)="APRESENTAÇÃO DE PROPOSIÇÕES: PROJETOS DE LEI";
-    LEFT(INDIRECT("C"&ROW());42)="TRAMITAÇÃO DE PROPOSIÇÕES: PROJETOS DE LEI");IFS(
-    RIGHT(INDIRECT("C"&ROW());19)="COMISSÕES TEMÁTICAS";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=168";"PÁG 168");
-    RIGHT(INDIRECT("C"&ROW());8)="ANEXADOS";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=169";"PÁG 169");
-    RIGHT(INDIRECT("C"&ROW());18)="MESA DA ASSEMBLEIA";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=163";"PÁG 163"));
-
-    OR(LEFT(INDIRECT("C"&ROW());50)="APRESENTAÇÃO DE PROPOSIÇÕES: PROJETOS DE RESOLUÇÃO";LEFT(INDIRECT("C"&ROW());48)="TRAMITAÇÃO DE PROPOSIÇÕES: PROJETOS DE RESOLUÇÃO");IFS(
-    RIGHT(INDIRECT("C"&ROW());29)="REGIME ESPECIAL DE TRIBUTAÇÃO";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=170";"PÁG 170");
-    RIGHT(INDIRECT("C"&ROW());19)="APROVAÇÃO DE CONTAS";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=172";"PÁG 172");
-    RIGHT(INDIRECT("C"&ROW());24)="RATIFICAÇÃO DE CONVÊNIOS";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=173";"PÁG 173");
-    RIGHT(INDIRECT("C"&ROW());37)="ESTRUTURA DA SECRETARIA DA ASSEMBLEIA";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=175";"PÁG 175");
-    RIGHT(INDIRECT("C"&ROW());19)="COMISSÕES TEMÁTICAS";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=176";"PÁG 176");
-    RIGHT(INDIRECT("C"&ROW());8)="ANEXADOS";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=178";"PÁG 178");
-    RIGHT(INDIRECT("C"&ROW());19)="CIDADANIA HONORÁRIA";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=180";"PÁG 180");
-    RIGHT(INDIRECT("C"&ROW());18)="CALAMIDADE PÚBLICA";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=181";"PÁG 181");
-    RIGHT(INDIRECT("C"&ROW());21)="LICENÇA AO GOVERNADOR";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=182";"PÁG 182")
-    );
-
-
-    LEFT(INDIRECT("C"&ROW());25)="PROPOSIÇÕES NÃO RECEBIDAS";IFS(
-    RIGHT(INDIRECT("C"&ROW());15)="PROJETOS DE LEI";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=238";"PÁG 238");
-    RIGHT(INDIRECT("C"&ROW());13)="REQUERIMENTOS";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=238";"PÁG 238");
-    RIGHT(INDIRECT("C"&ROW());15)<>"PROJETOS DE LEI";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=238";"PÁG 238"));
-
-    LEFT(INDIRECT("C"&ROW());25)="RECEBIMENTO DE PROPOSIÇÃO";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=339";"PÁG 339");
-    LEFT(INDIRECT("C"&ROW());23)="DESIGNAÇÃO DE RELATORIA";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=343";"PÁG 343");
-    LEFT(INDIRECT("C"&ROW());25)="CUMPRIMENTO DE DILIGÊNCIA";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=346";"PÁG 346");
-    LEFT(INDIRECT("C"&ROW());33)="REUNIÃO ORIGINADA DE REQUERIMENTO";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=350";"PÁG 350");
-    LEFT(INDIRECT("C"&ROW());32)="REUNIÃO COM DEBATE DE PROPOSIÇÃO";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=351";"PÁG 351");
-    INDIRECT("C"&ROW())="PAUTA COMPLETA DE REUNIÃO COM DEBATE DE PROPOSIÇÃO";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=352";"PÁG 352");
-    INDIRECT("C"&ROW())="RESULTADO COMPLETO DE REUNIÃO COM DEBATE DE PROPOSIÇÃO";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=353";"PÁG 353");
-    INDIRECT("C"&ROW())="CONGRATULAÇÕES ENTREGUES EM REUNIÃO";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=328";"PÁG 328");
-    INDIRECT("C"&ROW())="ENTREGA DE DIPLOMA";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=328";"PÁG 328");
-    LEFT(INDIRECT("C"&ROW());16)="CONSULTA PÚBLICA";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=356";"PÁG 356");
-
-    OR(LEFT(INDIRECT("C"&ROW());8)="COMISSÃO";LEFT(INDIRECT("C"&ROW());4)="CIPE");IFS(
-    MID(INDIRECT("C"&ROW());13;12)="CONSTITUIÇÃO";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=366";"PÁG 366");
-    MID(INDIRECT("C"&ROW());13;12)="FISCALIZAÇÃO";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=371";"PÁG 371");
-    MID(INDIRECT("C"&ROW());13;12)="PARTICIPAÇÃO";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=376";"PÁG 376");
-    MID(INDIRECT("C"&ROW());13;7)="REDAÇÃO";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=378";"PÁG 378");
-    MID(INDIRECT("C"&ROW());11;8)="ESPECIAL";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=380";"PÁG 380");
-    MID(INDIRECT("C"&ROW());13;12)<>"CONSTITUIÇÃO";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=356";"PÁG 356"));
-
-    INDIRECT("C"&ROW())="REMESSA - REQUERIMENTO APROVADO";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=329";"PÁG 329");
-    INDIRECT("C"&ROW())="REMESSA - PEDIDO DE INFORMAÇÃO";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=330";"PÁG 330");
-    INDIRECT("C"&ROW())="OFÍCIO - REQUERIMENTO APROVADO";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=329";"PÁG 329");
-    INDIRECT("C"&ROW())="OFÍCIO - PEDIDO DE INFORMAÇÃO";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=330";"PÁG 330");
-    INDIRECT("C"&ROW())="OFÍCIO - PEDIDO DE INFORMAÇÃO";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=331";"PÁG 331");
-    INDIRECT("C"&ROW())="OFÍCIO - MANIFESTAÇÃO DE APLAUSO";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=326";"PÁG 326");
-    INDIRECT("C"&ROW())="OFÍCIO - MANIFESTAÇÃO DE APOIO";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=326";"PÁG 326");
-    INDIRECT("C"&ROW())="OFÍCIO - MANIFESTAÇÃO DE REPÚDIO";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=326";"PÁG 326");
-    INDIRECT("C"&ROW())="OFÍCIO - MANIFESTAÇÃO DE PROTESTO";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=326";"PÁG 326");
-    INDIRECT("C"&ROW())="OFÍCIO - MANIFESTAÇÃO DE PESAR";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=327";"PÁG 327");
-    INDIRECT("C"&ROW())="OFÍCIO - VOTO DE CONGRATULAÇÕES";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=328";"PÁG 328");
-    INDIRECT("C"&ROW())="OFÍCIO COMUNICANDO MANUTENÇÃO TOTAL DO VETO";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=333";"PÁG 333");
-    INDIRECT("C"&ROW())="OFÍCIO COMUNICANDO REJEIÇÃO TOTAL DO VETO";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=334";"PÁG 334");
-    INDIRECT("C"&ROW())="OFÍCIO COMUNICANDO REJEIÇÃO PARCIAL DO VETO";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=334";"PÁG 334");
-    INDIRECT("C"&ROW())="OFÍCIO COMUNICANDO APROVAÇÃO DA INDICAÇÃO";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=335";"PÁG 335");
-    INDIRECT("C"&ROW())="OFÍCIO ENCAMINHADO AOS DESTINATÁRIOS POR E-MAIL";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=335";"PÁG 335");
-
-    INDIRECT("C"&ROW())="PROPOSIÇÃO DE LEI ENCAMINHADA PARA SANÇÃO";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=332";"PÁG 332");
-    INDIRECT("C"&ROW())="PRECLUSÃO DE PRAZO: PROJETOS DE LEI";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=403";"PÁG 403");
-    INDIRECT("C"&ROW())="PRECLUSÃO DE PRAZO: REQUERIMENTOS, APROVADOS";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=404";"PÁG 404");
-    INDIRECT("C"&ROW())="PRECLUSÃO DE PRAZO: REQUERIMENTOS, RECURSO";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=404";"PÁG 404");
-    INDIRECT("C"&ROW())="PRECLUSÃO DE PRAZO: REQUERIMENTOS, REJEITADOS";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=404";"PÁG 404");
-    INDIRECT("C"&ROW())="PRECLUSÃO DE PRAZO: INCONSTITUCIONALIDADE";HYPERLINK("http://welder.eci.ufmg.br/wp-content/uploads/2024/03/MANUAL-MATE-2024.pdf#page=405";"PÁG 405")
-
-    ))''']] * ((footer_start - 1) - 5))
-
+        add("Z1:Z5", [[f] for f in FORMULAS_DATA_AUX])
+        add_coluna("AA", FORMULA_CLASSE_LINHA)
+        add_coluna("AB", FORMULA_ID_TIPO)
+        add_coluna("AC", FORMULA_ID_COMISSAO)
+        add_coluna("AD", FORMULA_TRIAGEM_QRS)
+        add_coluna("A", FORMULA_COLUNA_A)
+        # aba _lk em chamada própria, como RAW: com USER_ENTERED o Sheets converteria códigos como "5.3" e "8.10"
+        # em número/data (conforme a localidade) e os XLOOKUP devolveriam o valor convertido, não o código
+        body_lk = {"valueInputOption": "RAW", "data": [
+            {"range": f"'{ABA_LK}'!A1:{chr(ord('A') + LK_COLUNAS - 1)}{LK_LINHAS}", "values": LK_VALORES}]}
+
+        # P:S — textos das fórmulas montados uma vez no import do módulo (iguais para toda aba criada)
+        add_coluna("P", FORMULA_COLUNA_P)
+        add_coluna("Q", FORMULA_COLUNA_Q)
+        add_coluna("R", FORMULA_COLUNA_R)
+        add_coluna("S", FORMULA_COLUNA_S)
 
     # ====================================================================================================================================================================================================
     # ============================================================================================= DATAS ===============================================================================================
     # ====================================================================================================================================================================================================
-        data += [
-            {"range": f"{tab_name}!Q2", "values": [["=B6"]]},
-            {"range": f"{tab_name}!Q3", "values": [["=TODAY()"]]},
-            {"range": f"{tab_name}!Q4", "values": [['=QUERY(C6:G8;"SELECT E WHERE C MATCHES \'.*DIÁRIO DO LEGISLATIVO.*\'";0)']]},
-            {"range": f"{tab_name}!S2", "values": [['=TEXT(Q2;"\'dd\' \'mm\' \'yyyy\'")']]},
-            {"range": f"{tab_name}!S3", "values": [['=TEXT(Q3;"\'d\' \'MM\' yyyy")']]},
-            {"range": f"{tab_name}!S4", "values": [['=TEXT(Q4;"\'dd\' \'mm\' \'yyyy\'")']]},
-            {"range": f"{tab_name}!T2", "values": [['=TEXT(Q2;"\'d\' \'m\' \'yyyy\'")']]},
-            {"range": f"{tab_name}!T3", "values": [['=TEXT(Q3;"\'d\' \'m\' \'yyyy\'")']]},
-            {"range": f"{tab_name}!T4", "values": [['=TEXT(Q4;"\'d\' \'m\' \'yyyy\'")']]},
-            {"range": f"{tab_name}!U2", "values": [['=TEXT(Q2;"yyyymmdd")']]},
-            {"range": f"{tab_name}!U3", "values": [['=TEXT(Q3;"yyyymmdd")']]},
-            {"range": f"{tab_name}!U4", "values": [['=TEXT(Q4;"yyyymmdd")']]},
-            {"range": f"{tab_name}!V2", "values": [['=TEXT(Q2;"yyyy-mm-dd")']]},
-            {"range": f"{tab_name}!V3", "values": [['=TEXT(Q3;"yyyy-mm-dd")']]},
-            {"range": f"{tab_name}!V4", "values": [['=TEXT(Q4;"yyyy-mm-dd")']]},
-            {"range": f"{tab_name}!W2", "values": [['=TEXT(Q2;"dd mm yyyy")']]},
-            {"range": f"{tab_name}!W3", "values": [['=IFERROR(QUERY(C6:G13;"SELECT E WHERE C MATCHES \'.*DIÁRIO DO LEGISLATIVO - EDIÇÃO EXTRA.*\'";0);"SEM EXTRA")']]},
-            {"range": f"{tab_name}!W4", "values": [['=IFERROR(TEXT(INDEX(B:B;MATCH("REQUERIMENTOS DE COMISSÕES"; C:C; 0));"dd mm yyyy");"")']]},
-            {"range": f"{tab_name}!X3", "values": [['=IFERROR(TEXT(INDEX(B:B;MATCH("REQUERIMENTOS DE COMISSÕES"; C:C; 0));"d m yyyy");"")']]},
-            {"range": f"{tab_name}!X4", "values": [['=IFERROR(TEXT(INDEX(B:B;MATCH("REQUERIMENTOS DE COMISSÕES"; C:C; 0));"dd/MM/yyyy");"")']]},
-            {"range": f"{tab_name}!Y2", "values": [["REUNIÃO"]]},
-            {"range": f"{tab_name}!Y3", "values": [["EXTRA"]]},
-            {"range": f"{tab_name}!Y4", "values": [["RQC"]]},
-        ]
+        data.extend({"range": aba + cel, "values": [[v]]} for cel, v in BLOCO_DATAS)
 
-        # EXECUTA O BLOCO PRINCIPAL
-        body = {"valueInputOption": "USER_ENTERED", "data": data}
-        _with_backoff(sh.values_batch_update, body)
+        # BLOCO PRINCIPAL: é enviado no fim, em paralelo com o batchUpdate final (ver abaixo)
+        body = {"valueInputOption": "USER_ENTERED", "data": _juntar_celulas(data)}
 
     # ====================================================================================================================================================================================================
     # ============================================================================================= TÍTULOS ==============================================================================================
     # ====================================================================================================================================================================================================
         data2 = []
-        data2.append({"range": f"{tab_name}!B8:C8", "values": [[diario, '=HYPERLINK("https://www.almg.gov.br/consulte/arquivo_diario_legislativo/index.html";"DIÁRIO DO LEGISLATIVO")']]})
+        data2.append({"range": f"{aba}B8:C8", "values": [[diario, '=HYPERLINK("https://www.almg.gov.br/consulte/arquivo_diario_legislativo/index.html";"DIÁRIO DO LEGISLATIVO")']]})
 
         if itens:
-            data2.append({"range": f"{tab_name}!B9:C{9 + len(itens) - 1}", "values": [[a, b] for a, b in itens]})
+            data2.append({"range": f"{aba}B9:C{9 + len(itens) - 1}", "values": [[a, b] for a, b in itens]})
 
         data2.append({
-            "range": f"{tab_name}!B{start_extra_row}:C{start_extra_row + len(extras_out) - 1}",
+            "range": f"{aba}B{start_extra_row}:C{start_extra_row + len(extras_out) - 1}",
             "values": extras_out
         })
 
-        ALVOS = (
-            "REQUERIMENTOS DE COMISSÃO",
-            "LANÇAMENTOS DE TRAMITAÇÃO",
-            "CADASTRO DE E-MAILS",
-        )
-
+        # uma passada só pelos extras: linhas "-" logo abaixo dos títulos de RE_ALVOS, DROPDOWN_2/DROPDOWN_8
+        # e IMPLANTAÇÃO DE TEXTOS (sempre a primeira ocorrência de cada)
         extra_rows_c_is_dash = []
-        for i, row in enumerate(extras):
-            if row[0] != "-":
-                continue
-            if i - 1 < 0:
-                continue
-
-            prev_title = extras[i - 1][1] if len(extras[i - 1]) > 1 else ""
-            if any(t in str(prev_title) for t in ALVOS):
-                extra_rows_c_is_dash.append(start_extra_row + i)
-
-        for r in extra_rows_c_is_dash:
-            data2.append({
-            "range": f"{tab_name}!E{r}:I{r}",
-            "values": [["-","-","-","-","-"]]})
-
-        # acha linha do DROPDOWN_2 (para setar D com "-")
-        dd2_row = next(
-            (start_extra_row + i for i, (_b, c) in enumerate(extras) if c == "DROPDOWN_2"),
-            None
-        )
-
+        dd2_row = dd8_row = impl_row = None
+        prev_title = None
+        for i, (b, c) in enumerate(extras):
+            r = start_extra_row + i
+            if b == "-" and prev_title is not None and RE_ALVOS.search(str(prev_title)):
+                extra_rows_c_is_dash.append(r)
+            if c == "DROPDOWN_2" and dd2_row is None:
+                dd2_row = r
+            elif c == "DROPDOWN_8" and dd8_row is None:
+                dd8_row = r
+            elif impl_row is None and isinstance(c, str) and "IMPLANTAÇÃO DE TEXTOS" in c:
+                impl_row = r
+            prev_title = c
+
+        data2.extend({"range": f"{aba}E{r}:I{r}", "values": [["-","-","-","-","-"]]} for r in extra_rows_c_is_dash)
+
+        # DROPDOWN_2 / DROPDOWN_8: seta D com "-"
         if dd2_row is not None:
             data2.append({
-                "range": f"{tab_name}!D{dd2_row}",
+                "range": f"{aba}D{dd2_row}",
                 "values": [["-"]]
             })
 
-        # acha linha do DROPDOWN_8 (para setar D com "-")
-        dd8_row = next(
-            (start_extra_row + i for i, (_b, c) in enumerate(extras) if c == "DROPDOWN_8"),
-            None
-        )
-
         if dd8_row is not None:
             data2.append({
-                "range": f"{tab_name}!D{dd8_row}",
+                "range": f"{aba}D{dd8_row}",
                 "values": [["-"]]
             })
 
         # IMPLANTAÇÃO DE TEXTOS (mantém)
-        impl_row = next(
-            (start_extra_row + i for i, (_b, c) in enumerate(extras)
-            if isinstance(c, str) and "IMPLANTAÇÃO DE TEXTOS" in c),
-            None
-        )
-
         if impl_row is not None:
-            data2.append({"range": f"{tab_name}!E{impl_row}", "values": [["..."]]})
+            data2.append({"range": f"{aba}E{impl_row}", "values": [["..."]]})
 
             # linha filha (logo abaixo)
             data2.append({
-                "range": f"{tab_name}!E{impl_row + 1}:I{impl_row + 1}",
+                "range": f"{aba}E{impl_row + 1}:I{impl_row + 1}",
                 "values": [["?","?","?","-",False]]
             })
 
             # linha do título
             data2.append({
-                "range": f"{tab_name}!E{impl_row}:G{impl_row}",
+                "range": f"{aba}E{impl_row}:G{impl_row}",
                 "values": [["TEXTOS", "EMENDAS", "PARECERES"]]
             })
 
@@ -4145,19 +3946,31 @@ def main(entrada_override=None, spreadsheet_url_or_id=None, auth_mode="colab", s
             reqs.append(req_font(sheet_id, f"C{impl_row + 1}:I{impl_row + 1}", fg_hex="#CC0000"))
             reqs.append(req_repeat_cell(sheet_id,f"C{impl_row}:C{impl_row}",{"horizontalAlignment": "LEFT"}))
 
-        body2 = {"valueInputOption": "USER_ENTERED", "data": data2}
-        _with_backoff(sh.values_batch_update, body2)
 
 
     # ====================================================================================================================================================================================================
     # ======================================================================================= CONTAGEM DINÂMICA ==========================================================================================
     # ====================================================================================================================================================================================================
+        # contagens sobre o corpo (linhas 6..footer_start-1) em vez de colunas inteiras; cada fórmula lê C/E uma
+        # vez (LET) e casa todos os padrões num REGEXMATCH só ((?i) e ^...$/^... reproduzem os critérios de
+        # COUNTIFS/SUMIFS: sem distinção de maiúsculas, texto exato ou prefixo com *); SUM ignora texto em E
+        fim_e = footer_start - 1
+        def _conta_e(padrao: str, um: str, varios: str) -> str:
+            return (f'=LET(c;C$6:C${fim_e};total;SUMPRODUCT(--REGEXMATCH(c&"";"(?i){padrao}"));'
+                    f'total & IF(total=1;" {um}";" {varios}"))')
+
+        def _soma_e(padrao: str, um: str, varios: str) -> str:
+            return (f'=LET(c;C$6:C${fim_e};e;E$6:E${fim_e};total;IFERROR(SUM(FILTER(e;REGEXMATCH(c&"";"(?i){padrao}")));0);'
+                    f'total & IF(total=1;" {um}";" {varios}"))')
+
         FORMULAS_E = [
-            '=LET(total;COUNTIFS(C:C;"ORDINÁRIA")+COUNTIFS(C:C;"EXTRAORDINÁRIA")+COUNTIFS(C:C;"ESPECIAL");total & IF(total=1;" REUNIÃO";" REUNIÕES"))',
-            '=LET(total;COUNTIFS(C:C;"COMISSÃO*")+COUNTIFS(C:C;"CIPE*");total & IF(total=1;" REUNIÃO";" REUNIÕES"))',
-            '=LET(total;SUMIFS(E:E;C:C;"RQC*");total & IF(total=1;" REQUERIMENTO";" REQUERIMENTOS"))',
-            '=LET(total;SUMIFS(E$2:E$39;C$2:C$39;"RECEBIMENTO DE PROPOSIÇÃO")+SUMIFS(E$2:E$39;C$2:C$39;"DESIGNAÇÃO DE RELATORIA")+SUMIFS(E$2:E$39;C$2:C$39;"CUMPRIMENTO DE DILIGÊNCIA")+SUMIFS(E$2:E$39;C$2:C$39;"ENTREGA DE DIPLOMA")+SUMIFS(E$2:E$39;C$2:C$39;"REUNIÃO ORIGINADA DE REQUERIMENTO")+SUMIFS(E$2:E$39;C$2:C$39;"REUNIÃO COM DEBATE DE PROPOSIÇÃO*")+SUMIFS(E$2:E$39;C$2:C$39;"AUDIÊNCIA PÚBLICA*")+SUMIFS(E$2:E$39;C$2:C$39;"REMESSA - *")+SUMIFS(E$2:E$39;C$2:C$39;"OFÍCIO - *")+SUMIFS(E$2:E$39;C$2:C$39;"PROPOSIÇÃO DE LEI ENCAMINHADA PARA SANÇÃO");total & IF(total=1;" LANÇAMENTO";" LANÇAMENTOS"))',
-            '=LET(total;SUMIFS(E:E;C:C;"PRECLUSÃO*")+SUMIFS(E:E;C:C;"CONSULTA*");total & IF(total=1;" LANÇAMENTO";" LANÇAMENTOS"))',
+            _conta_e("^(ORDINÁRIA|EXTRAORDINÁRIA|ESPECIAL)$", "REUNIÃO", "REUNIÕES"),
+            _conta_e("^(COMISSÃO|CIPE)", "REUNIÃO", "REUNIÕES"),
+            _soma_e("^RQC", "REQUERIMENTO", "REQUERIMENTOS"),
+            _soma_e("^(RECEBIMENTO DE PROPOSIÇÃO|DESIGNAÇÃO DE RELATORIA|CUMPRIMENTO DE DILIGÊNCIA|ENTREGA DE DIPLOMA"
+                    "|REUNIÃO ORIGINADA DE REQUERIMENTO|PROPOSIÇÃO DE LEI ENCAMINHADA PARA SANÇÃO)$"
+                    "|^(REUNIÃO COM DEBATE DE PROPOSIÇÃO|AUDIÊNCIA PÚBLICA|REMESSA - |OFÍCIO - )", "LANÇAMENTO", "LANÇAMENTOS"),
+            _soma_e("^(PRECLUSÃO|CONSULTA)", "LANÇAMENTO", "LANÇAMENTOS"),
         ]
 
         # linhas onde haverá contagem (as mesmas em que C tem título e você mescla E:G)
@@ -4170,30 +3983,46 @@ def main(entrada_override=None, spreadsheet_url_or_id=None, auth_mode="colab", s
             and (row[2] if len(row) > 2 else "") != "DROPDOWN_3"
             and "IMPLANTAÇÃO DE TEXTOS" not in (row[1] if len(row) > 1 else ""))]
 
-        data_extra_E = [
-            {"range": f"E{r}", "values": [[FORMULAS_E[i]]]}
-            for i, r in enumerate(extra_formula_rows[:len(FORMULAS_E)])]
+        data2.extend(
+            {"range": f"{aba}E{r}", "values": [[formula]]}
+            for formula, r in zip(FORMULAS_E, extra_formula_rows))
 
     # ====================================================================================================================================================================================================
     # ============================================================================================== CALL ================================================================================================
     # ====================================================================================================================================================================================================
 
-        _with_backoff(ws.batch_update, data_extra_E, value_input_option="USER_ENTERED")
-
-        # --- SANITIZAÇÃO FINAL: remove mergeCells com intervalo vazio ---
+        # títulos/extras e contagens numa chamada só; vai ANTES dos requests (os checkboxes do batchUpdate final
+        # gravam H/I por cima de linhas que data2 também preenche)
+        # a aba _lk (RAW) segue junto, em paralelo: não tem nenhuma célula em comum com a aba do dia
+        body2 = {"valueInputOption": "USER_ENTERED", "data": data2}
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            f_lk = ex.submit(_values_batch_update_compacto, sh, body_lk)
+            _values_batch_update_compacto(sh, body2)
+            f_lk.result()
+
+        # --- SANITIZAÇÃO FINAL + AJUSTE DE GRID numa passada só: remove mergeCells/updateBorders/setDataValidation
+        # com intervalo vazio ou incompleto e, dos que ficam, guarda até onde os ranges vão (a aba tem que caber) ---
+        VALIDA_RANGE = ("mergeCells", "updateBorders", "setDataValidation")
+        COM_RANGE = VALIDA_RANGE + ("updateCells", "repeatCell", "addConditionalFormatRule")
         reqs_ok = []
+        max_er = 0
+        max_ec = 0
         for i, r in enumerate(reqs):
-            # tenta extrair um range padrão, se existir
-            rng = None
-            for k in ("mergeCells", "updateBorders", "setDataValidation"):
-                if k in r and "range" in r[k]:
-                    rng = r[k]["range"]
-                    break
+            k = next((k for k in COM_RANGE if k in r), None)
+            rng = r[k].get("range") if k is not None else None
+            if rng is None and k == "addConditionalFormatRule":
+                # conditional format usa "ranges": [ {range}, ... ]
+                rr = r[k].get("rule", {}).get("ranges", [])
+                rng = rr[0] if rr else None
 
-            if rng is not None:
-                sr = rng.get("startRowIndex"); er = rng.get("endRowIndex")
-                sc = rng.get("startColumnIndex"); ec = rng.get("endColumnIndex")
+            if rng is None:
+                reqs_ok.append(r)
+                continue
 
+            sr = rng.get("startRowIndex"); er = rng.get("endRowIndex")
+            sc = rng.get("startColumnIndex"); ec = rng.get("endColumnIndex")
+
+            if k in VALIDA_RANGE:
                 if sr is None or er is None or sc is None or ec is None:
                     print(f"[req {i}] range incompleto -> REMOVIDO: {rng}")
                     continue
@@ -4203,44 +4032,34 @@ def main(entrada_override=None, spreadsheet_url_or_id=None, auth_mode="colab", s
                     continue
 
             reqs_ok.append(r)
-
-        reqs = reqs_ok
-
-        # --- AJUSTE DE GRID: garante que a aba tem linhas/colunas suficientes para os ranges dos requests ---
-        max_er = 0
-        max_ec = 0
-        for r in reqs:
-            rng = None
-            for k in ("mergeCells", "updateBorders", "setDataValidation", "updateCells", "repeatCell", "addConditionalFormatRule"):
-                if k in r:
-                    if "range" in r[k]:
-                        rng = r[k]["range"]
-                        break
-                    # conditional format usa "ranges": [ {range}, ... ]
-                    if k == "addConditionalFormatRule":
-                        rr = r[k].get("rule", {}).get("ranges", [])
-                        if rr:
-                            rng = rr[0]
-                            break
-
-            if rng is None:
-                continue
-
-            er = rng.get("endRowIndex")
-            ec = rng.get("endColumnIndex")
             if isinstance(er, int) and er > max_er:
                 max_er = er
             if isinstance(ec, int) and ec > max_ec:
                 max_ec = ec
 
-        # endRowIndex/endColumnIndex são EXCLUSIVOS (0-based)
-        need_rows = max_er
-        need_cols = max(ws  .col_count, max_ec)
+        reqs = _juntar_validacoes(reqs_ok)
 
-        if need_rows > ws.row_count  or need_cols > ws.col_count:
-            ws.resize(rows=need_rows, cols=need_cols)
-
-        _with_backoff(sh.batch_update, body={"requests": reqs})
+        # endRowIndex/endColumnIndex são EXCLUSIVOS (0-based)
+        need_rows = max(ws.row_count, max_er)
+        need_cols = max(ws.col_count, max_ec)
+
+        if need_rows > ws.row_count or need_cols > ws.col_count:
+            # o grid cresce como 1º request do próprio batchUpdate (sem um resize à parte); como os valores
+            # podem cair nas linhas/colunas novas, aqui eles vão depois, e não em paralelo
+            reqs.insert(0, {"updateSheetProperties": {
+                "properties": {"sheetId": sheet_id, "gridProperties": {"rowCount": need_rows, "columnCount": need_cols}},
+                "fields": "gridProperties.rowCount,gridProperties.columnCount"}})
+            _batch_update_compacto(sh, reqs)
+            _values_batch_update_compacto(sh, body)
+            return {"url": sh.url,"aba": ws.title,"gid": sheet_id}
+
+        # os valores do bloco principal não caem em nenhuma célula que os requests reescrevem
+        # (cabeçalho/âncoras de merge, P:S do corpo, DATAS) -> os dois envios podem ir juntos
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            f_vals = ex.submit(_values_batch_update_compacto, sh, body)
+            f_reqs = ex.submit(_batch_update_compacto, sh, reqs)  # backoff por lote, lá dentro
+            f_vals.result()
+            f_reqs.result()
 
         return {"url": sh.url,"aba": ws.title,"gid": sheet_id}
 